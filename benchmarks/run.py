@@ -0,0 +1,683 @@
+import argparse
+import errno
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baselines.json')
+RESULTS_FILE = os.path.join(BENCH_DIR, 'results.json')
+
+sys.path.insert(0, ROOT)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+CASES = []
+
+
+def case(func):
+    CASES.append(func)
+    return func
+
+
+def measure(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples):
+    return {
+        'median_ms': round(statistics.median(samples), 4),
+        'min_ms': round(min(samples), 4),
+        'max_ms': round(max(samples), 4),
+        'runs': len(samples),
+    }
+
+
+class Context:
+    def __init__(self, app, server, repeat):
+        self.app = app
+        self.server = server
+        self.repeat = repeat
+        self.launcher = None
+
+    def get_launcher(self):
+        from core.launcher import Launcher
+        if self.launcher is None:
+            self.launcher = Launcher()
+            self.app.processEvents()
+        return self.launcher
+
+
+def ensure_config():
+    """Provides a stand-in for the untracked config module"""
+    try:
+        import config  # noqa: F401
+    except ImportError:
+        config = types.ModuleType('config')
+        config.GITHUB_TOKEN = 'benchmark'
+        config.REPO = 'eternityglow/launcher'
+        config.CURRENT_VERSION = 'v0.0.0-benchmark'
+        sys.modules['config'] = config
+    return sys.modules['config']
+
+
+@case
+def launcher_construction(ctx):
+    from core.launcher import Launcher
+
+    def construct():
+        window = Launcher()
+        ctx.app.processEvents()
+        window.close()
+        window.deleteLater()
+
+    return {'launcher_construction': measure(construct, ctx.repeat)}
+
+
+@case
+def settings_dialog(ctx):
+    launcher = ctx.get_launcher()
+    open_samples, accept_samples = [], []
+    for _ in range(ctx.repeat):
+        start = time.perf_counter()
+        dialog = launcher.get_settings_dialog()
+        dialog.show()
+        ctx.app.processEvents()
+        open_samples.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        dialog.accept()
+        ctx.app.processEvents()
+        accept_samples.append((time.perf_counter() - start) * 1000)
+    return {'settings_dialog_open': open_samples, 'settings_dialog_accept': accept_samples}
+
+
+@case
+def set_background(ctx):
+    launcher = ctx.get_launcher()
+    launcher.showNormal()
+    results = {}
+    for width, height in [(1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]:
+        launcher.resize(width, height)
+        ctx.app.processEvents()
+        results[f"set_background_{width}x{height}"] = measure(launcher.set_background, ctx.repeat)
+    return results
+
+
+@case
+def tablet_calculator(ctx):
+    from PyQt6.QtCore import QPoint
+    from PyQt6.QtGui import QImage
+    from core.tablet_calculator import TabletAreaCalculator
+
+    calculator = TabletAreaCalculator()
+    calculator.resize(800, 500)
+    image = QImage(calculator.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    rng = random.Random(1234)
+    results = {}
+    for count in (1_000, 10_000, 100_000):
+        calculator.points = [QPoint(rng.randrange(800), rng.randrange(500)) for _ in range(count)]
+        results[f"tablet_calculate_area_{count}"] = measure(calculator.calculate_area, ctx.repeat)
+        results[f"tablet_paint_{count}"] = measure(lambda: calculator.render(image), ctx.repeat)
+    calculator.deleteLater()
+    return results
+
+
+@case
+def settings_save(ctx):
+    launcher = ctx.get_launcher()
+    batch = 100
+
+    def save_batch():
+        for _ in range(batch):
+            launcher.save_settings()
+
+    samples = measure(save_batch, ctx.repeat)
+    return {'settings_save': [sample / batch for sample in samples]}
+
+
+@case
+def scheduler_dispatch(ctx):
+    from core.scheduler import Scheduler
+    scheduler = Scheduler()
+    jobs = 100
+    delivered = []
+
+    def on_result(value):
+        # Ein Callback, der wirft, darf die restlichen Jobs nicht aufhalten
+        if value == 0:
+            raise ValueError("benchmark callback failure")
+        delivered.append(value)
+
+    def make_async(value):
+        async def fetch():
+            return value
+        return fetch
+
+    def dispatch(make_func):
+        delivered.clear()
+        for i in range(jobs):
+            scheduler.once(f"bench.{i}", 0, make_func(i), on_result=on_result)
+        deadline = time.monotonic() + 10
+        while scheduler.jobs and time.monotonic() < deadline:
+            ctx.app.processEvents()
+        assert sorted(delivered) == list(range(1, jobs)), f"{len(delivered)} of {jobs - 1} results delivered"
+
+    results = {
+        'scheduler_dispatch_sync': measure(lambda: dispatch(lambda i: lambda: i), ctx.repeat),
+        'scheduler_dispatch_async': measure(lambda: dispatch(make_async), ctx.repeat),
+    }
+    assert scheduler.stats()['jobs']['bench.0']['failures'] == 2 * ctx.repeat
+    scheduler.shutdown()
+    return {name: [sample / jobs for sample in samples] for name, samples in results.items()}
+
+
+@case
+def player_count_fetch(ctx):
+    from core.threads import PlayerCountThread
+    thread = PlayerCountThread(f"{ctx.server.url}/api/player_count")
+    return {'player_count_fetch': measure(thread.fetch_player_count, ctx.repeat)}
+
+
+@case
+def leaderboard(ctx):
+    from core.leaderboard import LeaderboardClient, LeaderboardPage, PAGE_SIZE
+    from benchmarks.standins import LEADERBOARD_PLAYERS
+    # ttl=0: erster Abruf lädt die Seite, jeder weitere fragt nur per ETag nach (304)
+    client = LeaderboardClient(ctx.server.url, ttl=0)
+    results = {
+        'leaderboard_page_fetch': measure(lambda: client.get_page(0, 0), 1),
+        'leaderboard_page_revalidate': measure(lambda: client.get_page(0, 0), ctx.repeat),
+    }
+    client.ttl = 3600
+    results['leaderboard_page_cached'] = measure(lambda: client.get_page(0, 0), ctx.repeat)
+
+    page = LeaderboardPage(client)
+    page.resize(1280, 720)
+    page.show()
+    model = page.model
+
+    def fill():
+        for offset in range(0, LEADERBOARD_PLAYERS, PAGE_SIZE):
+            model.append_page(0, offset, client.get_page(0, offset))
+    results['leaderboard_fill_100k'] = measure(fill, 1)
+
+    bar = page.view.verticalScrollBar()
+
+    def scroll():
+        for step in range(0, 101):
+            bar.setValue(bar.maximum() * step // 100)
+            page.view.viewport().repaint()
+    samples = measure(scroll, ctx.repeat)
+    results['leaderboard_scroll_frame'] = [sample / 101 for sample in samples]
+
+    model.append_page(1, 0, client.get_page(1, 0))
+
+    def switch_mode():
+        model.set_mode(1)
+        model.set_mode(0)
+    results['leaderboard_mode_switch_cached'] = measure(switch_mode, ctx.repeat)
+
+    def wait_for(condition):
+        deadline = time.monotonic() + 10
+        while not condition() and time.monotonic() < deadline:
+            ctx.app.processEvents()
+
+    # Nach refresh() wird nur die erste Seite neu validiert, alle weiteren kommen aus dem Cache
+    before = dict(client.stats)
+    model.refresh()
+    wait_for(lambda: model.loading is None and model.rows)
+    model.fetchMore()
+    wait_for(lambda: model.loading is None and len(model.rows) >= 2 * PAGE_SIZE)
+    assert client.stats['revalidated'] == before['revalidated'] + 1, client.stats
+    assert client.stats['fresh'] > before['fresh'] and client.stats['fetched'] == before['fetched'], client.stats
+    page.close()
+    page.deleteLater()
+    return results
+
+
+@case
+def wiki_mirror(ctx):
+    from core.wiki import WikiMirror
+    from benchmarks.standins import install_wiki_routes
+    install_wiki_routes(ctx.server)
+    mirror = WikiMirror(tempfile.mkdtemp(prefix='wiki-', dir=os.getcwd()))
+    start_url = f"{ctx.server.url}/de/home"
+    queries = ['tablet', 'skin replay', 'unique42', 'storyboard hitsound offset', 'nothingmatches']
+    return {
+        'wiki_sync_cold': measure(lambda: mirror.sync(start_url), 1),
+        'wiki_sync_unchanged': measure(lambda: mirror.sync(start_url), ctx.repeat),
+        'wiki_search': [sample / len(queries) for sample in
+                        measure(lambda: [mirror.search(query) for query in queries], ctx.repeat)],
+    }
+
+
+@case
+def beatmap_downloads(ctx):
+    from core.downloads import DownloadManager
+    from benchmarks.standins import install_beatmap_mirror
+    size = 256 * 1024
+    template = install_beatmap_mirror(ctx.server, count=500, size=size)
+    results = {}
+
+    def run(name, set_ids, **options):
+        songs = tempfile.mkdtemp(prefix='songs-', dir=os.getcwd())
+        manager = DownloadManager(songs, url_template=template, **options)
+        start = time.perf_counter()
+        manager.enqueue(set_ids)
+        manager.pool.shutdown(wait=True)
+        elapsed = time.perf_counter() - start
+        results[name] = [elapsed * 1000]
+        results[f"{name}_mb_per_s"] = [manager.stats()['bytes'] / elapsed / 1024 / 1024]
+        return manager
+
+    # Ein komplettes Pack mit 500 Maps, unbegrenzt und mit Drossel für laufendes Spiel
+    run('downloads_pack_500', range(1, 501))
+    throttled = run('downloads_game_throttled', range(1, 41), rate=4 * 1024 * 1024)
+    assert throttled.stats()['states'] == {'done': 40}
+
+    # Cache und Songs auf verschiedenen Laufwerken: os.replace aus dem Cache scheitert mit EXDEV
+    real_replace = os.replace
+
+    def cross_device_replace(src, dst):
+        if str(src).endswith('.part'):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV), src, None, dst)
+        return real_replace(src, dst)
+
+    os.replace = cross_device_replace
+    try:
+        cross = run('downloads_cross_device', range(1, 11))
+    finally:
+        os.replace = real_replace
+    assert cross.stats()['states'] == {'done': 10}, cross.stats()
+    assert sorted(os.listdir(cross.songs_dir)) == sorted(f"{i}.osz" for i in range(1, 11))
+    assert all(os.path.getsize(os.path.join(cross.songs_dir, f"{i}.osz")) == size for i in range(1, 11))
+    return results
+
+
+@case
+def launch_pipeline(ctx):
+    from core.launch_pipeline import LaunchPipeline, build_launch_stages
+    # Stand-in für osu!.exe: beendet sich sofort, die Datenbanken werden nur vorgewärmt
+    install = tempfile.mkdtemp(prefix='osu-', dir=os.getcwd())
+    exe = os.path.join(install, 'osu!.exe')
+    with open(exe, 'w') as f:
+        f.write('#!/bin/sh\nexit 0\n')
+    os.chmod(exe, 0o755)
+    with open(os.path.join(install, 'osu!.db'), 'wb') as f:
+        f.write(os.urandom(32 * 1024 * 1024))
+
+    spawn_samples, sum_samples = [], []
+    for _ in range(ctx.repeat):
+        stages = build_launch_stages({'osu': {'path': exe}}, '127.0.0.1', on_presence=lambda status: None)
+        report = LaunchPipeline(stages).run()
+        assert report['stages']['spawn']['status'] == 'ok', report
+        spawn_samples.append(report['spawn_ms'])
+        sum_samples.append(report['sum_ms'])
+    return {'launch_play_to_spawn': spawn_samples, 'launch_stage_sum': sum_samples}
+
+
+@case
+def integrity_verify(ctx):
+    from core import integrity
+    # Synthetische Installation mit ~300 MB Spieldateien: vier große Dateien über
+    # POOL_THRESHOLD_BYTES, 40 kleinere DLLs und osu!.exe, damit der Prozess-Pool greift.
+    # Songs wird übersprungen und darf nicht mitgehasht werden.
+    install = tempfile.mkdtemp(prefix='osu-', dir=os.getcwd())
+    payload = {'osu!.exe': 4, 'osu!.db': 64, 'osu!gameplay.dll': 64, 'osu!ui.dll': 64, 'bass_fx.dll': 64}
+    payload.update({f"lib{number:02d}.dll": 1 for number in range(40)})
+    for name, megabytes in payload.items():
+        with open(os.path.join(install, name), 'wb') as f:
+            f.write(os.urandom(megabytes * 1024 * 1024))
+    for number in range(20):
+        directory = os.path.join(install, 'Songs', f"{number} Artist - Title")
+        os.makedirs(directory)
+        with open(os.path.join(directory, 'audio.mp3'), 'wb') as f:
+            f.write(os.urandom(1024 * 1024))
+    game_bytes = sum(payload.values()) * 1024 * 1024
+    assert max(payload.values()) * 1024 * 1024 > integrity.POOL_THRESHOLD_BYTES
+
+    cold, repeat, full = [], [], []
+    for _ in range(ctx.repeat):
+        try:
+            os.remove(integrity.manifest_path(install))
+        except FileNotFoundError:
+            pass
+        report = integrity.verify(install)
+        assert report.hashed_bytes == game_bytes, report.summary()
+        cold.append(report.elapsed_ms)
+        report = integrity.verify(install)
+        assert report.ok and report.hashed_files == 0, report.summary()
+        repeat.append(report.elapsed_ms)
+        full.append(integrity.verify(install, full=True).elapsed_ms)
+    return {'integrity_cold': cold, 'integrity_repeat': repeat, 'integrity_full': full}
+
+
+def write_replay(path, player, score, lifebar=4000, frames=200 * 1024):
+    """Synthetisches .osr: echter Kopf, Lebensbalken und Replaydaten als Füllung"""
+    def field(text):
+        data, length, prefix = text.encode('utf-8'), len(text), b''
+        while True:
+            byte, length = length & 0x7f, length >> 7
+            prefix += bytes([byte | (0x80 if length else 0)])
+            if not length:
+                return b'\x0b' + prefix + data
+    ticks = int((time.time() + 62135596800) * 10_000_000)
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<Bi', 0, 20240101) + field('0' * 32) + field(player) + field('1' * 32))
+        f.write(struct.pack('<6HiHBi', 900, 40, 3, 120, 20, 2, score, 1200, 0, 72))
+        f.write(field('0|1,' * (lifebar // 4)) + struct.pack('<qi', ticks, frames))
+        f.write(os.urandom(frames) + struct.pack('<q', 0))
+
+
+@case
+def replay_index(ctx):
+    from core.replays import ReplayIndex, ReplayWatcher, watched_dirs
+    install = tempfile.mkdtemp(prefix='osu-', dir=os.getcwd())
+    replays = os.path.join(install, 'Data', 'r')
+    os.makedirs(replays)
+    for number in range(500):
+        write_replay(os.path.join(replays, f"{number:04d}.osr"), 'player', number * 1000)
+
+    cold, warm, latency = [], [], []
+    for run in range(ctx.repeat):
+        index = ReplayIndex(os.path.join(install, f"index-{run}.sqlite"))
+        started = time.perf_counter()
+        index.reconcile(watched_dirs(install))
+        cold.append((time.perf_counter() - started) * 1000)
+        assert index.stats['header_bytes'] / index.stats['indexed'] <= 1024, index.stats
+        started = time.perf_counter()
+        index.reconcile(watched_dirs(install))
+        warm.append((time.perf_counter() - started) * 1000)
+
+        changed = threading.Event()
+        watcher = ReplayWatcher(install, index, on_change=changed.set)
+        if watcher.kind != 'inotify':
+            continue
+        watcher.backend.start()
+        started = time.perf_counter()
+        write_replay(os.path.join(replays, f"new-{run}.osr"), 'new', 1)
+        assert changed.wait(5), "watcher did not report the new replay"
+        latency.append((time.perf_counter() - started) * 1000)
+        watcher.stop()
+    results = {'replay_index_cold': cold, 'replay_index_warm': warm}
+    if latency:
+        results['replay_watch_latency'] = latency
+    return results
+
+
+@case
+def session_telemetry(ctx):
+    import subprocess
+    from core.telemetry import SessionSampler, Sample, summarize, CAPACITY
+    # Stand-in für osu!: halb ausgelastet, wie ein Spiel mit Frame-Limiter
+    busy = ("import time\nend = time.time() + 3\nwhile time.time() < end:\n"
+            "    t = time.time()\n    while time.time() - t < 0.004: pass\n    time.sleep(0.004)\n")
+    per_sample, summary = [], []
+    for _ in range(ctx.repeat):
+        game = subprocess.Popen([sys.executable, '-c', busy])
+        sampler = SessionSampler(game.pid)
+        sampler.start()
+        game.wait()
+        sampler.stop()
+        assert sampler.overhead_percent() <= sampler.cpu_budget_percent, sampler.summary()
+        per_sample.append(sampler.self_cpu * 1000 / max(len(sampler.samples), 1))
+
+        # Voller Ringpuffer: so teuer wird die Zusammenfassung nach einer langen Sitzung
+        samples = [Sample(i * 2.0, i * 2.0, i * 0.5, 300 << 20, i << 20, i << 16, 40, i * 50, i * 5)
+                   for i in range(CAPACITY)]
+        started = time.perf_counter()
+        summarize(samples)
+        summary.append((time.perf_counter() - started) * 1000)
+    return {'telemetry_sample_cpu': per_sample, 'telemetry_summary': summary}
+
+
+@case
+def widget_drag(ctx):
+    from PyQt6.QtCore import Qt, QEvent, QPoint, QPointF
+    from PyQt6.QtGui import QMouseEvent
+    from PyQt6.QtWidgets import QApplication
+
+    def mouse(kind, widget, pos, button=Qt.MouseButton.LeftButton):
+        return QMouseEvent(kind, QPointF(widget.mapFromGlobal(pos)), QPointF(pos), button,
+                           Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+
+    launcher = ctx.get_launcher()
+    launcher.showNormal()
+    sidebar = launcher.sidebar
+    results = {}
+    # 60 Frames mit je 16 Mausbewegungen: eine Sekunde Ziehen mit einer 1-kHz-Maus
+    for width, height in [(1920, 1080), (3840, 2160)]:
+        launcher.resize(width, height)
+        ctx.app.processEvents()
+        samples = []
+        for _ in range(ctx.repeat):
+            # Auf den Rand der Sidebar, nicht auf einen Button
+            start_pos = sidebar.mapToGlobal(QPoint(4, 4))
+            started = time.perf_counter()
+            QApplication.sendEvent(sidebar, mouse(QEvent.Type.MouseButtonPress, sidebar, start_pos))
+            proxy = sidebar.proxy
+            for frame in range(60):
+                for step in range(16):
+                    pos = start_pos - QPoint(frame * 8 + step // 2, frame * 4)
+                    QApplication.sendEvent(proxy, mouse(QEvent.Type.MouseMove, proxy, pos, Qt.MouseButton.NoButton))
+                proxy.apply_pending()
+                launcher.main_page.repaint()
+            QApplication.sendEvent(proxy, mouse(QEvent.Type.MouseButtonRelease, proxy, start_pos))
+            ctx.app.processEvents()
+            samples.append((time.perf_counter() - started) * 1000 / 60)
+            assert sidebar.last_drag['frames'] <= 60 < sidebar.last_drag['mouse_moves'], sidebar.last_drag
+        results[f"widget_drag_frame_{width}x{height}"] = samples
+    launcher.floating.load({})
+    return results
+
+
+@case
+def plugin_discovery(ctx):
+    from core.plugins import PluginManager
+    results = {}
+    for count in (10, 100):
+        directory = tempfile.mkdtemp(prefix='plugins-', dir=os.getcwd())
+        for number in range(count):
+            plugin = os.path.join(directory, f"plugin_{number}")
+            os.makedirs(plugin)
+            with open(os.path.join(plugin, 'plugin.json'), 'w') as f:
+                json.dump({'name': f"Plugin {number}", 'entry': 'main:activate'}, f)
+            with open(os.path.join(plugin, 'main.py'), 'w') as f:
+                f.write("import email.mime.multipart\n\ndef activate(launcher):\n    return None\n")
+        samples = []
+        for _ in range(ctx.repeat):
+            manager = PluginManager([directory], group='eternityglow.benchmark')
+            started = time.perf_counter()
+            manifests = manager.discover()
+            samples.append((time.perf_counter() - started) * 1000)
+            assert len(manifests) == count
+        results[f"plugins_discover_{count}"] = samples
+    # Erster Klick: Import plus Aufruf eines Plugins, jedes Mal ein anderes (kalter Import)
+    load = []
+    for number in range(ctx.repeat):
+        started = time.perf_counter()
+        manager.activate(f"plugin_{number}", None)
+        load.append((time.perf_counter() - started) * 1000)
+    results['plugin_first_load'] = load
+    return results
+
+
+@case
+def game_state(ctx):
+    from benchmarks.standins import GameProcessStandin
+    from core.game_state import GameStateReader
+    from utils.helpers import cache_path
+    # Der Stand-in bildet /proc/<pid>/mem nach; unter Windows/macOS gibt es ihn nicht
+    if not sys.platform.startswith('linux'):
+        return {}
+    game = GameProcessStandin().start()
+    exe = os.path.join(ROOT, 'main.py')
+    cold, cached, poll = [], [], []
+    try:
+        for _ in range(ctx.repeat):
+            shutil.rmtree(os.path.dirname(cache_path('gamestate', 'builds.json')), ignore_errors=True)
+            for samples in (cold, cached):
+                reader = GameStateReader(game.pid, exe)
+                started = time.perf_counter()
+                assert reader.attach()
+                samples.append((time.perf_counter() - started) * 1000)
+                assert reader.cached == (samples is cached)
+                reader.close()
+
+        reader = GameStateReader(game.pid, exe)
+        reader.attach()
+        game.command('status', 2)
+        game.command('mods', 72)
+        game.command('map', 75, 'xi - FREEDOM DiVE [FOUR DIMENSIONS]')
+        state = reader.poll()
+        assert state.beatmap_id == 75 and state.mods == 72, state
+        # Ruhezustand: gleiche Beatmap, nur Status, Mods und Beatmap-Zeiger werden gelesen
+        for _ in range(ctx.repeat):
+            started = time.perf_counter()
+            for _ in range(100):
+                reader.poll()
+            poll.append((time.perf_counter() - started) * 10)
+        reader.close()
+    finally:
+        game.stop()
+    return {'gamestate_cold_scan': cold, 'gamestate_cached_attach': cached, 'gamestate_poll': poll}
+
+
+def compare(results, baselines, tolerance, floor_ms):
+    regressions = []
+    for name, base in baselines.get('cases', {}).items():
+        current = results.get(name)
+        if current is None:
+            continue
+        allowed = base.get('tolerance', baselines.get('tolerance', tolerance))
+        limit = base['median_ms'] * (1 + allowed) + floor_ms
+        if current['median_ms'] > limit:
+            regressions.append((name, base['median_ms'], current['median_ms'], limit))
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Headless launcher benchmarks")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--filter', default='', help="only run cases whose name contains this text")
+    parser.add_argument('--output', default=RESULTS_FILE)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed relative slowdown against the baseline median")
+    parser.add_argument('--floor-ms', type=float, default=0.5,
+                        help="absolute slack added to every limit to absorb timer noise")
+    parser.add_argument('--skip-import-budget', action='store_true',
+                        help="don't check the cold import time against benchmarks/import_budget.json")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+
+    # Keep every request local: anything not aimed at the stand-ins hits a dead proxy
+    os.environ['HTTP_PROXY'] = os.environ['HTTPS_PROXY'] = 'http://127.0.0.1:9'
+    os.environ['NO_PROXY'] = '127.0.0.1,localhost'
+
+    from benchmarks.standins import StandinServer, FakeDiscordIPC, install_default_routes
+    config = ensure_config()
+    server = StandinServer().start()
+    install_default_routes(server, config.REPO, config.CURRENT_VERSION)
+    os.environ['ETERNITYGLOW_GITHUB_API'] = server.url
+    ipc = FakeDiscordIPC().start()
+
+    workdir = tempfile.mkdtemp(prefix='eternityglow-bench-')
+    os.chdir(workdir)
+    # Caches des echten Launchers nicht anfassen
+    os.environ['ETERNITYGLOW_CACHE_DIR'] = os.path.join(workdir, 'cache')
+
+    # Erst messen, solange core.launcher in diesem Prozess noch nicht geladen ist
+    import_problems = []
+    if not args.skip_import_budget and not args.filter:
+        from tools.importtime_report import BUDGET_FILE, check
+        with open(BUDGET_FILE) as f:
+            budget = json.load(f)
+        import_ms, _, import_problems = check(budget)
+        print(f"{'import_' + budget['module']:40s} {import_ms:10.3f} ms  (budget {budget['budget_ms']} ms)")
+
+    from PyQt6.QtCore import Qt, QCoreApplication
+    from PyQt6.QtWidgets import QApplication
+    # QtWebEngine wird erst beim ersten Web-Tab geladen
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    app = QApplication([sys.argv[0]])
+    ctx = Context(app, server, args.repeat)
+
+    results = {}
+    try:
+        for func in CASES:
+            if args.filter and args.filter not in func.__name__:
+                continue
+            for name, samples in func(ctx).items():
+                results[name] = summarize(samples)
+                print(f"{name:40s} {results[name]['median_ms']:10.3f} ms")
+    finally:
+        if ctx.launcher is not None:
+            ctx.launcher.close()
+        server.stop()
+        if ipc:
+            ipc.stop()
+        os.chdir(ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'qt_platform': os.environ['QT_QPA_PLATFORM'],
+            'repeat': args.repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+
+    for problem in import_problems:
+        print(f"OVER BUDGET {problem}")
+
+    if args.update_baseline:
+        baselines = {'tolerance': args.tolerance,
+                     'cases': {name: {'median_ms': r['median_ms']} for name, r in results.items()}}
+        with open(args.baseline, 'w') as f:
+            json.dump(baselines, f, indent=4)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    # A check without anything to check against must not pass silently
+    if not os.path.exists(args.baseline):
+        print(f"NO BASELINE at {args.baseline}, run with --update-baseline to record one")
+        return 1
+
+    with open(args.baseline) as f:
+        baselines = json.load(f)
+    missing = sorted(set(results) - set(baselines.get('cases', {})))
+    for name in missing:
+        print(f"NO BASELINE {name}: run with --update-baseline to record it")
+    regressions = compare(results, baselines, args.tolerance, args.floor_ms)
+    for name, base, current, limit in regressions:
+        print(f"REGRESSION {name}: {current:.3f} ms (baseline {base:.3f} ms, limit {limit:.3f} ms)")
+    return 1 if regressions or missing or import_problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,327 @@
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+def json_response(payload, status=200, headers=None):
+    body = json.dumps(payload).encode('utf-8')
+    return status, {'Content-Type': 'application/json', **(headers or {})}, body
+
+
+class _StandinHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self._dispatch()
+
+    def do_HEAD(self):
+        self._dispatch(send_body=False)
+
+    def _dispatch(self, send_body=True):
+        parts = urlsplit(self.path)
+        handler = self.server.routes.get(parts.path)
+        if handler is None:
+            status, headers, body = 404, {}, b''
+        else:
+            self.query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+            status, headers, body = handler(self)
+        self.server.hits[parts.path] = self.server.hits.get(parts.path, 0) + 1
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandinServer:
+    """Local HTTP server replacing GitHub and the EternityGlow APIs during benchmarks"""
+
+    def __init__(self):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), _StandinHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.routes = {}
+        self.httpd.hits = {}
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def hits(self):
+        return self.httpd.hits
+
+    def route(self, path, handler):
+        self.httpd.routes[path] = handler
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def install_default_routes(server, repo, version):
+    server.route(f"/repos/{repo}/releases/latest", lambda request: json_response({
+        'tag_name': version,
+        'assets': [{'browser_download_url': f"{server.url}/download/launcher.exe"}],
+    }))
+    server.route('/api/player_count', lambda request: json_response({'count': 42}))
+    server.route('/v1/get_leaderboard', leaderboard_route)
+
+
+WIKI_WORDS = ("beatmap", "skin", "replay", "tablet", "ranking", "mods", "multiplayer", "offset",
+              "storyboard", "hitsound", "server", "discord", "account", "leaderboard", "performance")
+
+
+def install_wiki_routes(server, pages=500):
+    """Wiki.js-like site: /de/home links to every page, each page links to its neighbours"""
+    def page(index):
+        words = ' '.join(WIKI_WORDS[(index * 7 + i) % len(WIKI_WORDS)] for i in range(200))
+        links = ''.join(f'<a href="/de/page-{n % pages}">page {n % pages}</a>' for n in (index + 1, index + 2))
+        return (f"<html><head><title>Page {index}</title><script>var x = 1;</script></head><body>"
+                f"<template slot=\"contents\"><p>{words} unique{index}</p>{links}</template>"
+                f"</body></html>").encode('utf-8')
+
+    def handler(body):
+        etag = f'"{hash(body) & 0xffffffff:x}"'
+
+        def respond(request):
+            if request.headers.get('If-None-Match') == etag:
+                return 304, {'ETag': etag}, b''
+            return 200, {'Content-Type': 'text/html; charset=utf-8', 'ETag': etag}, body
+        return respond
+
+    home = ''.join(f'<a href="/de/page-{i}">{i}</a>' for i in range(pages))
+    server.route('/de/home', handler(f"<html><head><title>Home</title></head><body>{home}</body></html>".encode()))
+    for index in range(pages):
+        server.route(f"/de/page-{index}", handler(page(index)))
+
+
+def install_beatmap_mirror(server, count=500, size=256 * 1024):
+    """/d/<set_id> serving deterministic .osz stand-ins, with Range/If-Range like a real mirror"""
+    def handler(set_id):
+        body = (f"osz{set_id:08d}".encode() * (size // 11 + 1))[:size]
+        etag = f'"osz-{set_id}"'
+
+        def respond(request):
+            headers = {'Content-Type': 'application/x-osu-beatmap-archive', 'ETag': etag, 'Accept-Ranges': 'bytes'}
+            requested = request.headers.get('Range', '')
+            if requested.startswith('bytes=') and request.headers.get('If-Range', etag) == etag:
+                start = int(requested[6:].split('-')[0])
+                headers['Content-Range'] = f"bytes {start}-{size - 1}/{size}"
+                return 206, headers, body[start:]
+            return 200, headers, body
+        return respond
+
+    for set_id in range(1, count + 1):
+        server.route(f"/d/{set_id}", handler(set_id))
+    return f"{server.url}/d/{{set_id}}"
+
+
+LEADERBOARD_PLAYERS = 100_000
+
+
+def leaderboard_route(request):
+    """bancho.py-style /v1/get_leaderboard with deterministic players and ETag support"""
+    mode = int(request.query.get('mode', 0))
+    limit = min(int(request.query.get('limit', 50)), 100)
+    offset = int(request.query.get('offset', 0))
+    etag = f'"{mode}-{offset}-{limit}"'
+    if request.headers.get('If-None-Match') == etag:
+        return 304, {'ETag': etag}, b''
+    rows = [{
+        'player_id': rank + 3,
+        'name': f"player{rank}",
+        'country': 'de',
+        'pp': max(LEADERBOARD_PLAYERS - rank, 0) // (mode + 1),
+        'acc': 90 + (rank % 1000) / 100,
+        'plays': rank * 7 % 10_000,
+    } for rank in range(offset, min(offset + limit, LEADERBOARD_PLAYERS))]
+    return json_response({'status': 'success', 'leaderboard': rows}, headers={'ETag': etag})
+
+
+class FakeDiscordIPC:
+    """Answers the Discord IPC handshake and activity updates on a local Unix socket"""
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp(prefix='discord-ipc-')
+        self.path = os.path.join(self.directory, 'discord-ipc-0')
+        self.sock = None
+        self.frames = 0
+
+    def start(self):
+        if not hasattr(socket, 'AF_UNIX'):
+            return None
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(self.path)
+        self.sock.listen(4)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        # pypresence searches these locations for discord-ipc-N
+        os.environ['XDG_RUNTIME_DIR'] = self.directory
+        os.environ['TMPDIR'] = self.directory
+        return self
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _read_exact(self, conn, size):
+        data = b''
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError
+            data += chunk
+        return data
+
+    def _send(self, conn, op, payload):
+        body = json.dumps(payload).encode('utf-8')
+        conn.sendall(struct.pack('<II', op, len(body)) + body)
+
+    def _serve(self, conn):
+        try:
+            while True:
+                op, length = struct.unpack('<II', self._read_exact(conn, 8))
+                payload = json.loads(self._read_exact(conn, length) or b'{}')
+                self.frames += 1
+                if op == 0:
+                    self._send(conn, 1, {
+                        'cmd': 'DISPATCH', 'evt': 'READY', 'nonce': None,
+                        'data': {'v': 1, 'user': {'id': '0', 'username': 'benchmark'}},
+                    })
+                elif op == 1:
+                    self._send(conn, 1, {
+                        'cmd': payload.get('cmd'), 'evt': None,
+                        'nonce': payload.get('nonce'), 'data': {},
+                    })
+                else:
+                    return
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            conn.close()
+
+    def stop(self):
+        if self.sock:
+            self.sock.close()
+            os.unlink(self.path)
+
+
+GAME_STANDIN_SIZE = 32 * 1024 * 1024
+
+
+def _game_standin_main(size):
+    """Kindprozess: bildet die Speicherstruktur aus core.game_state unterhalb von 4 GB nach"""
+    import ctypes
+    from core.game_state import SIGNATURES, VARIABLES, BEATMAP_ID, BEATMAP_TITLE
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.mmap.restype = ctypes.c_void_p
+    libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_long]
+    # PROT_READ|WRITE|EXEC wie JIT-Code; MAP_PRIVATE|MAP_ANONYMOUS|MAP_FIXED_NOREPLACE für 32-Bit-Zeiger
+    base = None
+    for hint in range(0x10000000, 0xF0000000, 0x10000000):
+        address = libc.mmap(hint, size, 0x7, 0x02 | 0x20 | 0x100000, -1, 0)
+        if address == hint:
+            base = address
+            break
+    if base is None:
+        raise SystemExit("no free address range below 4 GB")
+    ctypes.memmove(base, os.urandom(size), size)
+
+    def write(address, data):
+        ctypes.memmove(address, data, len(data))
+
+    def u32(address, value, fmt='<I'):
+        write(address, struct.pack(fmt, value))
+
+    # Signaturen am Ende, damit der Scan den ganzen Bereich durchläuft
+    code = base + size - 0x10000
+    data = base + size - 0x8000
+    signatures = {}
+    for i, signature in enumerate(SIGNATURES):
+        address = code + 0x100 * (i + 1)
+        write(address, bytes(0x90 if token == '??' else int(token, 16) for token in signature.pattern.split()))
+        signatures[signature.name] = address
+    variables = {}
+    for i, (name, (signature, offsets)) in enumerate(VARIABLES.items()):
+        variables[name] = data + 0x10 * i
+        u32(signatures[signature] + offsets[0], variables[name] - offsets[1])
+        u32(variables[name], 0)
+
+    slot = 0
+    print(f"ready {base:#x}", flush=True)
+    for line in sys.stdin:
+        command, *args = line.split(None, 2)
+        if command in ('status', 'mods'):
+            u32(variables[command], int(args[0]), '<i')
+        elif command == 'map':
+            # Neues Beatmap-Objekt, wie osu! es beim Wechsel anlegt
+            obj = data + 0x1000 + 0x400 * (slot % 16)
+            slot += 1
+            title = args[1].strip().encode('utf-16-le')
+            u32(obj + BEATMAP_ID, int(args[0]), '<i')
+            u32(obj + 0x200 + 4, len(title) // 2, '<i')
+            write(obj + 0x208, title)
+            u32(obj + BEATMAP_TITLE, obj + 0x200)
+            u32(variables['beatmap'], obj)
+        print("ok", flush=True)
+
+
+class GameProcessStandin:
+    """osu!-Stand-in mit bekannter Speicherstruktur für core.game_state (nur Linux)"""
+
+    def __init__(self, size=GAME_STANDIN_SIZE):
+        self.size = size
+        self.process = None
+        self.base = None
+
+    def start(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.process = subprocess.Popen([sys.executable, '-m', 'benchmarks.standins', 'game', str(self.size)],
+                                        cwd=root, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        line = self.process.stdout.readline().split()
+        if not line or line[0] != 'ready':
+            self.stop()
+            raise RuntimeError("game stand-in did not start")
+        self.base = int(line[1], 16)
+        return self
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def command(self, *args):
+        self.process.stdin.write(' '.join(str(arg) for arg in args) + '\n')
+        self.process.stdin.flush()
+        return self.process.stdout.readline().strip()
+
+    def stop(self):
+        if self.process is not None:
+            self.process.stdin.close()
+            self.process.wait(5)
+            self.process = None
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['game']:
+        _game_standin_main(int(sys.argv[2]))
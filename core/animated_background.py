@@ -0,0 +1,296 @@
+import logging
+import os
+import queue
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+from core.log import log_event
+
+logger = logging.getLogger(__name__)
+
+SEQUENCE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.webp')
+SEQUENCE_FRAME_MS = 33
+DEFAULT_FRAME_MS = 100
+MIN_FRAME_MS = 10
+
+MAX_RING_FRAMES = 8
+MIN_RING_FRAMES = 2
+MAX_RING_BYTES = 64 * 1024 * 1024
+
+# CPU-Budget für Dekodieren + Zeichnen, in Prozent eines Kerns
+CPU_BUDGET_PERCENT = 10.0
+BUDGET_WINDOW_S = 2.0
+MAX_STRIDE = 8
+
+
+def is_animated(path):
+    """Ordner mit Einzelbildern oder eine Datei mit mehr als einem Frame (GIF/APNG/WebP)"""
+    if os.path.isdir(path):
+        return len(sequence_files(path)) > 1
+    reader = QImageReader(path)
+    return reader.supportsAnimation() and reader.imageCount() != 1
+
+
+def sequence_files(directory):
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.lower().endswith(SEQUENCE_EXTENSIONS)
+    )
+
+
+class FrameDecoder(threading.Thread):
+    """Dekodiert und skaliert Frames im Hintergrund in einen begrenzten Ring"""
+
+    def __init__(self, source, size, dpr, frames):
+        super().__init__(name='BackgroundDecoder', daemon=True)
+        self.source = source
+        self.size = size * dpr
+        self.dpr = dpr
+        self.frames = frames
+        self.stride = 1
+        self.running = True
+        self.cpu_seconds = 0.0
+        self.decoded = 0
+        self._active = threading.Event()
+        self._active.set()
+
+    def pause(self):
+        self._active.clear()
+
+    def resume(self):
+        self._active.set()
+
+    def stop(self):
+        self.running = False
+        self._active.set()
+
+    def run(self):
+        try:
+            while self.running:
+                if not self._decode_pass():
+                    logger.error(f"No frames could be decoded from {self.source}")
+                    return
+        finally:
+            self.cpu_seconds = time.thread_time()
+
+    def _decode_pass(self):
+        """Ein Durchlauf durch alle Frames; liefert False, wenn die Quelle nichts hergibt"""
+        any_frame = False
+        skipped_ms = 0
+        for index, (delay_ms, load) in enumerate(self._read_frames()):
+            self._active.wait()
+            if not self.running:
+                return True
+            # Über dem CPU-Budget wird nur jeder n-te Frame skaliert, die Dauer der übrigen addiert sich
+            if index % self.stride:
+                skipped_ms += delay_ms
+                continue
+            image = load()
+            if image is None or image.isNull():
+                continue
+            any_frame = True
+            frame = image.scaled(
+                self.size,
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                Qt.TransformationMode.SmoothTransformation
+            ).convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+            frame.setDevicePixelRatio(self.dpr)
+            self.decoded += 1
+            self.cpu_seconds = time.thread_time()
+            self._put((frame, max(delay_ms + skipped_ms, MIN_FRAME_MS)))
+            skipped_ms = 0
+        return any_frame
+
+    def _read_frames(self):
+        if os.path.isdir(self.source):
+            for path in sequence_files(self.source):
+                yield SEQUENCE_FRAME_MS, lambda path=path: QImage(path)
+            return
+
+        reader = QImageReader(self.source)
+        while self.running and reader.canRead():
+            image = reader.read()
+            if image.isNull():
+                return
+            yield reader.nextImageDelay() or DEFAULT_FRAME_MS, lambda image=image: image
+
+    def _put(self, item):
+        # Blockiert nur den Decoder, nie den GUI-Thread; stop() löst das Warten
+        while self.running:
+            try:
+                self.frames.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+class AnimatedBackground(QObject):
+    """Spielt einen animierten Hintergrund mit einem einzigen Timer ab.
+
+    Liegt der Takt hinter dem Plan, werden fertige Frames verworfen statt
+    auf den Decoder zu warten.
+    """
+    frame_changed = pyqtSignal()
+    # Der Decoder hat aufgegeben; der letzte Frame (falls vorhanden) bleibt stehen
+    ended = pyqtSignal()
+
+    def __init__(self, source, size, dpr=1.0, parent=None, cpu_budget=CPU_BUDGET_PERCENT):
+        super().__init__(parent)
+        self.source = source
+        self.cpu_budget = cpu_budget
+        frame_bytes = max(size.width() * size.height() * dpr * dpr * 4, 1)
+        ring = int(max(MIN_RING_FRAMES, min(MAX_RING_FRAMES, MAX_RING_BYTES // frame_bytes)))
+        self.frames = queue.Queue(maxsize=ring)
+        self.decoder = FrameDecoder(source, size, dpr, self.frames)
+
+        self.frame = None
+        self.due = 0.0
+        self.paused = False
+        self.finished = False
+        self.shown = 0
+        self.dropped = 0
+        self.underruns = 0
+        self.throttled = 0
+        self.main_cpu = 0.0
+        self.cpu_percent = 0.0
+        self.playing_seconds = 0.0
+        self.window_started = None
+        self.window_cpu = 0.0
+
+        # Ein präziser Single-Shot-Timer: der gemeinsame Scheduler bündelt Jobs
+        # auf 10 ms und eignet sich deshalb nicht für Frame-Pacing
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._tick)
+
+    def start(self):
+        self.decoder.start()
+        self._start_window()
+        self.due = time.monotonic()
+        self.timer.start(0)
+
+    def pause(self):
+        """Fenster versteckt oder minimiert: kein Timer und kein Dekodieren mehr"""
+        if self.paused:
+            return
+        self.paused = True
+        self.timer.stop()
+        self.decoder.pause()
+        self._close_window()
+
+    def resume(self):
+        if not self.paused:
+            return
+        self.paused = False
+        if self.finished:
+            return
+        self.decoder.resume()
+        self._start_window()
+        self.due = time.monotonic()
+        self.timer.start(0)
+
+    def stop(self):
+        self.timer.stop()
+        self.decoder.stop()
+        self._close_window()
+        while True:
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                break
+        self.frame = None
+        log_event('background.session', **self.stats())
+
+    def account_paint(self, cpu_seconds):
+        """Zeichenzeit des Fensters zählt zum CPU-Budget"""
+        self.main_cpu += cpu_seconds
+
+    def _tick(self):
+        started = time.thread_time()
+        now = time.monotonic()
+        if now >= self.due:
+            self._advance(now)
+        self.main_cpu += time.thread_time() - started
+        if self.finished:
+            return
+        if now - self.window_started >= BUDGET_WINDOW_S:
+            self._check_budget(now)
+        self.timer.start(max(0, int((self.due - time.monotonic()) * 1000)))
+
+    def _advance(self, now):
+        try:
+            frame, delay_ms = self.frames.get_nowait()
+        except queue.Empty:
+            if not self.decoder.is_alive():
+                # Nichts dekodierbar oder Decoder abgestürzt: kein Timer mehr, sonst 100 Wakeups pro Sekunde
+                self.finished = True
+                self._close_window()
+                self.ended.emit()
+                return
+            # Decoder kommt nicht hinterher: alten Frame stehen lassen, gleich erneut versuchen
+            self.underruns += 1
+            self.due = now + MIN_FRAME_MS / 1000
+            return
+
+        # Frames, deren Anzeigezeit schon vorbei ist, überspringen
+        while self.due + delay_ms / 1000 <= now:
+            try:
+                next_frame = self.frames.get_nowait()
+            except queue.Empty:
+                break
+            self.due += delay_ms / 1000
+            self.dropped += 1
+            frame, delay_ms = next_frame
+
+        # Nach langen Hängern nicht versuchen, den Rückstand aufzuholen
+        self.due = max(self.due, now - 1.0) + delay_ms / 1000
+        self.frame = frame
+        self.shown += 1
+        self.frame_changed.emit()
+
+    def _start_window(self):
+        self.window_started = time.monotonic()
+        self.window_cpu = self._cpu_seconds()
+
+    def _close_window(self):
+        if self.window_started is not None:
+            self.playing_seconds += time.monotonic() - self.window_started
+            self.window_started = None
+
+    def _cpu_seconds(self):
+        return self.decoder.cpu_seconds + self.main_cpu
+
+    def _check_budget(self, now):
+        cpu = self._cpu_seconds()
+        self.cpu_percent = (cpu - self.window_cpu) / (now - self.window_started) * 100
+        self._close_window()
+        self._start_window()
+        if self.cpu_percent > self.cpu_budget and self.decoder.stride < MAX_STRIDE:
+            self.decoder.stride *= 2
+            self.throttled += 1
+            log_event('background.throttle', cpu_percent=round(self.cpu_percent, 1),
+                      budget_percent=self.cpu_budget, stride=self.decoder.stride)
+
+    def stats(self):
+        playing = self.playing_seconds
+        if self.window_started is not None:
+            playing += time.monotonic() - self.window_started
+        playing = max(playing, 1e-6)
+        return {
+            'source': os.path.basename(self.source),
+            'fps': round(self.shown / playing, 2),
+            'shown': self.shown,
+            'dropped': self.dropped,
+            'underruns': self.underruns,
+            'decoded': self.decoder.decoded,
+            'ring_size': self.frames.maxsize,
+            'stride': self.decoder.stride,
+            'throttled': self.throttled,
+            'cpu_percent': round(self.cpu_percent, 1),
+            'avg_cpu_percent': round(self._cpu_seconds() / playing * 100, 1),
+            'cpu_budget_percent': self.cpu_budget,
+        }
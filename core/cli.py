@@ -0,0 +1,91 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from core.settings_store import load_settings
+from utils.osu_tools import find_osu_executable, build_osu_args
+
+# Schneller Start ohne GUI: dieses Modul darf PyQt nicht importieren
+
+
+def parse_launch_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='main.py launch',
+        description="Start osu! with the launcher's settings without opening the launcher window")
+    parser.add_argument('--server', help="eternityglow or bancho (default: from launcher_settings.json)")
+    parser.add_argument('--path', help="path to osu!.exe (default: configured or standard location)")
+    parser.add_argument('--nomusic', action=argparse.BooleanOptionalAction, default=None)
+    parser.add_argument('--novideo', action=argparse.BooleanOptionalAction, default=None)
+    parser.add_argument('--fullscreen', action=argparse.BooleanOptionalAction, default=None,
+                        help="--no-fullscreen starts osu! windowed")
+    parser.add_argument('--wait', action='store_true', help="wait for osu! to exit and return its exit code")
+    parser.add_argument('--dry-run', action='store_true', help="print the command instead of starting osu!")
+    return parser.parse_args(argv)
+
+
+def run_launch(argv):
+    started = time.perf_counter()
+    args = parse_launch_args(argv)
+    settings = load_settings()
+    osu_settings = settings.setdefault('osu', {})
+    for key, value in [('nomusic', args.nomusic), ('novideo', args.novideo),
+                       ('force_fullscreen', args.fullscreen), ('path', args.path)]:
+        if value is not None:
+            osu_settings[key] = value
+
+    if args.path and not os.path.isfile(args.path):
+        print(f"{args.path} does not exist", file=sys.stderr)
+        return 2
+    osu_path = find_osu_executable(settings)
+    if not osu_path:
+        print("osu!.exe not found, pass --path or set it in the launcher settings", file=sys.stderr)
+        return 2
+
+    params = build_osu_args(osu_path, settings, args.server)
+    if args.dry_run:
+        print(subprocess.list2cmdline(params))
+        return 0
+
+    try:
+        process = subprocess.Popen(params)
+    except OSError as e:
+        print(f"Failed to start osu!: {e}", file=sys.stderr)
+        return 1
+    print(f"osu! started (pid {process.pid}) in {(time.perf_counter() - started) * 1000:.0f} ms")
+    if args.wait:
+        return process.wait()
+    return 0
+
+
+def run_verify(argv):
+    parser = argparse.ArgumentParser(
+        prog='main.py verify',
+        description="Check the osu! installation against the last recorded hash manifest")
+    parser.add_argument('--path', help="osu! directory (default: folder of the configured osu!.exe)")
+    parser.add_argument('--full', action='store_true', help="hash every file instead of only changed ones")
+    parser.add_argument('--accept', action='store_true', help="record the current state as the new baseline")
+    parser.add_argument('--workers', type=int, help="hashing processes (default: one per CPU)")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    from core.integrity import verify
+    directory = args.path
+    if directory is None:
+        osu_path = find_osu_executable(load_settings())
+        if not osu_path:
+            print("osu!.exe not found, pass --path or set it in the launcher settings", file=sys.stderr)
+            return 2
+        directory = os.path.dirname(osu_path)
+    if not os.path.isdir(directory):
+        print(f"{directory} is not a directory", file=sys.stderr)
+        return 2
+
+    report = verify(directory, full=args.full, accept=args.accept, workers=args.workers)
+    if args.json:
+        print(json.dumps(vars(report), indent=2))
+    else:
+        print(report.summary())
+    return 0 if report.ok else 1
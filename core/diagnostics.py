@@ -0,0 +1,191 @@
+import gc
+import time
+import tracemalloc
+from collections import Counter
+
+import psutil
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
+    QPlainTextEdit, QApplication, QLabel
+)
+from PyQt6.QtCore import QObject
+from PyQt6.QtGui import QFont
+
+from utils.helpers import cache_path
+
+SNAPSHOT_DIR = 'diagnostics'
+TOP_ALLOCATIONS = 15
+TOP_CLASSES = 25
+
+
+def count_qobjects():
+    """Counts live QObjects by class, starting from the widget tree and every wrapper the GC knows"""
+    counts = Counter()
+    app = QApplication.instance()
+    roots = list(QApplication.topLevelWidgets())
+    if app is not None:
+        roots.append(app)
+    # Parentless timers, threads and workers aren't reachable from any widget
+    roots += [obj for obj in gc.get_objects() if isinstance(obj, QObject)]
+    # Keeps the wrappers alive so their ids can't be reused while counting
+    seen = {}
+    for root in roots:
+        try:
+            objects = [root, *root.findChildren(QObject)]
+        except RuntimeError:
+            # Wrapper whose C++ object is already deleted
+            continue
+        for obj in objects:
+            key = id(obj)
+            if key in seen:
+                continue
+            seen[key] = obj
+            counts[type(obj).__name__] += 1
+    return counts
+
+
+class DiagnosticsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.launcher = parent
+        self.snapshots = []
+        self.previous_counts = None
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self):
+        self.setWindowTitle("Diagnostics")
+        self.setMinimumSize(800, 600)
+
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel()
+        self.output = QPlainTextEdit()
+        self.output.setReadOnly(True)
+        self.output.setFont(QFont("Consolas", 9))
+
+        buttons = QHBoxLayout()
+        self.trace_btn = QPushButton()
+        self.trace_btn.clicked.connect(self.toggle_tracing)
+        for text, slot in [
+            ("Refresh", self.refresh),
+            ("Snapshot", self.take_snapshot),
+            ("Diff last two", self.show_diff),
+            ("Dump to disk", self.dump_snapshot),
+        ]:
+            btn = QPushButton(text)
+            btn.clicked.connect(slot)
+            buttons.addWidget(btn)
+        buttons.insertWidget(0, self.trace_btn)
+
+        layout.addWidget(self.summary_label)
+        layout.addLayout(buttons)
+        layout.addWidget(self.output)
+        self.update_trace_button()
+
+    def update_trace_button(self):
+        self.trace_btn.setText("Stop tracemalloc" if tracemalloc.is_tracing() else "Start tracemalloc")
+
+    def toggle_tracing(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            self.snapshots.clear()
+        else:
+            tracemalloc.start(10)
+        self.update_trace_button()
+        self.refresh()
+
+    def refresh(self):
+        rss_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+        summary = f"RSS: {rss_mb:.1f} MB"
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            summary += f"  |  traced: {current / 1024 / 1024:.1f} MB (peak {peak / 1024 / 1024:.1f} MB)"
+        scheduler = getattr(self.launcher, 'scheduler', None)
+        if scheduler is not None:
+            stats = scheduler.stats()
+            summary += (f"  |  wakeups/s: {stats['wakeups_per_sec']:.2f}"
+                        f" (max {stats['max_wakeups_per_sec']:.2f})")
+        watchdog = getattr(self.launcher, 'watchdog', None)
+        if watchdog is not None:
+            stats = watchdog.stats()
+            summary += f"  |  stalls: {stats['stalls']} ({stats['total_stall_ms']:.0f} ms)"
+        self.summary_label.setText(summary)
+
+        counts = count_qobjects()
+        lines = [f"Live QObjects: {sum(counts.values())}", ""]
+        for name, count in counts.most_common(TOP_CLASSES):
+            delta = ""
+            if self.previous_counts is not None:
+                change = count - self.previous_counts.get(name, 0)
+                delta = f"  ({change:+d})" if change else ""
+            lines.append(f"{count:8d}  {name}{delta}")
+        self.previous_counts = counts
+
+        if scheduler is not None:
+            lines += ["", "Scheduled jobs:"]
+            for name, job in sorted(scheduler.stats()['jobs'].items()):
+                lines.append(f"  {name:24s} {job['group']:10s} runs {job['runs']:6d}  "
+                             f"avg {job['avg_ms']:8.3f} ms  failures {job['failures']}")
+
+        animation = getattr(self.launcher, 'animation', None)
+        if animation is not None:
+            stats = animation.stats()
+            lines += ["", f"Animated background ({stats['source']}):",
+                      f"  {stats['fps']:.1f} fps, dropped {stats['dropped']}, underruns {stats['underruns']}, "
+                      f"stride {stats['stride']}",
+                      f"  CPU {stats['cpu_percent']:.1f}% (avg {stats['avg_cpu_percent']:.1f}%, "
+                      f"budget {stats['cpu_budget_percent']:.0f}%)"]
+
+        plugins = getattr(self.launcher, 'plugins', None)
+        if plugins is not None and plugins.manifests:
+            lines += ["", "Plugins:"]
+            for plugin_id, manifest in sorted(plugins.manifests.items()):
+                stats = plugins.stats.get(plugin_id)
+                if stats is None:
+                    state = "not loaded"
+                elif stats.error:
+                    state = f"failed: {stats.error}"
+                else:
+                    state = (f"import {stats.load_ms:.1f} ms, activate {stats.activate_ms:.1f} ms, "
+                             f"+{stats.rss_kb / 1024:.1f} MB RSS, {stats.modules} modules")
+                lines.append(f"  {plugin_id:20s} {manifest.source:12s} {state}")
+
+        from core.telemetry import latest_summary, format_summary
+        report = latest_summary()
+        if report is not None:
+            lines += ["", "Last osu! session:"] + [f"  {line}" for line in format_summary(report).splitlines()]
+
+        if self.snapshots:
+            lines += ["", f"Top allocation sites (snapshot {len(self.snapshots)}):"]
+            for stat in self.snapshots[-1].statistics('lineno')[:TOP_ALLOCATIONS]:
+                lines.append(f"  {stat}")
+        self.output.setPlainText("\n".join(lines))
+
+    def take_snapshot(self):
+        if not tracemalloc.is_tracing():
+            self.output.setPlainText("tracemalloc is not running, start it first")
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        self.snapshots = (self.snapshots + [snapshot])[-2:]
+        self.refresh()
+
+    def show_diff(self):
+        if len(self.snapshots) < 2:
+            self.output.setPlainText("Take two snapshots to compare them")
+            return
+        old, new = self.snapshots
+        lines = ["Allocation growth between the last two snapshots:", ""]
+        for stat in new.compare_to(old, 'lineno')[:TOP_ALLOCATIONS]:
+            lines.append(f"  {stat}")
+        self.output.setPlainText("\n".join(lines))
+
+    def dump_snapshot(self):
+        if not self.snapshots:
+            self.output.setPlainText("No snapshot taken yet")
+            return
+        path = cache_path(SNAPSHOT_DIR, f"snapshot-{time.strftime('%Y%m%d-%H%M%S')}.tracemalloc")
+        self.snapshots[-1].dump(path)
+        self.output.appendPlainText(f"\nSnapshot written to {path}")
@@ -1,4 +1,3 @@
-from pypresence import Presence
 import time
 import logging
 
@@ -11,6 +10,7 @@ class DiscordRPC:
 
     def connect(self):
         try:
+            from pypresence import Presence
             self.RPC = Presence(self.client_id)
             self.RPC.connect()
             self.connected = True
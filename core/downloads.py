@@ -0,0 +1,396 @@
+import errno
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
+    QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+
+from core.log import log_event
+from utils.helpers import cache_path
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+DEFAULT_WORKERS = 4
+# Während osu! läuft, bleibt der Rest der Leitung dem Spiel
+GAME_RATE = 1024 * 1024
+SET_ID_PATTERN = re.compile(r'^(\d+)(?:\s|\.osz$|$)')
+
+QUEUED, RUNNING, DONE, SKIPPED, FAILED, CANCELLED = 'queued', 'running', 'done', 'skipped', 'failed', 'cancelled'
+
+
+def mirror_url():
+    return os.environ.get('ETERNITYGLOW_BEATMAP_MIRROR', 'https://catboy.best/d/{set_id}')
+
+
+def installed_set_ids(songs_dir):
+    """Set-IDs aus den Ordnernamen ("123456 Artist - Title") und noch nicht importierten .osz"""
+    ids = set()
+    try:
+        names = os.listdir(songs_dir)
+    except OSError:
+        return ids
+    for name in names:
+        match = SET_ID_PATTERN.match(name)
+        if match:
+            ids.add(int(match.group(1)))
+    return ids
+
+
+class TokenBucket:
+    """Begrenzt den Durchsatz in Bytes/s; rate=None heißt unbegrenzt"""
+
+    def __init__(self, rate=None, burst=None):
+        self.lock = threading.Lock()
+        self.rate = rate
+        self.burst = burst
+        self.tokens = self._capacity()
+        self.updated = time.monotonic()
+
+    def _capacity(self):
+        # Standard-Burst: eine Viertelsekunde, damit kurze Spitzen das Spiel nicht stören
+        return self.burst or max((self.rate or 0) / 4, CHUNK_SIZE)
+
+    def set_rate(self, rate):
+        with self.lock:
+            self.rate = rate
+            self.tokens = min(self.tokens, self._capacity())
+
+    def consume(self, amount):
+        while True:
+            with self.lock:
+                if self.rate is None:
+                    return
+                now = time.monotonic()
+                self.tokens = min(self._capacity(), self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                # Schulden erlaubt: große Chunks blockieren nicht für immer, der nächste wartet länger
+                if self.tokens > 0:
+                    self.tokens -= amount
+                    return
+                wait = -self.tokens / self.rate
+            time.sleep(min(wait, 0.25))
+
+
+class DownloadJob:
+    __slots__ = ('set_id', 'url', 'state', 'done', 'total', 'error', 'resumed', 'started', 'finished')
+
+    def __init__(self, set_id, url):
+        self.set_id = set_id
+        self.url = url
+        self.state = QUEUED
+        self.done = 0
+        self.total = None
+        self.error = None
+        self.resumed = 0
+        self.started = None
+        self.finished = None
+
+
+class DownloadManager:
+    """Lädt Beatmap-Sets parallel in den Songs-Ordner, von wo osu! sie importiert"""
+
+    def __init__(self, songs_dir, workers=DEFAULT_WORKERS, rate=None, host_rate=None, url_template=None):
+        self.songs_dir = songs_dir
+        self.url_template = url_template or mirror_url()
+        self.partial_dir = os.path.dirname(cache_path('downloads', 'partial', '.keep'))
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='Download')
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.rate = rate
+        self.bucket = TokenBucket(rate)
+        self.host_rate = host_rate
+        self.host_buckets = {}
+        self.known = installed_set_ids(songs_dir)
+        self.cancelled = False
+        self.local = threading.local()
+
+    def set_game_running(self, running):
+        """Drosselt alle Downloads, solange osu! läuft"""
+        if running:
+            self.bucket.set_rate(min(self.rate or GAME_RATE, GAME_RATE))
+        else:
+            self.bucket.set_rate(self.rate)
+
+    def enqueue(self, set_ids):
+        """Reiht Sets ein; bereits vorhandene oder schon eingereihte werden übersprungen"""
+        added = []
+        installed = installed_set_ids(self.songs_dir)
+        with self.lock:
+            self.known |= installed
+            for set_id in set_ids:
+                set_id = int(set_id)
+                if set_id in self.jobs and self.jobs[set_id].state not in (FAILED, CANCELLED):
+                    continue
+                job = DownloadJob(set_id, self.url_template.format(set_id=set_id))
+                self.jobs[set_id] = job
+                if set_id in self.known:
+                    job.state = SKIPPED
+                    continue
+                added.append(job)
+        for job in added:
+            self.pool.submit(self._run, job)
+        return added
+
+    def cancel_all(self):
+        with self.lock:
+            for job in self.jobs.values():
+                if job.state == QUEUED:
+                    job.state = CANCELLED
+
+    def shutdown(self):
+        self.cancel_all()
+        self.cancelled = True
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def _host_bucket(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            if host not in self.host_buckets:
+                self.host_buckets[host] = TokenBucket(self.host_rate)
+            return self.host_buckets[host]
+
+    def _session(self):
+        # Eine Session pro Worker, damit Verbindungen zum Mirror wiederverwendet werden
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            import requests
+            session = self.local.session = requests.Session()
+        return session
+
+    def _run(self, job):
+        if job.state != QUEUED or self.cancelled:
+            return
+        job.state = RUNNING
+        job.started = time.monotonic()
+        try:
+            self._download(job)
+            job.state = DONE
+            with self.lock:
+                self.known.add(job.set_id)
+        except Exception as e:
+            job.state = CANCELLED if self.cancelled else FAILED
+            job.error = str(e)
+            logger.error(f"Download of beatmap set {job.set_id} failed: {str(e)}")
+        finally:
+            job.finished = time.monotonic()
+            log_event('download.finish', (job.finished - job.started) * 1000, set_id=job.set_id,
+                      state=job.state, bytes=job.done, resumed=job.resumed)
+
+    def _download(self, job):
+        part = os.path.join(self.partial_dir, f"{job.set_id}.osz.part")
+        meta_file = part + '.json'
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        meta = {}
+        if offset:
+            try:
+                with open(meta_file) as f:
+                    meta = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                offset = 0
+
+        if offset and meta.get('total') == offset:
+            # Abbruch nach dem letzten Chunk, aber vor os.replace: nur noch übernehmen
+            job.total = job.done = offset
+            self._finish(job, part, meta_file)
+            return
+
+        headers = {}
+        if offset and meta.get('validator'):
+            # If-Range: hat sich die Datei geändert, schickt der Server sie komplett (200)
+            headers['Range'] = f"bytes={offset}-"
+            headers['If-Range'] = meta['validator']
+        else:
+            offset = 0
+
+        host_bucket = self._host_bucket(job.url)
+        with self._session().get(job.url, headers=headers, stream=True, timeout=30) as response:
+            if response.status_code == 416 and offset:
+                # Range hinter dem Dateiende: vollständig, wenn die Größe passt, sonst von vorn
+                total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                if total.isdigit() and int(total) == offset:
+                    job.total = job.done = offset
+                else:
+                    os.remove(part)
+                    offset = None
+            else:
+                response.raise_for_status()
+                self._receive(job, response, part, meta_file, offset, host_bucket)
+        if offset is None:
+            return self._download(job)
+        self._finish(job, part, meta_file)
+
+    def _receive(self, job, response, part, meta_file, offset, host_bucket):
+        if response.status_code == 206:
+            job.resumed = offset
+        else:
+            offset = 0
+        length = response.headers.get('Content-Length')
+        job.total = offset + int(length) if length else None
+        job.done = offset
+        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+        with open(meta_file, 'w') as f:
+            json.dump({'validator': validator, 'url': job.url, 'total': job.total}, f)
+
+        with open(part, 'ab' if offset else 'wb') as f:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if self.cancelled or job.state == CANCELLED:
+                    raise RuntimeError("cancelled")
+                self.bucket.consume(len(chunk))
+                host_bucket.consume(len(chunk))
+                f.write(chunk)
+                job.done += len(chunk)
+
+    def _finish(self, job, part, meta_file):
+        if job.total is not None and job.done != job.total:
+            raise IOError(f"incomplete download ({job.done} of {job.total} bytes)")
+        os.makedirs(self.songs_dir, exist_ok=True)
+        # osu! importiert .osz-Dateien, die im Songs-Ordner auftauchen
+        target = os.path.join(self.songs_dir, f"{job.set_id}.osz")
+        try:
+            os.replace(part, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cache und Songs auf verschiedenen Laufwerken: erst daneben kopieren,
+            # damit osu! nie eine halb geschriebene .osz sieht
+            shutil.copyfile(part, target + '.tmp')
+            os.replace(target + '.tmp', target)
+            os.remove(part)
+        os.remove(meta_file)
+
+    def stats(self):
+        with self.lock:
+            jobs = list(self.jobs.values())
+        counts = {}
+        for job in jobs:
+            counts[job.state] = counts.get(job.state, 0) + 1
+        return {
+            'jobs': len(jobs),
+            'states': counts,
+            'bytes': sum(job.done for job in jobs),
+            'rate_limit': self.bucket.rate,
+        }
+
+
+class DownloadsPage(QWidget):
+    """Warteschlange der Beatmap-Downloads; aktualisiert sich nur, solange sie sichtbar ist"""
+    back_requested = pyqtSignal()
+
+    def __init__(self, manager, scheduler, parent=None):
+        super().__init__(parent)
+        self.setObjectName("DownloadsPage")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        self.manager = manager
+        self.scheduler = scheduler
+        self.rows = {}
+        self.last_bytes = (time.monotonic(), 0)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        header = QHBoxLayout()
+        back_btn = QPushButton("Back to Launcher")
+        back_btn.clicked.connect(self.back_requested.emit)
+        self.ids_edit = QLineEdit()
+        self.ids_edit.setPlaceholderText("Beatmap set IDs or links, separated by spaces")
+        self.ids_edit.returnPressed.connect(self.add_from_input)
+        add_btn = QPushButton("Download")
+        add_btn.clicked.connect(self.add_from_input)
+        cancel_btn = QPushButton("Cancel queued")
+        cancel_btn.clicked.connect(self.manager.cancel_all)
+        header.addWidget(back_btn)
+        header.addWidget(self.ids_edit, 1)
+        header.addWidget(add_btn)
+        header.addWidget(cancel_btn)
+
+        self.table = QTableWidget(0, 3)
+        self.table.setHorizontalHeaderLabels(["Set", "Status", "Progress"])
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.status_label = QLabel()
+
+        layout.addLayout(header)
+        layout.addWidget(self.table)
+        layout.addWidget(self.status_label)
+        self.setStyleSheet("""
+            QWidget#DownloadsPage { background: rgba(0,0,0,150); }
+            QLabel { color: white; }
+            QTableWidget, QLineEdit {
+                background: rgba(0,0,0,170);
+                color: white;
+                border: 1px solid rgba(255,102,170,80);
+                border-radius: 5px;
+                padding: 4px;
+            }
+            QHeaderView::section {
+                background: rgba(0,0,0,200);
+                color: #ff66aa;
+                border: none;
+                padding: 6px;
+            }
+            QPushButton {
+                background: rgba(0,0,0,180);
+                color: white;
+                border: 2px solid #ff66aa;
+                border-radius: 8px;
+                padding: 6px 12px;
+            }
+            QPushButton:hover {
+                background: rgba(255,102,170,150);
+                border-color: white;
+            }
+        """)
+
+    def add_from_input(self):
+        # Akzeptiert IDs und Links wie https://osu.ppy.sh/beatmapsets/123456
+        ids = [int(match) for match in re.findall(r'(?:beatmapsets/|/s/|/d/|^|\s)(\d+)', self.ids_edit.text())]
+        self.manager.enqueue(ids)
+        self.ids_edit.clear()
+        self.refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.scheduler.every('downloads.refresh', 500, self.refresh, group='ui', first_delay_ms=0)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.scheduler.cancel('downloads.refresh')
+
+    def refresh(self):
+        with self.manager.lock:
+            jobs = list(self.manager.jobs.values())
+        for job in jobs:
+            row = self.rows.get(job.set_id)
+            if row is None:
+                row = self.rows[job.set_id] = self.table.rowCount()
+                self.table.insertRow(row)
+                self.table.setItem(row, 0, QTableWidgetItem(str(job.set_id)))
+                self.table.setItem(row, 1, QTableWidgetItem())
+                self.table.setItem(row, 2, QTableWidgetItem())
+            self.table.item(row, 1).setText(job.error if job.state == FAILED else job.state)
+            if job.total:
+                self.table.item(row, 2).setText(f"{job.done / job.total:.0%} of {job.total / 1024 / 1024:.1f} MB")
+            elif job.done:
+                self.table.item(row, 2).setText(f"{job.done / 1024 / 1024:.1f} MB")
+
+        stats = self.manager.stats()
+        now = time.monotonic()
+        then, previous = self.last_bytes
+        speed = (stats['bytes'] - previous) / max(now - then, 1e-3)
+        self.last_bytes = (now, stats['bytes'])
+        states = ', '.join(f"{count} {state}" for state, count in sorted(stats['states'].items()))
+        limit = f", limited to {stats['rate_limit'] / 1024:.0f} KB/s" if stats['rate_limit'] else ""
+        self.status_label.setText(f"{states or 'No downloads'}  |  {speed / 1024:.0f} KB/s{limit}")
@@ -1,44 +1,188 @@
 from PyQt6.QtWidgets import QWidget, QLabel
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QMouseEvent
+from PyQt6.QtCore import Qt, QObject, QEvent, QPoint, QTimer, pyqtSignal
+from PyQt6.QtGui import QMouseEvent, QPainter
+
+WIDGET_STYLE = """
+    background: rgba(0, 0, 0, %(alpha)d);
+    border: 2px solid #ff66aa;
+    border-radius: 8px;
+    padding: 5px;
+"""
+
+DEFAULT_REFRESH_RATE = 60.0
+
+
+class DragProxy(QWidget):
+    """Stellvertreter während des Ziehens: zeigt ein einmal gerendertes Pixmap statt Stylesheet und Kinder"""
+
+    def __init__(self, owner):
+        super().__init__(owner.parentWidget())
+        self.owner = owner
+        self.pixmap = None
+        self.pending = None
+        self.moves = 0
+        self.frames = 0
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.apply_pending)
+
+    def begin(self, pixmap, pos, refresh_rate):
+        self.pixmap = pixmap
+        self.pending = None
+        self.moves = self.frames = 0
+        self.setGeometry(self.owner.geometry())
+        self.move(pos)
+        self.show()
+        self.raise_()
+        self.grabMouse()
+        # Mausbewegungen kommen mit bis zu 8 kHz; bewegt wird höchstens einmal pro Bildschirm-Frame
+        self.timer.start(max(1, round(1000 / refresh_rate)))
+
+    def apply_pending(self):
+        if self.pending is not None and self.pending != self.pos():
+            self.move(self.pending)
+            self.frames += 1
+        self.pending = None
+
+    def end(self):
+        self.timer.stop()
+        self.apply_pending()
+        self.releaseMouse()
+        self.hide()
+        self.pixmap = None
+
+    def paintEvent(self, event):
+        if self.pixmap is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self.pixmap)
+            painter.end()
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        self.moves += 1
+        self.owner.drag_move(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        self.owner.drag_end()
+
 
 class DraggableWidget(QWidget):
+    drag_finished = pyqtSignal(object)
+
     def __init__(self, title="", parent=None):
         super().__init__(parent)
         self.setup_widget(title)
-        
+
     def setup_widget(self, title):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setStyleSheet("""
-            background: rgba(0, 0, 0, 180);
-            border: 2px solid #ff66aa;
-            border-radius: 8px;
-            padding: 5px;
-        """)
+        self.setStyleSheet(WIDGET_STYLE % {'alpha': 180})
         self.drag_start_position = None
-        
+        self.proxy = None
+        self.last_drag = None
+
         if title:
             label = QLabel(title, self)
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             label.setStyleSheet("color: white; font-weight: bold;")
             label.move(10, 10)
 
+    def set_opacity(self, percent):
+        self.setStyleSheet(WIDGET_STYLE % {'alpha': round(255 * percent / 100)})
+
+    def refresh_rate(self):
+        screen = self.screen()
+        rate = screen.refreshRate() if screen is not None else 0
+        return rate if rate >= 30 else DEFAULT_REFRESH_RATE
+
+    def clamp(self, pos):
+        parent = self.parentWidget()
+        if parent is not None:
+            # Begrenzung auf Eltern-Widget
+            pos.setX(max(0, min(pos.x(), parent.width() - self.width())))
+            pos.setY(max(0, min(pos.y(), parent.height() - self.height())))
+        return pos
+
     def mousePressEvent(self, event: QMouseEvent):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.drag_start_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-            self.raise_()
+        if event.button() != Qt.MouseButton.LeftButton or self.parentWidget() is None:
+            return
+        self.drag_start_position = event.globalPosition().toPoint() - self.pos()
+        if self.proxy is None:
+            self.proxy = DragProxy(self)
+        # Einmal rendern; bis zum Loslassen wird nur noch dieses Pixmap verschoben
+        pixmap = self.grab()
+        self.proxy.begin(pixmap, self.pos(), self.refresh_rate())
+        self.hide()
 
-    def mouseMoveEvent(self, event: QMouseEvent):
-        if self.drag_start_position and event.buttons() & Qt.MouseButton.LeftButton:
-            new_pos = event.globalPosition().toPoint() - self.drag_start_position
-            if self.parent():
-                # Begrenzung auf Eltern-Widget
-                new_pos.setX(max(0, min(new_pos.x(), self.parent().width() - self.width())))
-                new_pos.setY(max(0, min(new_pos.y(), self.parent().height() - self.height())))
-            self.move(new_pos)
+    def drag_move(self, event: QMouseEvent):
+        if self.drag_start_position is not None:
+            self.proxy.pending = self.clamp(event.globalPosition().toPoint() - self.drag_start_position)
 
-    def mouseReleaseEvent(self, event: QMouseEvent):
-        if self.drag_start_position:
-            self.drag_start_position = None
-            if hasattr(self.parent(), 'save_widget_positions'):
-                self.parent().save_widget_positions()
\ No newline at end of file
+    def drag_end(self):
+        if self.drag_start_position is None:
+            return
+        self.drag_start_position = None
+        self.proxy.end()
+        self.move(self.proxy.pos())
+        self.show()
+        self.raise_()
+        self.last_drag = {'mouse_moves': self.proxy.moves, 'frames': self.proxy.frames}
+        self.drag_finished.emit(self)
+
+
+class FloatingWidgets(QObject):
+    """Frei positionierte Widgets über einer Seite; Positionen relativ zur freien Fläche (0..1)"""
+    moved = pyqtSignal()
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.page = page
+        self.widgets = {}
+        self.relative = {}
+        page.installEventFilter(self)
+
+    def add(self, widget_id, widget, default=(1.0, 1.0)):
+        widget.setParent(self.page)
+        self.widgets[widget_id] = (widget, default)
+        self.relative.setdefault(widget_id, default)
+        widget.drag_finished.connect(lambda w, widget_id=widget_id: self.drag_finished(widget_id, w))
+        self.place(widget_id)
+
+    def drag_finished(self, widget_id, widget):
+        free_x = self.page.width() - widget.width()
+        free_y = self.page.height() - widget.height()
+        self.relative[widget_id] = (widget.x() / free_x if free_x > 0 else 0.0,
+                                    widget.y() / free_y if free_y > 0 else 0.0)
+        self.moved.emit()
+
+    def place(self, widget_id):
+        widget, _ = self.widgets[widget_id]
+        rx, ry = self.relative[widget_id]
+        widget.move(QPoint(round(rx * max(0, self.page.width() - widget.width())),
+                           round(ry * max(0, self.page.height() - widget.height()))))
+
+    def place_all(self):
+        for widget_id in self.widgets:
+            self.place(widget_id)
+
+    def eventFilter(self, obj, event):
+        if obj is self.page and event.type() == QEvent.Type.Resize:
+            self.place_all()
+        return False
+
+    def load(self, positions):
+        self.relative = {widget_id: default for widget_id, (_, default) in self.widgets.items()}
+        for widget_id, pos in positions.items():
+            if 'rx' in pos:
+                self.relative[widget_id] = (min(max(pos['rx'], 0.0), 1.0), min(max(pos['ry'], 0.0), 1.0))
+            elif 'x' in pos and widget_id in self.widgets:
+                # Alte absolute Pixelwerte einmalig auf die Auflösung umrechnen, für die sie gespeichert wurden
+                widget, _ = self.widgets[widget_id]
+                screen = self.page.screen().size() if self.page.screen() is not None else self.page.size()
+                free_x = max(1, screen.width() - widget.width())
+                free_y = max(1, screen.height() - widget.height())
+                self.relative[widget_id] = (min(max(pos['x'] / free_x, 0.0), 1.0),
+                                            min(max(pos['y'] / free_y, 0.0), 1.0))
+        self.place_all()
+
+    def positions(self):
+        return {widget_id: {'rx': round(rx, 4), 'ry': round(ry, 4)}
+                for widget_id, (rx, ry) in self.relative.items()}
@@ -0,0 +1,443 @@
+import ctypes
+import json
+import logging
+import os
+import re
+import struct
+import sys
+import threading
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+
+from core.log import log_event
+from utils.helpers import cache_path
+
+# Qt-frei; liest nur, schreibt nie in den osu!-Prozess
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 4 * 1024 * 1024
+POLL_INTERVAL = 1.0
+# osu! erzeugt den gesuchten Code erst beim Start per JIT; vorher findet der Scan nichts
+ATTACH_DELAY = 5.0
+ATTACH_RETRY = 5.0
+ATTACH_ATTEMPTS = 12
+MAX_STRING = 256
+# osu! stable ist ein 32-Bit-Prozess
+POINTER_SIZE = 4
+
+Region = namedtuple('Region', 'start end executable backed')
+
+
+class Signature:
+    """Bytefolge im JIT-Code von osu!, '??' steht für ein beliebiges Byte"""
+
+    def __init__(self, name, pattern):
+        self.name = name
+        self.pattern = pattern
+        tokens = pattern.split()
+        self.size = len(tokens)
+        self.regex = re.compile(b''.join(b'.' if token == '??' else re.escape(bytes([int(token, 16)]))
+                                         for token in tokens), re.DOTALL)
+        # Längster fester Abschnitt: bytes.find sucht ihn per memchr/Two-Way statt Byte für Byte im Regex
+        best, start = (0, b''), None
+        for i, token in enumerate(tokens + ['??']):
+            if token != '??' and start is None:
+                start = i
+            elif token == '??' and start is not None:
+                if i - start > len(best[1]):
+                    best = (start, bytes(int(t, 16) for t in tokens[start:i]))
+                start = None
+        self.anchor_offset, self.anchor = best
+
+    def matches(self, data):
+        return self.regex.fullmatch(data) is not None
+
+    def find(self, data):
+        pos = data.find(self.anchor, self.anchor_offset)
+        while pos != -1:
+            if self.regex.match(data, pos - self.anchor_offset):
+                return pos - self.anchor_offset
+            pos = data.find(self.anchor, pos + 1)
+        return -1
+
+
+SIGNATURES = [
+    Signature('base', 'F8 01 74 04 83 65'),
+    Signature('status', '48 83 F8 04 73 1E'),
+    Signature('menu_mods', 'C8 FF ?? ?? ?? ?? ?? 81 0D ?? ?? ?? ?? 00 08 00 00'),
+]
+
+# Variable: (Signatur, Offsets). Adresse = Signatur + Offsets[0], danach je Offset einem Zeiger folgen.
+# Statische Felder bewegen sich während einer Sitzung nicht und werden nur einmal aufgelöst.
+VARIABLES = {
+    'status': ('status', (-0x4, 0x0)),
+    'mods': ('menu_mods', (0x9, 0x0)),
+    'beatmap': ('base', (-0xC, 0x0)),
+}
+BEATMAP_ID = 0xC8
+# "Artist - Title [Difficulty]"
+BEATMAP_TITLE = 0x80
+
+STATUS_LABELS = {
+    0: 'Main menu',
+    1: 'Editing',
+    2: 'Playing',
+    4: 'Choosing a map to edit',
+    5: 'Song select',
+    7: 'Results',
+    11: 'Multiplayer lobby',
+    12: 'Multiplayer room',
+    13: 'Multiplayer song select',
+    22: 'Tournament client',
+}
+MAP_STATUSES = {1, 2, 7}
+MODS = [(1, 'NF'), (2, 'EZ'), (4, 'TD'), (8, 'HD'), (16, 'HR'), (32, 'SD'), (64, 'DT'), (128, 'RX'),
+        (256, 'HT'), (512, 'NC'), (1024, 'FL'), (2048, 'AT'), (4096, 'SO'), (8192, 'AP'), (16384, 'PF')]
+
+
+def format_mods(mods):
+    names = [name for bit, name in MODS if mods & bit]
+    # NC und PF setzen zusätzlich die Bits von DT und SD
+    if 'NC' in names:
+        names.remove('DT')
+    if 'PF' in names:
+        names.remove('SD')
+    return ''.join(names)
+
+
+@dataclass(frozen=True)
+class GameState:
+    status: int = None
+    mods: int = 0
+    beatmap_id: int = 0
+    beatmap: str = ''
+
+    def presence(self):
+        """Text für DiscordRPC.update_presence (Discord erlaubt höchstens 128 Zeichen)"""
+        label = STATUS_LABELS.get(self.status, 'Playing osu!')
+        if self.status in MAP_STATUSES and self.beatmap:
+            label = f"{label}: {self.beatmap}"
+            mods = format_mods(self.mods)
+            if mods and self.status == 2:
+                label += f" +{mods}"
+        return label[:128]
+
+
+class ProcMemory:
+    """Linux: liest über /proc/<pid>/mem; für einen Kindprozess des Launchers reicht ptrace_scope=1"""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.fd = os.open(f"/proc/{pid}/mem", os.O_RDONLY)
+
+    def regions(self):
+        regions = []
+        with open(f"/proc/{self.pid}/maps") as f:
+            for line in f:
+                fields = line.split(None, 5)
+                if fields[1][0] != 'r':
+                    continue
+                start, end = (int(value, 16) for value in fields[0].split('-'))
+                path = fields[5].strip() if len(fields) > 5 else ''
+                # Dateien (Wine-DLLs, libc) und Kernel-Seiten enthalten keinen JIT-Code
+                backed = bool(path) and not path.startswith(('[heap]', '[stack]', '[anon'))
+                regions.append(Region(start, end, 'x' in fields[1], backed))
+        return regions
+
+    def read(self, address, size):
+        return os.pread(self.fd, size, address)
+
+    def close(self):
+        os.close(self.fd)
+
+
+class WindowsMemory:
+    """Windows: VirtualQueryEx und ReadProcessMemory"""
+    PROCESS_VM_READ = 0x0010
+    PROCESS_QUERY_INFORMATION = 0x0400
+    MEM_COMMIT = 0x1000
+    MEM_PRIVATE = 0x20000
+    PAGE_GUARD = 0x100
+    READABLE = 0x02 | 0x04 | 0x08 | 0x20 | 0x40 | 0x80
+    EXECUTABLE = 0x10 | 0x20 | 0x40 | 0x80
+
+    def __init__(self, pid):
+        from ctypes import wintypes
+
+        fields = [('BaseAddress', ctypes.c_void_p), ('AllocationBase', ctypes.c_void_p),
+                  ('AllocationProtect', wintypes.DWORD)]
+        if ctypes.sizeof(ctypes.c_void_p) == 8:
+            fields.append(('PartitionId', wintypes.WORD))
+        fields += [('RegionSize', ctypes.c_size_t), ('State', wintypes.DWORD),
+                   ('Protect', wintypes.DWORD), ('Type', wintypes.DWORD)]
+        self.info_type = type('MEMORY_BASIC_INFORMATION', (ctypes.Structure,), {'_fields_': fields})
+
+        self.kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        self.kernel32.OpenProcess.restype = wintypes.HANDLE
+        self.kernel32.VirtualQueryEx.argtypes = [wintypes.HANDLE, ctypes.c_void_p,
+                                                 ctypes.POINTER(self.info_type), ctypes.c_size_t]
+        self.kernel32.VirtualQueryEx.restype = ctypes.c_size_t
+        self.kernel32.ReadProcessMemory.argtypes = [wintypes.HANDLE, ctypes.c_void_p, ctypes.c_void_p,
+                                                    ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t)]
+        self.kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        self.handle = self.kernel32.OpenProcess(self.PROCESS_VM_READ | self.PROCESS_QUERY_INFORMATION, False, pid)
+        if not self.handle:
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def regions(self):
+        regions = []
+        info = self.info_type()
+        address = 0
+        while self.kernel32.VirtualQueryEx(self.handle, address, ctypes.byref(info), ctypes.sizeof(info)):
+            start = info.BaseAddress or 0
+            end = start + info.RegionSize
+            if (info.State == self.MEM_COMMIT and info.Protect & self.READABLE
+                    and not info.Protect & self.PAGE_GUARD):
+                regions.append(Region(start, end, bool(info.Protect & self.EXECUTABLE),
+                                      info.Type != self.MEM_PRIVATE))
+            if end <= address:
+                break
+            address = end
+        return regions
+
+    def read(self, address, size):
+        buffer = ctypes.create_string_buffer(size)
+        read = ctypes.c_size_t()
+        if not self.kernel32.ReadProcessMemory(self.handle, address, buffer, size, ctypes.byref(read)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return buffer.raw[:read.value]
+
+    def close(self):
+        self.kernel32.CloseHandle(self.handle)
+
+
+def open_memory(pid):
+    return WindowsMemory(pid) if sys.platform == 'win32' else ProcMemory(pid)
+
+
+def scan(memory, signatures, chunk_size=CHUNK_SIZE):
+    """Durchsucht private, ausführbare Bereiche blockweise; endet, sobald alles gefunden ist"""
+    pending = {signature.name: signature for signature in signatures}
+    found = {}
+    scanned = 0
+    overlap = max(signature.size for signature in signatures) - 1
+    for region in memory.regions():
+        if region.backed or not region.executable:
+            continue
+        address = region.start
+        while address < region.end and pending:
+            try:
+                data = memory.read(address, min(chunk_size + overlap, region.end - address))
+            except OSError:
+                break
+            scanned += len(data)
+            for name, signature in list(pending.items()):
+                pos = signature.find(data)
+                if pos != -1:
+                    found[name] = address + pos
+                    del pending[name]
+            address += chunk_size
+        if not pending:
+            break
+    return found, scanned
+
+
+def _load_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_json(path, data):
+    with open(path + '.tmp', 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+def build_hash(exe_path):
+    """SHA-1 der osu!.exe, gemerkt nach Größe und mtime; osu! aktualisiert sich selbst"""
+    from core.integrity import hash_file
+    exe_path = os.path.abspath(exe_path)
+    st = os.stat(exe_path)
+    path = cache_path('gamestate', 'builds.json')
+    builds = _load_json(path)
+    known = builds.get(exe_path)
+    if known and known[:2] == [st.st_size, st.st_mtime_ns]:
+        return known[2]
+    digest = hash_file(exe_path)
+    builds[exe_path] = [st.st_size, st.st_mtime_ns, digest]
+    _save_json(path, builds)
+    return digest
+
+
+def load_addresses(build):
+    return _load_json(cache_path('gamestate', f"{build}.json")).get('addresses', {})
+
+
+def save_addresses(build, addresses):
+    _save_json(cache_path('gamestate', f"{build}.json"), {'build': build, 'addresses': addresses})
+
+
+class GameStateReader:
+    """Findet die Signaturen einmal und liest danach pro Abfrage nur wenige Bytes"""
+
+    def __init__(self, pid, exe_path=None, signatures=None, pointer_size=POINTER_SIZE, memory=None):
+        self.memory = memory or open_memory(pid)
+        self.signatures = {signature.name: signature for signature in (signatures or SIGNATURES)}
+        self.pointer_format = '<I' if pointer_size == 4 else '<Q'
+        self.build = None
+        if exe_path:
+            try:
+                self.build = build_hash(exe_path)
+            except OSError as e:
+                logger.warning(f"Could not hash {exe_path}, signature scan results will not be cached: {str(e)}")
+        self.addresses = {}
+        self.variables = {}
+        self.cached = False
+        self.cache_checked = False
+        self.scanned_bytes = 0
+        self.attach_ms = 0.0
+        self.beatmap = (None, 0, '')
+
+    def attach(self):
+        """True, wenn alle Signaturen aufgelöst sind; erneut aufrufen sucht nur die fehlenden"""
+        started = time.perf_counter()
+        if self.build and not self.cache_checked:
+            self.cache_checked = True
+            # Zwischengespeicherte Adressen nur übernehmen, wenn dort noch dieselben Bytes stehen
+            for name, address in load_addresses(self.build).items():
+                signature = self.signatures.get(name)
+                if signature is not None and signature.matches(self._read(address, signature.size) or b''):
+                    self.addresses[name] = address
+            self.cached = len(self.addresses) == len(self.signatures)
+        missing = [signature for name, signature in self.signatures.items() if name not in self.addresses]
+        if missing:
+            found, scanned = scan(self.memory, missing)
+            self.scanned_bytes += scanned
+            self.addresses.update(found)
+            if found and self.build:
+                save_addresses(self.build, self.addresses)
+        self.attach_ms = (time.perf_counter() - started) * 1000
+        log_event('gamestate.attach', self.attach_ms, cached=self.cached, found=len(self.addresses),
+                  scanned_mb=round(self.scanned_bytes / 1024 / 1024, 1))
+        return len(self.addresses) == len(self.signatures)
+
+    def _read(self, address, size):
+        try:
+            data = self.memory.read(address, size)
+        except (OSError, OverflowError, ValueError):
+            return None
+        return data if len(data) == size else None
+
+    def _unpack(self, fmt, address):
+        if not address:
+            return None
+        data = self._read(address, struct.calcsize(fmt))
+        return struct.unpack(fmt, data)[0] if data else None
+
+    def _pointer(self, address):
+        return self._unpack(self.pointer_format, address)
+
+    def _variable(self, name):
+        address = self.variables.get(name)
+        if address is None:
+            signature, offsets = VARIABLES[name]
+            base = self.addresses.get(signature)
+            if base is None:
+                return None
+            address = base + offsets[0]
+            for offset in offsets[1:]:
+                pointer = self._pointer(address)
+                # Vor der Initialisierung steht hier noch 0; beim nächsten poll erneut versuchen
+                if not pointer:
+                    return None
+                address = pointer + offset
+            self.variables[name] = address
+        return address
+
+    def _string(self, address):
+        """.NET-String: Länge bei +4, UTF-16 ab +8"""
+        length = self._unpack('<i', address + 4) if address else None
+        if length is None or not 0 <= length <= MAX_STRING:
+            return ''
+        data = self._read(address + 8, length * 2)
+        return data.decode('utf-16-le', 'replace') if data else ''
+
+    def poll(self):
+        status = self._unpack('<i', self._variable('status'))
+        mods = self._unpack('<i', self._variable('mods'))
+        beatmap = self._pointer(self._variable('beatmap'))
+        beatmap_id = self._unpack('<i', beatmap + BEATMAP_ID) if beatmap else None
+        # Den Titel nur nach einem Beatmap-Wechsel lesen
+        if (beatmap, beatmap_id) != self.beatmap[:2]:
+            title = self._string(self._pointer(beatmap + BEATMAP_TITLE)) if beatmap else ''
+            self.beatmap = (beatmap, beatmap_id, title)
+        return GameState(status, mods or 0, beatmap_id or 0, self.beatmap[2])
+
+    def close(self):
+        self.memory.close()
+
+
+class GameStateMonitor(threading.Thread):
+    """Fragt den Spielzustand in festem Takt ab und meldet nur Änderungen"""
+
+    def __init__(self, pid, exe_path=None, on_change=None, interval=POLL_INTERVAL, attach_delay=ATTACH_DELAY,
+                 attach_retry=ATTACH_RETRY, attach_attempts=ATTACH_ATTEMPTS, **reader_options):
+        super().__init__(name='GameStateMonitor', daemon=True)
+        self.pid = pid
+        self.exe_path = exe_path
+        self.on_change = on_change
+        self.interval = interval
+        self.attach_delay = attach_delay
+        self.attach_retry = attach_retry
+        self.attach_attempts = attach_attempts
+        self.reader_options = reader_options
+        self.reader = None
+        self.state = None
+        self.polls = 0
+        self.poll_cpu = 0.0
+        self.stop_event = threading.Event()
+
+    def run(self):
+        if self.stop_event.wait(self.attach_delay):
+            return
+        try:
+            self.reader = GameStateReader(self.pid, self.exe_path, **self.reader_options)
+        except OSError as e:
+            logger.warning(f"Live presence cannot read osu! memory: {str(e)}")
+            return
+        try:
+            try:
+                for _ in range(self.attach_attempts):
+                    if self.reader.attach() or self.stop_event.wait(self.attach_retry):
+                        break
+            except OSError as e:
+                # osu! wurde während der Suche beendet (/proc/<pid>/maps ist weg)
+                logger.info(f"Live presence stopped while attaching: {str(e)}")
+                return
+            if not self.reader.addresses:
+                logger.warning("Live presence: osu! game state not found, is this osu! stable?")
+                return
+            while not self.stop_event.is_set():
+                started = time.thread_time()
+                state = self.reader.poll()
+                self.poll_cpu += time.thread_time() - started
+                self.polls += 1
+                if state != self.state:
+                    self.state = state
+                    if self.on_change:
+                        self.on_change(state)
+                self.stop_event.wait(self.interval)
+        finally:
+            self.reader.close()
+            log_event('gamestate.session', self.poll_cpu * 1000, polls=self.polls,
+                      attach_ms=round(self.reader.attach_ms, 1), cached=self.reader.cached)
+
+    def stop(self, timeout=2.0):
+        self.stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from core.log import log_event
+from utils.helpers import cache_path
+
+# Qt-frei, läuft auch über "main.py verify"
+
+logger = logging.getLogger(__name__)
+
+# Nutzerinhalte: osu! löscht importierte .osz, Maps und Skins kommen und gehen
+SKIP_DIRS = {'logs', 'screenshots', 'exports', 'songs', 'skins', 'replays', 'data'}
+# Ändern sich bei jedem Spielstart; nur fehlend oder leer ist hier ein Befund
+VOLATILE_SUFFIXES = ('.db', '.cfg', '.log', '.osr')
+BATCH_BYTES = 64 * 1024 * 1024
+BATCH_FILES = 256
+# Darunter lohnt sich das Starten der Worker-Prozesse nicht
+POOL_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+
+def hash_file(path):
+    """SHA-1 über ein Read-only-Mapping; hashlib gibt dabei das GIL frei"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return hashlib.sha1().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha1(mm).hexdigest()
+
+
+def hash_batch(root, rels):
+    """Läuft im Worker-Prozess; Fehler werden zurückgegeben statt geworfen"""
+    results = []
+    for rel in rels:
+        try:
+            results.append((rel, hash_file(os.path.join(root, rel)), None))
+        except OSError as e:
+            results.append((rel, None, str(e)))
+    return results
+
+
+def scan(root):
+    """{relativer Pfad: (Größe, mtime_ns)} für alle Dateien außer SKIP_DIRS"""
+    files = {}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if directory != root or entry.name.lower() not in SKIP_DIRS:
+                    stack.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                rel = os.path.relpath(entry.path, root).replace(os.sep, '/')
+                files[rel] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def manifest_path(root):
+    key = hashlib.sha1(os.path.abspath(root).encode('utf-8')).hexdigest()[:16]
+    return cache_path('integrity', f"{key}.json")
+
+
+def load_manifest(root):
+    try:
+        with open(manifest_path(root)) as f:
+            manifest = json.load(f)
+        return manifest['files']
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return None
+
+
+def save_manifest(root, files):
+    path = manifest_path(root)
+    with open(path + '.tmp', 'w') as f:
+        json.dump({'root': os.path.abspath(root), 'verified': time.time(), 'files': files}, f)
+    os.replace(path + '.tmp', path)
+
+
+def batches(root, rels, stats):
+    batch, batch_bytes = [], 0
+    for rel in rels:
+        batch.append(rel)
+        batch_bytes += stats[rel][0]
+        if batch_bytes >= BATCH_BYTES or len(batch) >= BATCH_FILES:
+            yield batch
+            batch, batch_bytes = [], 0
+    if batch:
+        yield batch
+
+
+@dataclass
+class VerifyReport:
+    root: str
+    baseline: bool = False
+    missing: list = field(default_factory=list)
+    truncated: list = field(default_factory=list)
+    modified: list = field(default_factory=list)
+    corrupt: list = field(default_factory=list)
+    added: list = field(default_factory=list)
+    errors: dict = field(default_factory=dict)
+    files: int = 0
+    hashed_files: int = 0
+    hashed_bytes: int = 0
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self):
+        return not (self.missing or self.truncated or self.corrupt or self.errors)
+
+    def summary(self, limit=10):
+        lines = [f"{self.files} files checked, {self.hashed_files} hashed "
+                 f"({self.hashed_bytes / 1024 / 1024:.0f} MB) in {self.elapsed_ms / 1000:.2f} s"]
+        if self.baseline:
+            lines.append("No previous manifest: the current state was recorded as the baseline")
+        for label, paths in [("Missing", self.missing), ("Truncated", self.truncated),
+                             ("Corrupt (content changed, size and date did not)", self.corrupt),
+                             ("Modified since last verification", self.modified),
+                             ("Unreadable", sorted(self.errors))]:
+            if paths:
+                lines.append(f"{label}: {len(paths)}")
+                lines += [f"  {path}" for path in sorted(paths)[:limit]]
+                if len(paths) > limit:
+                    lines.append(f"  ... and {len(paths) - limit} more")
+        return "\n".join(lines)
+
+
+def is_volatile(rel):
+    return rel.lower().endswith(VOLATILE_SUFFIXES)
+
+
+def is_skipped(rel):
+    return rel.split('/', 1)[0].lower() in SKIP_DIRS
+
+
+def verify(root, full=False, accept=False, workers=None):
+    """Vergleicht die Installation mit dem letzten Manifest; hasht nur neue und geänderte Dateien.
+
+    full=True hasht alles und findet so auch Dateien, deren Inhalt sich ohne
+    neue Größe oder mtime geändert hat. Fehlende, gekürzte und beschädigte
+    Dateien bleiben mit ihrem alten Eintrag im Manifest, bis accept=True den
+    aktuellen Stand übernimmt.
+    """
+    started = time.perf_counter()
+    report = VerifyReport(root)
+    manifest = load_manifest(root)
+    report.baseline = manifest is None
+    # Ältere Manifeste enthalten noch Songs/Skins; die wären sonst für immer "Missing"
+    manifest = {rel: entry for rel, entry in (manifest or {}).items() if not is_skipped(rel)}
+    current = scan(root)
+    report.files = len(current)
+
+    for rel, (size, _, _) in manifest.items():
+        if rel not in current:
+            report.missing.append(rel)
+        elif current[rel][0] < size and (current[rel][0] == 0 or not is_volatile(rel)):
+            report.truncated.append(rel)
+
+    to_hash = [rel for rel, (size, mtime) in current.items()
+               if full or rel not in manifest or manifest[rel][:2] != [size, mtime]]
+    hashed_bytes = sum(current[rel][0] for rel in to_hash)
+    digests = {}
+    if hashed_bytes >= POOL_THRESHOLD_BYTES and len(to_hash) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for results in pool.map(hash_batch, [root] * len(to_hash), batches(root, to_hash, current)):
+                for rel, digest, error in results:
+                    if error:
+                        report.errors[rel] = error
+                    else:
+                        digests[rel] = digest
+    else:
+        for rel, digest, error in hash_batch(root, to_hash):
+            if error:
+                report.errors[rel] = error
+            else:
+                digests[rel] = digest
+
+    files = {}
+    for rel, (size, mtime) in current.items():
+        old = manifest.get(rel)
+        digest = digests.get(rel, old[2] if old else None)
+        if digest is None:
+            continue
+        files[rel] = [size, mtime, digest]
+        if old is None:
+            report.added.append(rel)
+        elif rel in report.truncated:
+            if not accept:
+                files[rel] = old
+        elif rel in digests and digest != old[2]:
+            if old[:2] == [size, mtime]:
+                report.corrupt.append(rel)
+                if not accept:
+                    files[rel] = old
+            elif not is_volatile(rel):
+                # Neue Größe/mtime: meist ein osu!-Update, einmal melden und übernehmen
+                report.modified.append(rel)
+    if not accept:
+        for rel in report.missing:
+            files[rel] = manifest[rel]
+
+    save_manifest(root, files)
+    report.hashed_files = len(digests)
+    report.hashed_bytes = hashed_bytes
+    report.elapsed_ms = (time.perf_counter() - started) * 1000
+    log_event('integrity.verify', report.elapsed_ms, files=report.files, hashed=report.hashed_files,
+              hashed_mb=round(hashed_bytes / 1024 / 1024, 1), missing=len(report.missing),
+              truncated=len(report.truncated), corrupt=len(report.corrupt), modified=len(report.modified))
+    return report
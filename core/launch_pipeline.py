@@ -0,0 +1,217 @@
+import logging
+import os
+import socket
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Callable
+
+from core.log import log_event
+from utils.osu_tools import find_osu_executable, build_osu_args
+
+# Qt-frei: Stages laufen in Worker-Threads, Ergebnisse gehen über Callbacks zurück
+
+logger = logging.getLogger(__name__)
+
+OK, FAILED, TIMEOUT, SKIPPED = 'ok', 'failed', 'timeout', 'skipped'
+
+SERVER_HOSTS = {
+    'eternityglow': 'c.eternityglow.de',
+    'bancho': 'c.ppy.sh',
+}
+WARM_FILES = ('osu!.db', 'collection.db', 'scores.db', 'osu!.cfg')
+WARM_LIMIT = 256 * 1024 * 1024
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable[[dict], object]
+    deps: tuple = ()
+    timeout: float = 5.0
+    # Schlägt eine Pflicht-Stage fehl, wird nicht gestartet; optionale werden nur protokolliert
+    required: bool = True
+
+
+@dataclass
+class StageResult:
+    status: str
+    start_ms: float = 0.0
+    duration_ms: float = 0.0
+    error: str = None
+    value: object = field(default=None, repr=False)
+
+
+class LaunchPipeline:
+    """Führt Stages als Abhängigkeitsgraph aus; unabhängige Stages laufen parallel"""
+
+    def __init__(self, stages, on_stage=None):
+        names = {stage.name for stage in stages}
+        for stage in stages:
+            missing = set(stage.deps) - names
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages {sorted(missing)}")
+        self.stages = {stage.name: stage for stage in stages}
+        self.on_stage = on_stage
+        self.results = {}
+
+    def run(self):
+        started = time.perf_counter()
+        values = {}
+        pending = dict(self.stages)
+        running = {}
+        pool = ThreadPoolExecutor(max_workers=len(self.stages), thread_name_prefix='LaunchStage')
+        try:
+            while pending or running:
+                self._submit_ready(pool, pending, running, values, started)
+                if not running:
+                    break
+                now = time.perf_counter()
+                next_deadline = min(begin + stage.timeout for stage, begin in running.values())
+                done, _ = wait(running, timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+                now = time.perf_counter()
+                for future in done:
+                    stage, begin = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        values[stage.name] = future.result()
+                        self._finish(stage, OK, begin, now, started, value=values[stage.name])
+                    else:
+                        self._finish(stage, FAILED, begin, now, started, error=error)
+                # Überfällige Stages aufgeben; der Thread läuft aus, sein Ergebnis wird ignoriert
+                for future, (stage, begin) in list(running.items()):
+                    if now - begin >= stage.timeout:
+                        del running[future]
+                        future.cancel()
+                        self._finish(stage, TIMEOUT, begin, now, started,
+                                     error=TimeoutError(f"{stage.name} took longer than {stage.timeout}s"))
+            for stage in pending.values():
+                self._finish(stage, SKIPPED, started, started, started)
+        finally:
+            pool.shutdown(wait=False)
+        return self.report(started)
+
+    def _submit_ready(self, pool, pending, running, values, started):
+        changed = True
+        while changed:
+            changed = False
+            for name, stage in list(pending.items()):
+                states = [self.results[dep].status if dep in self.results else None for dep in stage.deps]
+                if None in states:
+                    continue
+                del pending[name]
+                changed = True
+                if any(state != OK for state in states):
+                    now = time.perf_counter()
+                    self._finish(stage, SKIPPED, now, now, started)
+                    continue
+                running[pool.submit(stage.func, values)] = (stage, time.perf_counter())
+
+    def _finish(self, stage, status, begin, end, started, value=None, error=None):
+        result = StageResult(status, (begin - started) * 1000, (end - begin) * 1000,
+                             str(error) if error is not None else None, value)
+        self.results[stage.name] = result
+        if status not in (OK, SKIPPED) and not stage.required:
+            logger.warning(f"Optional launch stage {stage.name} {status}: {result.error}")
+        if self.on_stage:
+            self.on_stage(stage, result, error)
+
+    def critical_path(self, target):
+        """Längste Kette über die Abhängigkeiten von target, gemessen an den Laufzeiten"""
+        def walk(name):
+            stage = self.stages[name]
+            best = max((walk(dep) for dep in stage.deps), key=lambda chain: chain[0], default=(0.0, []))
+            return best[0] + self.results.get(name, StageResult(SKIPPED)).duration_ms, best[1] + [name]
+        return walk(target)
+
+    def report(self, started):
+        total_ms = (time.perf_counter() - started) * 1000
+        stages = {
+            name: {'status': r.status, 'start_ms': round(r.start_ms, 2),
+                   'duration_ms': round(r.duration_ms, 2), 'error': r.error}
+            for name, r in self.results.items()
+        }
+        report = {
+            'total_ms': round(total_ms, 2),
+            'sum_ms': round(sum(r.duration_ms for r in self.results.values()), 2),
+            'stages': stages,
+        }
+        if 'spawn' in self.results:
+            spawn = self.results['spawn']
+            length, chain = self.critical_path('spawn')
+            report.update(spawn_ms=round(spawn.start_ms + spawn.duration_ms, 2),
+                          critical_path=chain, critical_path_ms=round(length, 2))
+        log_event('launch.pipeline', total_ms, **{k: v for k, v in report.items() if k != 'total_ms'})
+        return report
+
+
+def resolve_stage(settings, osu_path=None):
+    def resolve(values):
+        path = osu_path or find_osu_executable(settings)
+        if not path:
+            raise FileNotFoundError("osu!.exe not found")
+        return path
+    return Stage('resolve', resolve, timeout=2.0)
+
+
+def validate_install(values):
+    path = values['resolve']
+    if not os.path.isfile(path) or os.path.getsize(path) == 0:
+        raise FileNotFoundError(f"{path} is not a valid osu! executable")
+    directory = os.path.dirname(path)
+    return {
+        'directory': directory,
+        'songs': os.path.isdir(os.path.join(directory, 'Songs')),
+        'writable': os.access(directory, os.W_OK),
+    }
+
+
+def probe_server(server, timeout=2.0):
+    host = SERVER_HOSTS.get(server, server)
+
+    def probe(values):
+        started = time.perf_counter()
+        with socket.create_connection((host, 443), timeout=timeout):
+            return {'host': host, 'connect_ms': round((time.perf_counter() - started) * 1000, 2)}
+    return probe
+
+
+def warm_files(values):
+    """Liest die Datenbanken einmal durch, damit osu! sie aus dem Page-Cache lädt"""
+    directory = os.path.dirname(values['resolve'])
+    warmed = 0
+    for name in (os.path.basename(values['resolve']),) + WARM_FILES:
+        path = os.path.join(directory, name)
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                while warmed < WARM_LIMIT:
+                    chunk = f.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    warmed += len(chunk)
+        except OSError:
+            continue
+    return {'bytes': warmed}
+
+
+def spawn(values):
+    path = values['resolve']
+    # Ohne Shell: Argumente gehen unverändert an osu!, keine cmd.exe dazwischen
+    return subprocess.Popen(values['args'], cwd=os.path.dirname(path) or None)
+
+
+def build_launch_stages(settings, server, osu_path=None, on_presence=None):
+    """Graph für einen osu!-Start; nur resolve -> validate/args -> spawn liegt auf dem kritischen Pfad"""
+    stages = [
+        resolve_stage(settings, osu_path),
+        Stage('validate', validate_install, deps=('resolve',), timeout=2.0),
+        Stage('args', lambda values: build_osu_args(values['resolve'], settings, server),
+              deps=('resolve',), timeout=1.0),
+        Stage('spawn', spawn, deps=('validate', 'args'), timeout=10.0),
+        Stage('probe', probe_server(server), timeout=3.0, required=False),
+        Stage('warm', warm_files, deps=('resolve',), timeout=15.0, required=False),
+    ]
+    if on_presence is not None:
+        stages.append(Stage('presence', lambda values: on_presence("Starting osu!"), timeout=1.0, required=False))
+    return stages
@@ -1,30 +1,74 @@
 import os
-import json
+import gc
+import threading
+import asyncio
+import importlib
+import re
 import sys
 import time
-import subprocess
-import psutil
 import logging
-import webbrowser
-import requests
 from PyQt6.QtWidgets import (
     QMainWindow, QVBoxLayout, QWidget, QPushButton,
     QStackedWidget, QTabWidget, QMessageBox, QProgressBar,
-    QGridLayout, QDialog, QFileDialog, QLabel
+    QGridLayout, QDialog, QFileDialog, QLabel, QApplication, QSystemTrayIcon
 )
-from PyQt6.QtGui import QPalette, QBrush, QPixmap, QIcon
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QPoint
-from core.settings import SettingsDialog
-from core.browser import BrowserTab
-from core.draggable_widgets import DraggableWidget
-from core.tablet_calculator import TabletAreaCalculator
+from PyQt6.QtGui import QPalette, QBrush, QPixmap, QPixmapCache, QShortcut, QKeySequence, QPainter
+from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint, QEvent, pyqtSignal
+from core.draggable_widgets import DraggableWidget, FloatingWidgets
 from core.translations import translations
 from core.discord_rpc import DiscordRPC
-from config import GITHUB_TOKEN, REPO, CURRENT_VERSION
+from core.log import log_event, timed
+from core.tracing import span, traced, mark
+from core.watchdog import StallWatchdog
+from core import pixel_cache
+from core.settings_diff import SettingsAppliers
+from core.scheduler import get_scheduler
+from core import settings_store
+from core import resources
+from core import animated_background
+from utils.osu_tools import find_osu_executable
 
-logging.basicConfig(filename='launcher.log', level=logging.DEBUG)
+# Erst nach dem ersten Frame im Hintergrund geladen, damit sie den Start nicht verzögern.
+# Nicht enthalten: core.browser, QtWebEngine wird erst beim ersten Web-Tab gebraucht
+PRELOAD_MODULES = (
+    'requests', 'psutil', 'pypresence', 'subprocess', 'webbrowser',
+    'config', 'core.settings', 'core.leaderboard', 'core.wiki', 'core.downloads',
+    'core.launch_pipeline', 'core.integrity', 'core.replays', 'core.tablet_calculator', 'core.tray',
+)
+
+GITHUB_API = os.environ.get('ETERNITYGLOW_GITHUB_API', 'https://api.github.com')
+WIKI_URL = "https://wiki.eternityglow.de/de/home"
+DEFAULT_BACKGROUND = "menu-background2x.jpg"
+# Lief osu! mindestens so lange, gilt die Installation als intakt und wird als Manifest festgehalten
+HEALTHY_SESSION_S = 60
+
+SIDEBAR_BUTTON_STYLE = """
+    QPushButton {
+        background: rgba(0,0,0,%(alpha)d);
+        color: white;
+        border: 2px solid #ff66aa;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 5px;
+        min-width: 150px;
+    }
+    QPushButton:hover {
+        background: rgba(255,102,170,150);
+        border-color: white;
+    }
+"""
 
 class Launcher(QMainWindow):
+    command_received = pyqtSignal(list)
+    osu_exited = pyqtSignal()
+    # Aus den Worker-Threads der Start-Pipeline zurück in den GUI-Thread
+    launch_stage_done = pyqtSignal(object, object, object)
+    presence_requested = pyqtSignal(str)
+    game_state_changed = pyqtSignal(str)
+    plays_changed = pyqtSignal()
+
+    @traced('Launcher.__init__')
     def __init__(self):
         super().__init__()
         self.current_language = 'en'
@@ -37,30 +81,95 @@ class Launcher(QMainWindow):
     def showEvent(self, event):
         """Wird beim Start des Launchers aufgerufen"""
         super().showEvent(event)
-        self.rpc.connect()
+        # Beim ersten Anzeigen verbindet paintEvent nach dem ersten Frame
+        if self.first_paint_done:
+            self.connect_rpc()
+        if not self.update_checked:
+            # Update-Check nach 2 Sekunden, die Anfrage läuft im asyncio-Thread des Schedulers
+            self.scheduler.once('update_check', 2000, self.fetch_latest_release,
+                                group='network', on_result=self.handle_release_info)
+        if self.animation is not None and not self.isMinimized():
+            self.animation.resume()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.animation is not None:
+            self.animation.pause()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and self.animation is not None:
+            if self.isMinimized():
+                self.animation.pause()
+            elif self.isVisible():
+                self.animation.resume()
+
+    def paintEvent(self, event):
+        if self.animation is not None and self.animation.frame is not None:
+            started = time.thread_time()
+            painter = QPainter(self)
+            painter.drawImage(0, 0, self.animation.frame)
+            painter.end()
+            self.animation.account_paint(time.thread_time() - started)
+        if self.first_paint_done:
+            return super().paintEvent(event)
+        with span('first_paint'):
+            super().paintEvent(event)
+        self.first_paint_done = True
+        mark('first_frame')
+        threading.Thread(target=self.preload_modules, name='Preload', daemon=True).start()
+        self.scheduler.once('rpc.connect', 0, self.connect_rpc)
+        self.scheduler.once('wiki.schedule', 2000, self.schedule_wiki_sync)
+        self.scheduler.once('replays.watch', 3000, self.start_replay_watcher)
+        # Plugins kosten den Start nichts: Manifeste erst nach dem ersten Frame, Code erst beim Klick
+        self.scheduler.once('plugins.discover', 0, self.add_plugin_buttons)
+
+    def connect_rpc(self):
+        if not self.rpc.connected:
+            with span('rpc.connect'):
+                self.rpc.connect()
         self.update_discord_status()
-        QTimer.singleShot(2000, self.check_for_updates)  # Update-Check nach 2 Sekunden
 
-    def check_for_updates(self):
-        """Prüft auf Updates im Hintergrund"""
+    def preload_modules(self):
+        """Importiert die verzögerten Module, bevor der Nutzer sie braucht"""
+        with timed('startup.preload') as event:
+            failed = []
+            for name in PRELOAD_MODULES:
+                try:
+                    importlib.import_module(name)
+                except Exception:
+                    failed.append(name)
+            event['failed'] = failed
+
+    async def fetch_latest_release(self):
+        """Fragt das neueste Release bei GitHub ab, ohne den GUI-Thread zu blockieren"""
+        import requests
+        from config import GITHUB_TOKEN, REPO
+        headers = {
+            "Authorization": f"token {GITHUB_TOKEN}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+        url = f"{GITHUB_API}/repos/{REPO}/releases/latest"
+
+        with timed('network.update_check', url=url) as event:
+            response = await asyncio.to_thread(requests.get, url, headers=headers, timeout=10)
+            event['status'] = response.status_code
+        response.raise_for_status()
+        return response.json()
+
+    def handle_release_info(self, data):
+        from config import CURRENT_VERSION
+        self.update_checked = True
         try:
-            headers = {
-                "Authorization": f"token {GITHUB_TOKEN}",
-                "Accept": "application/vnd.github.v3+json"
-            }
-            url = f"https://api.github.com/repos/{REPO}/releases/latest"
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
             if data["tag_name"] != CURRENT_VERSION:
                 self.show_update_dialog(data["assets"][0]["browser_download_url"])
-        except Exception as e:
+        except (KeyError, IndexError, TypeError) as e:
             logging.error(f"Update-Check fehlgeschlagen: {str(e)}")
 
     def show_update_dialog(self, download_url: str):
         """Zeigt den Update-Dialog an"""
+        import webbrowser
+        from config import CURRENT_VERSION
         msg = QMessageBox(self)
         msg.setWindowTitle(translations[self.current_language].get('update_available', 'Update verfügbar'))
         msg.setText(f"{translations[self.current_language].get('new_version', 'Neue Version')} {CURRENT_VERSION} {translations[self.current_language].get('available', 'verfügbar')}!")
@@ -93,6 +202,117 @@ class Launcher(QMainWindow):
             webbrowser.open(download_url)
             self.close()
 
+    def handle_command(self, command):
+        """Führt einen Befehl aus, den eine zweite Launcher-Instanz weitergeleitet hat"""
+        action, *args = command or ['show']
+        if action == 'play':
+            self.play(args[0] if args else None)
+            return
+
+        self.restore_window()
+        if action == 'leaderboard':
+            self.show_leaderboard()
+        elif action == 'wiki':
+            self.show_wiki()
+        elif action == 'recent':
+            self.show_recent_plays()
+        elif action == 'download':
+            self.show_downloads([arg for arg in args if arg.isdigit()])
+        elif action == 'settings':
+            self.show_settings()
+
+    def restore_window(self):
+        if self.in_tray:
+            self.exit_tray()
+        if self.isHidden() or self.isMinimized():
+            if self.settings.get('launcher', {}).get('fullscreen', True):
+                self.showFullScreen()
+            else:
+                self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def play(self, server=None):
+        """Startet osu!, aus dem Tray auch ohne das Fenster zu öffnen"""
+        if server:
+            self.selected_server = server.lower()
+        if not self.in_tray:
+            self.restore_window()
+        if self.play_btn.isEnabled():
+            self.start_osu()
+
+    def tray_enabled(self):
+        return (self.settings.get('launcher', {}).get('tray_mode', True)
+                and QSystemTrayIcon.isSystemTrayAvailable())
+
+    def enter_tray(self):
+        """Versteckt den Launcher im Tray und gibt alles frei, was bis zum nächsten Öffnen nicht gebraucht wird"""
+        if self.tray is None:
+            from core.tray import LauncherTray
+            self.tray = LauncherTray(self)
+        self.tray.set_playing(self.osu_process is not None)
+        self.tray.show()
+        # Schließt sich ein Dialog, während das Fenster versteckt ist, soll Qt nicht beenden
+        QApplication.instance().setQuitOnLastWindowClosed(False)
+        self.hide()
+        self.in_tray = True
+
+        # Keine Timer-Wakeups im Tray
+        self.scheduler.cancel('loading_bar')
+        self.scheduler.pause('ui', 'network', 'watchdog')
+        self.watchdog.pause()
+
+        # Caches trimmen: Browser-Tabs (Chromium-Renderer) und skalierter Hintergrund
+        while self.browser_tabs.count():
+            widget = self.browser_tabs.widget(0)
+            self.browser_tabs.removeTab(0)
+            widget.deleteLater()
+        self.show_main_page()
+        # Die Inhalte liegen im Festplatten-Cache, der Neuaufbau ist billig
+        for name in ('leaderboard', 'wiki_page', 'downloads_page', 'recent_page'):
+            page = getattr(self, name)
+            if page is not None:
+                self.main_container.removeWidget(page)
+                page.deleteLater()
+                setattr(self, name, None)
+        self.stop_animation()
+        self.setPalette(QPalette())
+        QPixmapCache.clear()
+        gc.collect()
+
+    def exit_tray(self):
+        self.in_tray = False
+        if self.tray:
+            self.tray.hide()
+        self.set_background()
+        self.watchdog.resume()
+        self.scheduler.resume('ui', 'network', 'watchdog')
+
+    def wait_for_osu(self, process):
+        # Blockierendes Warten statt Polling, damit im Tray keine Wakeups entstehen
+        process.wait()
+        self.osu_exited.emit()
+
+    def on_osu_exited(self):
+        process = self.osu_process
+        if process is not None and time.monotonic() - self.osu_started >= HEALTHY_SESSION_S:
+            self.record_install_manifest(os.path.dirname(process.args[0]))
+        self.osu_process = None
+        self.osu_pid = None
+        if self.downloads:
+            self.downloads.set_game_running(False)
+        if self.progress:
+            self.progress.hide()
+        self.play_btn.setEnabled(True)
+        if self.tray:
+            self.tray.set_playing(False)
+        if not self.in_tray:
+            self.scheduler.resume('ui', 'network')
+        self.refresh_recent_plays()
+        self.finish_telemetry()
+        self.stop_game_state()
+        self.update_discord_status()
+
     def update_discord_status(self, status="In Launcher"):
         """Aktualisiert den Discord Status"""
         details = {
@@ -113,35 +333,71 @@ class Launcher(QMainWindow):
         self.progress = None
         self.osu_process = None
         self.osu_pid = None
-        self.osu_check_timer = None
+        self.osu_started = None
+        self.scheduler = get_scheduler()
+        self.update_checked = False
+        self.launch_started = time.perf_counter()
+        self.first_paint_done = False
+        self.diagnostics = None
+        self.settings_dialog = None
+        self.leaderboard = None
+        self.wiki_mirror = None
+        self.wiki_page = None
+        self.downloads = None
+        self.downloads_page = None
+        self.intercepting_downloads = False
+        self.replay_index = None
+        self.replay_watcher = None
+        self.recent_page = None
+        self.telemetry = None
+        self.game_state = None
+        self.plugins = None
+        self.plugin_targets = {}
+        self.instance_server = None
+        self.tray = None
+        self.in_tray = False
+        self.background_size = None
+        self.animation = None
+        self.setup_settings_appliers()
+        self.command_received.connect(self.handle_command)
+        self.osu_exited.connect(self.on_osu_exited)
+        self.launch_stage_done.connect(self.on_launch_stage)
+        self.presence_requested.connect(self.update_discord_status)
+        self.game_state_changed.connect(self.on_game_state)
+        self.plays_changed.connect(self.refresh_recent_plays)
+        self.setup_watchdog()
+
+    def setup_watchdog(self):
+        threshold_ms = self.settings.get('diagnostics', {}).get('stall_threshold_ms', 500)
+        self.watchdog = StallWatchdog(threshold_ms)
+        self.watchdog.start()
+        # Heartbeat vom GUI-Thread; bleibt er aus, meldet der Watchdog einen Stall
+        self.scheduler.every('watchdog.heartbeat', max(50, threshold_ms // 4), self.watchdog.beat,
+                             group='watchdog', backoff=False)
 
     def load_settings(self):
-        try:
-            with open('launcher_settings.json', 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {
-                'language': 'en',
-                'launcher': {'fullscreen': True},
-                'osu': {'server': 'EternityGlow', 'force_fullscreen': True},
-                'background': {'enabled': False, 'path': ''},
-                'widget_positions': {'side_buttons': {'x': 1080, 'y': 650}}
-            }
+        return settings_store.load_settings()
 
+    @traced('Launcher.setup_ui')
     def setup_ui(self):
         self.setWindowTitle("EternityGlow Launcher")
-        self.setWindowIcon(QIcon("resources/eternityglow.ico"))
+        self.setWindowIcon(resources.icon("eternityglow.ico"))
         self.main_container = QStackedWidget()
         self.setCentralWidget(self.main_container)
         self.create_main_page()
         self.setup_browser_interface()
         self.load_widget_positions()
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=self.show_diagnostics)
 
+    @traced('Launcher.create_main_page')
     def create_main_page(self):
         self.main_page = QWidget()
         self.main_page.setObjectName("MainPage")
         self.main_layout = QGridLayout(self.main_page)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
+        # Verschiebbare Widgets liegen außerhalb des Grids, sonst setzt das Layout sie bei jedem Resize zurück
+        self.floating = FloatingWidgets(self.main_page)
+        self.floating.moved.connect(self.save_widget_positions)
         
         self.setup_play_button()
         self.setup_sidebar()
@@ -168,36 +424,43 @@ class Launcher(QMainWindow):
                 border-color: #888;
             }
         """)
-        self.play_btn.clicked.connect(self.start_osu)
+        self.play_btn.clicked.connect(lambda: self.start_osu())
         self.main_layout.addWidget(self.play_btn, 0, 0, alignment=Qt.AlignmentFlag.AlignCenter)
 
-    def start_osu(self):
+    def start_osu(self, osu_path=None):
+        """Startet die Start-Pipeline im Hintergrund; der GUI-Thread wartet auf keine Stage"""
+        from core.launch_pipeline import LaunchPipeline, build_launch_stages
+        if not isinstance(osu_path, str):
+            # Direkt an ein Signal gehängt käme hier z.B. checked=False an
+            osu_path = None
+        if osu_path is None:
+            self.launch_started = time.perf_counter()
         self.play_btn.setEnabled(False)
         self.show_loading_bar()
-        self.update_discord_status("Starting osu!")
-        
-        try:
-            osu_path = self.find_osu_executable()
+
+        stages = build_launch_stages(self.settings, self.selected_server, osu_path,
+                                     on_presence=self.presence_requested.emit)
+        pipeline = LaunchPipeline(stages, on_stage=self.launch_stage_done.emit)
+        threading.Thread(target=pipeline.run, name='LaunchPipeline', daemon=True).start()
+
+    def on_launch_stage(self, stage, result, error):
+        if result.status == 'ok':
+            if stage.name == 'spawn':
+                self.launch_osu(result.value)
+            return
+        if not stage.required or result.status == 'skipped':
+            return
+
+        if stage.name == 'resolve' and isinstance(error, FileNotFoundError):
+            # Nur der Dateidialog braucht den GUI-Thread; danach läuft die Pipeline erneut
+            osu_path = self.ask_osu_executable()
             if osu_path:
-                self.launch_osu(osu_path)
-                self.update_discord_status("Playing osu!")
-            else:
-                raise FileNotFoundError("osu!.exe not found")
-        except Exception as e:
-            self.update_discord_status("Launcher Error")
-            self.handle_osu_start_error(e)
+                self.start_osu(osu_path)
+                return
+        self.update_discord_status("Launcher Error")
+        self.handle_osu_start_error(error)
 
-    def find_osu_executable(self):
-        standard_paths = [
-            os.path.expanduser("~/AppData/Local/osu!/osu!.exe"),
-            "C:/Program Files/osu!/osu!.exe",
-            "C:/Program Files (x86)/osu!/osu!.exe"
-        ]
-        
-        for path in standard_paths:
-            if os.path.exists(path):
-                return path
-        
+    def ask_osu_executable(self):
         path, _ = QFileDialog.getOpenFileName(
             self,
             "Locate osu!.exe",
@@ -206,40 +469,90 @@ class Launcher(QMainWindow):
         )
         return path if path else None
 
-    def launch_osu(self, osu_path):
-        params = [osu_path]
-        if self.selected_server == "eternityglow":
-            params.extend(["-devserver", "eternityglow.de"])
-        
-        if self.settings.get('osu', {}).get('nomusic', False):
-            params.append("-nomusic")
-        if self.settings.get('osu', {}).get('novideo', False):
-            params.append("-novideo")
-        
-        params.append("-legacytablet")
-        if self.settings.get('osu', {}).get('force_fullscreen', True):
-            params.append("-fullscreen")
-        else:
-            params.append("-window")
-        
+    def launch_osu(self, process):
+        """Übernimmt den von der Pipeline gestarteten osu!-Prozess"""
         try:
-            self.osu_process = subprocess.Popen(params, shell=True)
+            self.osu_process = process
             self.osu_pid = self.osu_process.pid
-            self.osu_check_timer = QTimer(self)
-            self.osu_check_timer.timeout.connect(self.check_osu_process)
-            self.osu_check_timer.start(3000)
-            
-            QTimer.singleShot(2500, lambda: [
-                self.progress.setValue(100),
-                QTimer.singleShot(500, self.hide)
-            ])
+            self.osu_started = time.monotonic()
+            self.start_telemetry()
+            self.start_game_state(process)
+            self.update_discord_status("Playing osu!")
+            log_event('launch.spawn', (time.perf_counter() - self.launch_started) * 1000,
+                      server=self.selected_server, pid=self.osu_pid)
+            if self.downloads:
+                self.downloads.set_game_running(True)
+
+            if self.tray_enabled():
+                threading.Thread(target=self.wait_for_osu, args=(self.osu_process,), daemon=True).start()
+                after_launch = self.enter_tray
+            else:
+                self.scheduler.every('osu_check', 3000, self.check_osu_process, group='game')
+                after_launch = self.hide
+
+            self.scheduler.once('launch.finish', 2500, lambda: self.finish_loading_bar(after_launch), group='game')
         except Exception as e:
             self.handle_osu_start_error(e)
 
+    def start_telemetry(self):
+        """Optionaler Sampler für die Spielsitzung (Einstellungen > osu!)"""
+        if not self.settings.get('osu', {}).get('session_telemetry', False):
+            return
+        from core.telemetry import SessionSampler
+        self.telemetry = SessionSampler(self.osu_pid)
+        self.telemetry.start()
+
+    def finish_telemetry(self, show=True):
+        if self.telemetry is None:
+            return
+        from core.telemetry import finish_session, format_summary
+        report = finish_session(self.telemetry)
+        self.telemetry = None
+        if not show:
+            return
+        text = format_summary(report)
+        if self.in_tray and self.tray:
+            # Im Tray nur die Kurzfassung; die vollständige steht in der Diagnose (Strg+Shift+D)
+            self.tray.showMessage("osu! session", "\n".join(text.splitlines()[1:4]))
+        else:
+            box = QMessageBox(QMessageBox.Icon.Information, "osu! session", text,
+                              QMessageBox.StandardButton.Ok, self)
+            box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            # Nicht modal: die Zusammenfassung soll den Launcher nicht blockieren
+            box.open()
+
+    def start_game_state(self, process):
+        """Optionaler Live-Status aus dem Speicher von osu! für Discord (Einstellungen > osu!)"""
+        if not self.settings.get('osu', {}).get('live_presence', False):
+            return
+        from core.game_state import GameStateMonitor
+        exe_path = process.args[0] if isinstance(process.args, (list, tuple)) else None
+        self.game_state = GameStateMonitor(self.osu_pid, exe_path,
+                                           on_change=lambda state: self.game_state_changed.emit(state.presence()))
+        self.game_state.start()
+
+    def stop_game_state(self):
+        if self.game_state is not None:
+            self.game_state.stop()
+            self.game_state = None
+
+    def on_game_state(self, status):
+        # Bereits eingereihte Meldungen nach dem Beenden von osu! verwerfen
+        if self.game_state is not None:
+            self.update_discord_status(status)
+
+    def finish_loading_bar(self, then):
+        self.scheduler.cancel('loading_bar')
+        self.progress.setValue(100)
+        # Während osu! läuft, ruht alles, was nicht zum Spiel gehört
+        self.scheduler.pause('ui', 'network')
+        self.scheduler.once('launch.hide', 500, then, group='game')
+
     def check_osu_process(self):
         if not hasattr(self, 'osu_pid'):
             return
         
+        import psutil
         try:
             process = psutil.Process(self.osu_pid)
             if process.status() == psutil.STATUS_ZOMBIE or not process.is_running():
@@ -248,30 +561,90 @@ class Launcher(QMainWindow):
             self.restart_launcher()
 
     def restart_launcher(self):
-        if hasattr(self, 'osu_check_timer') and self.osu_check_timer:
-            self.osu_check_timer.stop()
-        
+        import subprocess
+        self.scheduler.cancel('osu_check')
+        # Die neue Instanz zeigt die gespeicherte Zusammenfassung in der Diagnose
+        self.finish_telemetry(show=False)
+        self.stop_game_state()
+
+        # Den Single-Instance-Socket vor dem Neustart freigeben, sonst leitet
+        # der neue Prozess nur an uns weiter und beendet sich
+        if self.instance_server:
+            self.instance_server.close()
+
         try:
             if sys.executable:
-                subprocess.Popen([sys.executable, *sys.argv])
+                # Ohne Befehlsargumente, sonst würde z.B. "play" osu! erneut starten
+                args = [sys.executable] if getattr(sys, 'frozen', False) else [sys.executable, sys.argv[0]]
+                subprocess.Popen(args)
         except Exception as e:
             print(f"Error restarting launcher: {e}")
         finally:
             self.close()
 
     def handle_osu_start_error(self, error):
+        self.scheduler.cancel('loading_bar')
         if self.progress:
             self.progress.hide()
         self.play_btn.setEnabled(True)
-        
-        QMessageBox.critical(
-            self,
-            "Error",
-            f"Failed to start osu!:\n{str(error)}",
-            QMessageBox.StandardButton.Ok
-        )
+
+        box = QMessageBox(QMessageBox.Icon.Critical, "Error", f"Failed to start osu!:\n{str(error)}",
+                          QMessageBox.StandardButton.Ok, self)
+        osu_path = find_osu_executable(self.settings)
+        verify_btn = None
+        if osu_path:
+            verify_btn = box.addButton("Verify installation", QMessageBox.ButtonRole.ActionRole)
+        box.exec()
+        if verify_btn is not None and box.clickedButton() is verify_btn:
+            self.verify_installation(os.path.dirname(osu_path))
+
+    def verify_installation(self, directory):
+        """Prüft die osu!-Installation im Hintergrund, nur geänderte Dateien werden gehasht"""
+        from core.integrity import verify
+
+        async def run():
+            try:
+                return await asyncio.to_thread(verify, directory), None
+            except Exception as e:
+                return None, e
+        self.scheduler.once('integrity.verify', 0, run, on_result=self.show_verify_report)
+
+    def record_install_manifest(self, directory):
+        """Nach einer erfolgreichen Sitzung den aktuellen Stand übernehmen, damit spätere Prüfungen eine Basis haben"""
+        from core.integrity import verify
+
+        async def run():
+            try:
+                await asyncio.to_thread(verify, directory, accept=True)
+            except Exception as e:
+                logging.warning(f"Recording the install manifest failed: {str(e)}")
+        # Nicht gleichzeitig mit dem Aufräumen nach dem Spielende
+        self.scheduler.once('integrity.record', 5000, run)
+
+    def show_verify_report(self, result):
+        report, error = result
+        if error is not None:
+            QMessageBox.warning(self, "Verify installation", f"Verification failed:\n{str(error)}")
+        elif report.ok:
+            QMessageBox.information(self, "Verify installation", report.summary())
+        else:
+            QMessageBox.warning(self, "Verify installation",
+                                report.summary() + "\n\nReinstall or repair the listed files in osu!.")
 
     def show_loading_bar(self):
+        if self.progress is None:
+            self.create_loading_bar()
+        self.progress.move(self.width()//2 - 200, self.height()//2 + 50)
+        self.progress.setValue(0)
+        self.progress.show()
+        self.scheduler.every('loading_bar', 50, self.advance_loading_bar, group='ui')
+
+    def advance_loading_bar(self):
+        self.progress.setValue(min(self.progress.value() + 2, 90))
+        if self.progress.value() >= 90:
+            self.scheduler.cancel('loading_bar')
+
+    def create_loading_bar(self):
         self.progress = QProgressBar(self)
         self.progress.setFixedSize(400, 20)
         self.progress.setStyleSheet("""
@@ -287,35 +660,39 @@ class Launcher(QMainWindow):
                 );
             }
         """)
-        self.progress.move(self.width()//2 - 200, self.height()//2 + 50)
-        self.progress.show()
-    
-        self.progress.setValue(0)
-        self.loading_timer = QTimer(self)
-        self.loading_timer.timeout.connect(
-            lambda: self.progress.setValue(min(self.progress.value() + 2, 90)))
-        self.loading_timer.start(50)
 
     def setup_sidebar(self):
         self.sidebar = DraggableWidget()
         self.sidebar.setObjectName("Sidebar")
-        self.sidebar.setFixedSize(200, 350)
+        self.sidebar.setFixedSize(200, 400)
         
-        sidebar_layout = QVBoxLayout(self.sidebar)
+        sidebar_layout = self.sidebar_layout = QVBoxLayout(self.sidebar)
         sidebar_layout.setContentsMargins(10, 10, 10, 10)
         sidebar_layout.setSpacing(10)
         
         buttons = [
-            ("Leaderboard", "https://eternityglow.de/leaderboard.php?id=100&mode=0"),
-            ("Wiki", "https://wiki.eternityglow.de/de/home"),
+            ("Leaderboard", None),
+            ("Wiki", None),
+            ("Downloads", None),
+            ("Recent Plays", None),
             ("Tablet Tool", None),
             ("Settings", None),
             ("Exit", None)
         ]
         
+        self.sidebar_buttons = []
         for text, url in buttons:
             btn = self.create_button(text, url)
-            if text == "Tablet Tool":
+            self.sidebar_buttons.append(btn)
+            if text == "Leaderboard":
+                btn.clicked.connect(self.show_leaderboard)
+            elif text == "Wiki":
+                btn.clicked.connect(self.show_wiki)
+            elif text == "Downloads":
+                btn.clicked.connect(lambda: self.show_downloads())
+            elif text == "Recent Plays":
+                btn.clicked.connect(self.show_recent_plays)
+            elif text == "Tablet Tool":
                 btn.clicked.connect(self.show_tablet_calculator)
             elif text == "Settings":
                 btn.clicked.connect(self.show_settings)
@@ -326,14 +703,68 @@ class Launcher(QMainWindow):
             
             sidebar_layout.addWidget(btn)
         
-        self.main_layout.addWidget(self.sidebar, 0, 0, 
-                                alignment=Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom)
+        # Standard: unten rechts, wie früher über die Grid-Ausrichtung
+        self.floating.add('side_buttons', self.sidebar, default=(1.0, 1.0))
+
+    def add_plugin_buttons(self):
+        """Sidebar-Einträge aus den Plugin-Manifesten, vor Settings und Exit"""
+        from core.plugins import PluginManager
+        self.plugins = PluginManager()
+        manifests = self.plugins.discover()
+        if not manifests:
+            return
+        percent = self.settings.get('opacity', 80)
+        for manifest in manifests:
+            btn = self.create_button(manifest.name)
+            btn.setStyleSheet(SIDEBAR_BUTTON_STYLE % {'alpha': round(255 * percent / 100)})
+            if manifest.description:
+                btn.setToolTip(manifest.description)
+            btn.clicked.connect(lambda _, plugin_id=manifest.id: self.open_plugin(plugin_id))
+            self.sidebar_layout.insertWidget(self.sidebar_layout.count() - 2, btn)
+            self.sidebar_buttons.append(btn)
+        self.sidebar.setFixedHeight(max(self.sidebar.height(), self.sidebar_layout.sizeHint().height()))
+        self.floating.place('side_buttons')
+
+    def open_plugin(self, plugin_id):
+        """Beim ersten Klick importiert; eine zurückgegebene Seite bleibt, eine Funktion läuft bei jedem Klick"""
+        if plugin_id not in self.plugin_targets:
+            try:
+                target = self.plugins.activate(plugin_id, self)
+            except Exception as e:
+                self.plugin_failed(plugin_id, e, "could not be loaded")
+                return
+            if target is None:
+                return
+            if isinstance(target, QWidget):
+                if hasattr(target, 'back_requested'):
+                    target.back_requested.connect(self.show_main_page)
+                self.main_container.addWidget(target)
+            self.plugin_targets[plugin_id] = target
+
+        target = self.plugin_targets[plugin_id]
+        if isinstance(target, QWidget):
+            self.update_discord_status(f"Viewing {self.plugins.manifests[plugin_id].name}")
+            self.main_container.setCurrentWidget(target)
+        elif callable(target):
+            # Eine Exception, die aus einem Slot entkommt, beendet unter PyQt6 den ganzen Launcher
+            try:
+                target()
+            except Exception as e:
+                self.plugin_failed(plugin_id, e, "failed")
+
+    def plugin_failed(self, plugin_id, error, what):
+        logging.exception(f"Plugin {plugin_id} {what}")
+        stats = self.plugins.stats.get(plugin_id)
+        if stats is not None:
+            stats.error = f"{type(error).__name__}: {str(error)}"
+        QMessageBox.warning(self, "Plugin", f"The plugin {plugin_id} {what}:\n{str(error)}")
 
     def show_tablet_calculator(self):
         try:
             if hasattr(self, 'calculator') and self.calculator:
                 self.calculator.close()
             
+            from core.tablet_calculator import TabletAreaCalculator
             self.calculator = TabletAreaCalculator()
             self.calculator.setWindowTitle("Tablet Area Tool")
             self.calculator.setStyleSheet(self.styleSheet())
@@ -354,35 +785,44 @@ class Launcher(QMainWindow):
                 QMessageBox.StandardButton.Ok
             )
 
+    def show_diagnostics(self):
+        """Versteckte Diagnoseseite (Strg+Shift+D oder --diagnostics)"""
+        from core.diagnostics import DiagnosticsDialog
+        if self.diagnostics is None:
+            self.diagnostics = DiagnosticsDialog(self)
+        else:
+            self.diagnostics.refresh()
+        self.diagnostics.show()
+        self.diagnostics.raise_()
+        self.diagnostics.activateWindow()
+
+    def get_settings_dialog(self):
+        """Der Dialog wird nur einmal gebaut; neu erst, wenn sich die Sprache geändert hat"""
+        from core.settings import SettingsDialog
+        language = self.settings.get('language', 'en')
+        with timed('settings.open') as event:
+            event['reused'] = self.settings_dialog is not None and self.settings_dialog.built_language == language
+            if not event['reused']:
+                if self.settings_dialog is not None:
+                    self.settings_dialog.deleteLater()
+                self.settings_dialog = SettingsDialog(self)
+            self.settings_dialog.reload()
+        return self.settings_dialog
+
     def show_settings(self):
         self.update_discord_status("Settings")
-        dialog = SettingsDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.settings = dialog.get_settings()
-            self.save_settings()
-            self.apply_settings()
+        dialog = self.get_settings_dialog()
+        # accept() speichert und wendet die Einstellungen bereits an
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            self.update_discord_status()
 
     def create_button(self, text, url=None):
         btn = QPushButton(text)
         btn.setFixedHeight(40)
-        btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(0,0,0,180);
-                color: white;
-                border: 2px solid #ff66aa;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 5px;
-                min-width: 150px;
-            }
-            QPushButton:hover {
-                background: rgba(255,102,170,150);
-                border-color: white;
-            }
-        """)
+        btn.setStyleSheet(SIDEBAR_BUTTON_STYLE % {'alpha': 180})
         return btn
 
+    @traced('Launcher.setup_browser_interface')
     def setup_browser_interface(self):
         self.browser_tabs = QTabWidget()
         self.browser_tabs.setTabsClosable(True)
@@ -424,11 +864,53 @@ class Launcher(QMainWindow):
                 self.show_browser_page()
                 return
         
+        with span('import core.browser'):
+            from core.browser import BrowserTab
         tab = BrowserTab(url)
+        if not self.intercepting_downloads:
+            tab.browser.page().profile().downloadRequested.connect(self.intercept_download)
+            self.intercepting_downloads = True
         title = url.split('//')[-1].split('/')[0]
         self.browser_tabs.addTab(tab, title)
         self.show_browser_page()
 
+    def get_download_manager(self):
+        """Downloads landen im Songs-Ordner neben osu!.exe; None, solange osu! nicht gefunden wurde"""
+        if self.downloads is None:
+            osu_path = find_osu_executable(self.settings)
+            if not osu_path:
+                return None
+            from core.downloads import DownloadManager
+            config = self.settings.get('downloads', {})
+            self.downloads = DownloadManager(
+                os.path.join(os.path.dirname(osu_path), 'Songs'),
+                workers=config.get('workers', 4),
+                rate=config.get('max_kbps', 0) * 1024 or None,
+                host_rate=config.get('host_kbps', 0) * 1024 or None)
+            self.downloads.set_game_running(self.osu_process is not None)
+        return self.downloads
+
+    def show_downloads(self, set_ids=()):
+        manager = self.get_download_manager()
+        if manager is None:
+            QMessageBox.warning(self, "Downloads", "osu! was not found, set its path in the settings first.")
+            return
+        manager.enqueue(set_ids)
+        if self.downloads_page is None:
+            from core.downloads import DownloadsPage
+            self.downloads_page = DownloadsPage(manager, self.scheduler)
+            self.downloads_page.back_requested.connect(self.show_main_page)
+            self.main_container.addWidget(self.downloads_page)
+        self.main_container.setCurrentWidget(self.downloads_page)
+
+    def intercept_download(self, request):
+        """Beatmap-Downloads aus den Browser-Tabs übernimmt der Download-Manager"""
+        match = re.search(r'(?:beatmapsets/|/d/|/s/)(\d+)', request.url().toString())
+        if match is None or self.get_download_manager() is None:
+            return
+        request.cancel()
+        self.show_downloads([int(match.group(1))])
+
     def close_tab(self, index):
         self.browser_tabs.removeTab(index)
         if self.browser_tabs.count() == 0:
@@ -444,68 +926,255 @@ class Launcher(QMainWindow):
     def show_browser_page(self):
         self.main_container.setCurrentIndex(1)
 
+    def show_leaderboard(self):
+        """Native Rangliste statt leaderboard.php im Browser-Tab"""
+        self.update_discord_status("Viewing Leaderboard")
+        if self.leaderboard is None:
+            from core.leaderboard import LeaderboardPage
+            self.leaderboard = LeaderboardPage()
+            self.leaderboard.back_requested.connect(self.show_main_page)
+            self.main_container.addWidget(self.leaderboard)
+        self.leaderboard.activate()
+        self.main_container.setCurrentWidget(self.leaderboard)
+
+    def get_wiki_mirror(self):
+        from core.wiki import WikiMirror
+        if self.wiki_mirror is None:
+            self.wiki_mirror = WikiMirror()
+        return self.wiki_mirror
+
+    def schedule_wiki_sync(self):
+        """Hält den Offline-Spiegel des Wikis aktuell; beim allerersten Start sofort"""
+        from core.wiki import schedule_sync
+        mirror = self.get_wiki_mirror()
+        first_delay = 5000 if mirror.page_count() == 0 else 60_000
+        schedule_sync(mirror, WIKI_URL, first_delay, on_result=self.wiki_synced)
+
+    def wiki_synced(self, stats):
+        if self.wiki_page is not None:
+            self.wiki_page.sync_finished(stats)
+
+    def show_wiki(self):
+        """Wiki aus dem lokalen Spiegel; nicht gespiegelte Seiten öffnen weiterhin im Browser-Tab"""
+        self.update_discord_status("Viewing Wiki")
+        if self.wiki_page is None:
+            from core.wiki import WikiPage
+            self.wiki_page = WikiPage(WIKI_URL, self.get_wiki_mirror())
+            self.wiki_page.back_requested.connect(self.show_main_page)
+            self.wiki_page.open_online.connect(self.open_web_tab)
+            self.main_container.addWidget(self.wiki_page)
+        self.wiki_page.activate()
+        self.main_container.setCurrentWidget(self.wiki_page)
+
+    def start_replay_watcher(self):
+        """Indexiert neue Replays und Screenshots ereignisgesteuert, auch während osu! läuft"""
+        if self.replay_watcher is not None:
+            self.replay_watcher.stop()
+            self.replay_watcher = None
+        osu_path = find_osu_executable(self.settings)
+        if not osu_path:
+            return
+        from core.replays import ReplayIndex, ReplayWatcher
+        if self.replay_index is None:
+            self.replay_index = ReplayIndex()
+        # Der Watcher ruft aus seinem Thread; das Signal bringt die Meldung in den GUI-Thread
+        self.replay_watcher = ReplayWatcher(os.path.dirname(osu_path), self.replay_index,
+                                            on_change=self.plays_changed.emit)
+        self.replay_watcher.start()
+
+    def apply_replay_dir(self, diff):
+        # Beim Start übernimmt der Timer nach dem ersten Frame
+        if not diff.initial:
+            self.start_replay_watcher()
+
+    def apply_download_dir(self, diff):
+        """Der DownloadManager hält den Songs-Ordner fest; beim nächsten Download neu anlegen"""
+        if diff.initial or self.downloads is None:
+            return
+        # Laufende Downloads brechen ab, ihre .part-Dateien werden später fortgesetzt
+        self.downloads.shutdown()
+        self.downloads = None
+        if self.downloads_page is not None:
+            if self.main_container.currentWidget() is self.downloads_page:
+                self.show_main_page()
+            self.main_container.removeWidget(self.downloads_page)
+            self.downloads_page.deleteLater()
+            self.downloads_page = None
+
+    def refresh_recent_plays(self):
+        if self.recent_page is not None and self.recent_page.isVisible():
+            self.recent_page.refresh()
+
+    def show_recent_plays(self):
+        if self.replay_index is None:
+            from core.replays import ReplayIndex
+            self.replay_index = ReplayIndex()
+        self.update_discord_status("Viewing Recent Plays")
+        if self.recent_page is None:
+            from core.replays import RecentPlaysPage
+            self.recent_page = RecentPlaysPage(self.replay_index)
+            self.recent_page.back_requested.connect(self.show_main_page)
+            self.main_container.addWidget(self.recent_page)
+        self.main_container.setCurrentWidget(self.recent_page)
+        self.recent_page.refresh()
+
+    def setup_settings_appliers(self):
+        """Jedes Teilsystem reagiert nur auf Änderungen seiner eigenen Schlüssel"""
+        self.settings_appliers = SettingsAppliers()
+        self.settings_appliers.register('window_mode', ['launcher.fullscreen'], self.apply_window_mode)
+        self.settings_appliers.register('background', ['background'], lambda diff: self.set_background())
+        self.settings_appliers.register('server', ['osu.server'], self.apply_server)
+        self.settings_appliers.register('opacity', ['opacity'], self.apply_opacity)
+        self.settings_appliers.register('language', ['language'], self.apply_language)
+        self.settings_appliers.register('replays', ['osu.path'], self.apply_replay_dir)
+        self.settings_appliers.register('downloads', ['osu.path'], self.apply_download_dir)
+
+    @traced('Launcher.apply_settings')
     def apply_settings(self):
-        if self.settings.get('launcher', {}).get('fullscreen', True):
-            self.showFullScreen()
-        else:
-            self.showNormal()
-        
+        return self.settings_appliers.apply(self.settings)
+
+    def apply_window_mode(self, diff):
+        if self.in_tray:
+            return  # restore_window übernimmt den Modus beim nächsten Öffnen
+        with span('showFullScreen/showNormal'):
+            if self.settings.get('launcher', {}).get('fullscreen', True):
+                self.showFullScreen()
+            else:
+                self.showNormal()
+        # Der Hintergrund folgt der neuen Fenstergröße über resizeEvent
+
+    def apply_server(self, diff):
         self.selected_server = self.settings.get('osu', {}).get('server', 'bancho').lower()
-        self.set_background()
+        if not diff.initial:
+            self.update_discord_status()
 
+    def apply_opacity(self, diff):
+        percent = self.settings.get('opacity', 80)
+        self.sidebar.set_opacity(percent)
+        for btn in self.sidebar_buttons:
+            btn.setStyleSheet(SIDEBAR_BUTTON_STYLE % {'alpha': round(255 * percent / 100)})
+
+    def apply_language(self, diff):
+        self.current_language = self.settings.get('language', 'en')
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if not self.in_tray and self.background_size is not None and self.background_size != self.size():
+            self.set_background()
+
+    @traced('Launcher.set_background')
     def set_background(self):
         bg_config = self.settings.get('background', {})
-        if bg_config.get('enabled', False) and os.path.exists(bg_config.get('path', '')):
-            bg_path = bg_config['path']
-        else:
-            bg_path = "resources/menu-background2x.jpg"
+        self.background_size = self.size()
+        self.stop_animation()
         
         try:
+            if bg_config.get('enabled', False) and os.path.exists(bg_config.get('path', '')):
+                bg_path = bg_config['path']
+                if animated_background.is_animated(bg_path):
+                    self.start_animation(bg_path)
+                    return
+                source_id, load = pixel_cache.source_hash(bg_path), lambda: QPixmap(bg_path)
+            else:
+                source_id = resources.source_id(DEFAULT_BACKGROUND)
+                load = lambda: resources.pixmap(DEFAULT_BACKGROUND)
+
             palette = QPalette()
-            palette.setBrush(
-                QPalette.ColorRole.Window,
-                QBrush(QPixmap(bg_path).scaled(
-                    self.size(),
-                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                    Qt.TransformationMode.SmoothTransformation
-                )))
+            palette.setBrush(QPalette.ColorRole.Window, QBrush(self.scaled_background(source_id, load, bg_config)))
             self.setPalette(palette)
         except Exception:
             palette = QPalette()
             palette.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.black)
             self.setPalette(palette)
 
+    def start_animation(self, path):
+        """Animierter Hintergrund: Frames kommen vom Decoder-Thread, gezeichnet wird in paintEvent"""
+        palette = QPalette()
+        palette.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.black)
+        self.setPalette(palette)
+        self.animation = animated_background.AnimatedBackground(
+            path, self.size(), self.devicePixelRatioF(), parent=self)
+        self.animation.frame_changed.connect(self.update)
+        self.animation.ended.connect(self.on_animation_ended)
+        self.animation.start()
+        if self.isHidden() or self.isMinimized():
+            self.animation.pause()
+
+    def on_animation_ended(self):
+        # Ohne einen einzigen Frame auf das Standardbild zurückfallen, sonst bleibt der letzte stehen
+        if self.animation is None or self.animation.frame is not None:
+            return
+        self.stop_animation()
+        try:
+            background = self.scaled_background(resources.source_id(DEFAULT_BACKGROUND),
+                                                lambda: resources.pixmap(DEFAULT_BACKGROUND),
+                                                self.settings.get('background', {}))
+            palette = QPalette()
+            palette.setBrush(QPalette.ColorRole.Window, QBrush(background))
+            self.setPalette(palette)
+        except Exception as e:
+            logging.error(f"Default background failed: {str(e)}")
+        self.update()
+
+    def stop_animation(self):
+        if self.animation is not None:
+            self.animation.stop()
+            self.animation.deleteLater()
+            self.animation = None
+
+    def scaled_background(self, source_id, load, bg_config):
+        """Skaliertes Hintergrundbild, bei Cache-Treffer ohne Dekodieren direkt aus dem Pixel-Cache"""
+        key = pixel_cache.cache_key(
+            source_id, self.width(), self.height(), self.devicePixelRatioF(),
+            variant=f"{bg_config.get('enabled', False)}|{bg_config.get('path', '')}")
+        with span('pixel_cache.load'):
+            pixmap = pixel_cache.load_pixmap(key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = load().scaled(
+            self.size(),
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        if not pixmap.isNull():
+            pixel_cache.store_pixmap(key, pixmap)
+        return pixmap
+
     def save_widget_positions(self):
-        if hasattr(self, 'sidebar'):
-            self.settings['widget_positions'] = {
-                'side_buttons': {
-                    'x': self.sidebar.x(),
-                    'y': self.sidebar.y()
-                }
-            }
-            self.save_settings()
+        if not self.settings.get('launcher', {}).get('save_positions', True):
+            return
+        self.settings['widget_positions'] = self.floating.positions()
+        self.save_settings()
 
     def load_widget_positions(self):
-        positions = self.settings.get('widget_positions', {})
-        if 'side_buttons' in positions and hasattr(self, 'sidebar'):
-            pos = positions['side_buttons']
-            self.sidebar.move(pos['x'], pos['y'])
+        self.floating.load(self.settings.get('widget_positions', {}))
 
     def save_settings(self):
-        with open('launcher_settings.json', 'w') as f:
-            json.dump(self.settings, f, indent=4)
+        settings_store.save_settings(self.settings)
 
     def closeEvent(self, event):
         try:
-            if hasattr(self, 'osu_check_timer') and self.osu_check_timer:
-                self.osu_check_timer.stop()
-            
             if hasattr(self, 'calculator') and self.calculator:
                 self.calculator.close()
             
             self.save_widget_positions()
+            self.stop_animation()
+            if self.downloads:
+                self.downloads.shutdown()
+            if self.replay_watcher:
+                self.replay_watcher.stop()
+            self.stop_game_state()
             self.rpc.close()
+            log_event('scheduler.session', **self.scheduler.stats())
+            self.scheduler.shutdown()
+            self.watchdog.stop()
+            if self.instance_server:
+                self.instance_server.close()
+            if self.tray:
+                self.tray.hide()
         except Exception as e:
             logging.error(f"Error during close: {str(e)}")
         finally:
-            super().closeEvent(event)
\ No newline at end of file
+            super().closeEvent(event)
+            QApplication.instance().quit()
\ No newline at end of file
@@ -0,0 +1,330 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox,
+    QLabel, QTableView, QHeaderView, QAbstractItemView
+)
+
+from core.log import timed
+from core.scheduler import get_scheduler
+from utils.helpers import cache_path
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 100
+CACHE_TTL = 300
+SORT = 'pp'
+
+# bancho.py-kompatible Modi: 0-3 vanilla, 4-6 relax, 8 autopilot
+MODES = [
+    (0, "osu!"), (1, "osu!taiko"), (2, "osu!catch"), (3, "osu!mania"),
+    (4, "osu! relax"), (5, "osu!taiko relax"), (6, "osu!catch relax"), (8, "osu! autopilot"),
+]
+
+COLUMNS = ["#", "Player", "Country", "PP", "Accuracy", "Plays"]
+
+PAGE_STYLE = """
+    QWidget#LeaderboardPage {
+        background: rgba(0,0,0,150);
+    }
+    QTableView {
+        background: rgba(0,0,0,160);
+        alternate-background-color: rgba(255,102,170,25);
+        color: white;
+        gridline-color: transparent;
+        border: 1px solid rgba(255,102,170,80);
+        selection-background-color: rgba(255,102,170,150);
+    }
+    QHeaderView::section {
+        background: rgba(0,0,0,200);
+        color: #ff66aa;
+        font-weight: bold;
+        border: none;
+        padding: 6px;
+    }
+    QLabel {
+        color: white;
+    }
+    QComboBox, QPushButton {
+        background: rgba(0,0,0,180);
+        color: white;
+        border: 2px solid #ff66aa;
+        border-radius: 8px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background: rgba(255,102,170,150);
+        border-color: white;
+    }
+"""
+
+
+def api_url():
+    return os.environ.get('ETERNITYGLOW_LEADERBOARD_API', 'https://api.eternityglow.de')
+
+
+class LeaderboardClient:
+    """Holt Ranglisten-Seiten als JSON und cacht sie auf der Platte (TTL + ETag)"""
+
+    def __init__(self, base_url=None, ttl=CACHE_TTL):
+        self.base_url = (base_url or api_url()).rstrip('/')
+        self.ttl = ttl
+        self.session = None
+        self.lock = threading.Lock()
+        self.stats = {'fresh': 0, 'revalidated': 0, 'fetched': 0, 'stale': 0}
+
+    def _cache_file(self, mode, offset):
+        return cache_path('leaderboard', f"{mode}-{SORT}-{offset}-{PAGE_SIZE}.json")
+
+    def _read_cache(self, path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_cache(self, path, entry):
+        with open(path + '.tmp', 'w') as f:
+            json.dump(entry, f)
+        os.replace(path + '.tmp', path)
+
+    def get_page(self, mode, offset, force=False):
+        """Liefert die Zeilen ab offset; innerhalb der TTL ohne Netzwerkzugriff, außer bei force"""
+        path = self._cache_file(mode, offset)
+        cached = self._read_cache(path)
+        if cached and not force and time.time() - cached['fetched'] < self.ttl:
+            self.stats['fresh'] += 1
+            return cached['rows']
+
+        import requests
+        with self.lock:
+            if self.session is None:
+                self.session = requests.Session()
+        headers = {'Accept': 'application/json'}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        url = f"{self.base_url}/v1/get_leaderboard"
+        params = {'mode': mode, 'sort': SORT, 'limit': PAGE_SIZE, 'offset': offset}
+
+        try:
+            with timed('network.leaderboard', mode=mode, offset=offset) as event:
+                response = self.session.get(url, params=params, headers=headers, timeout=10)
+                event['status'] = response.status_code
+            if response.status_code == 304 and cached:
+                self.stats['revalidated'] += 1
+                cached['fetched'] = time.time()
+                self._write_cache(path, cached)
+                return cached['rows']
+            response.raise_for_status()
+            rows = response.json().get('leaderboard', [])
+        except Exception as e:
+            if cached:
+                # Lieber veraltete Daten als eine leere Tabelle
+                self.stats['stale'] += 1
+                logger.warning(f"Leaderboard fetch failed, using cached page: {str(e)}")
+                return cached['rows']
+            raise
+
+        self.stats['fetched'] += 1
+        self._write_cache(path, {'fetched': time.time(), 'etag': response.headers.get('ETag'), 'rows': rows})
+        return rows
+
+
+def _row_values(rank, entry):
+    """Formatiert einmal beim Laden, damit data() beim Scrollen nur nachschlägt"""
+    acc = entry.get('acc', 0) or 0
+    return (
+        f"#{rank}",
+        str(entry.get('name', '?')),
+        str(entry.get('country', '')).upper(),
+        f"{entry.get('pp', 0):,}pp",
+        f"{acc:.2f}%",
+        f"{entry.get('plays', 0):,}",
+    )
+
+
+class LeaderboardModel(QAbstractTableModel):
+    """Lädt Seiten erst, wenn die Ansicht ans Ende scrollt; jeder Modus behält seine Seiten"""
+    loading_changed = pyqtSignal(bool)
+    load_failed = pyqtSignal(str)
+
+    def __init__(self, client=None, parent=None):
+        super().__init__(parent)
+        self.client = client or LeaderboardClient()
+        self.scheduler = get_scheduler()
+        self.mode = 0
+        self.rows_by_mode = {}
+        self.exhausted = set()
+        self.loading = None
+        # Ergebnisse aus der Zeit vor einem refresh() werden verworfen
+        self.generation = 0
+        self.forced = set()
+
+    @property
+    def rows(self):
+        return self.rows_by_mode.setdefault(self.mode, [])
+
+    def set_mode(self, mode):
+        if mode == self.mode:
+            return
+        self.beginResetModel()
+        self.mode = mode
+        self.endResetModel()
+        if not self.rows and self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def refresh(self):
+        """Verwirft die Seiten des aktuellen Modus und fragt den Server trotz TTL erneut (ETag)"""
+        self.beginResetModel()
+        self.rows_by_mode[self.mode] = []
+        self.exhausted.discard(self.mode)
+        self.generation += 1
+        self.forced.add(self.mode)
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() != 1:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.mode not in self.exhausted and self.loading is None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        mode, offset, generation = self.mode, len(self.rows), self.generation
+        force = mode in self.forced
+        self.loading = (mode, offset)
+        self.loading_changed.emit(True)
+
+        async def fetch():
+            try:
+                entries = await asyncio.to_thread(self.client.get_page, mode, offset, force)
+                return mode, offset, generation, entries, None
+            except Exception as e:
+                return mode, offset, generation, None, str(e)
+
+        self.scheduler.once(f"leaderboard.{mode}.{offset}", 0, fetch, group='network', on_result=self._on_page)
+
+    def _on_page(self, result):
+        mode, offset, generation, entries, error = result
+        self.loading = None
+        self.loading_changed.emit(False)
+        current = generation == self.generation
+        if error is not None and current and mode == self.mode:
+            self.load_failed.emit(error)
+            return
+        if error is None and current:
+            # Nur die erste Seite nach refresh() geht am TTL-Cache vorbei
+            self.forced.discard(mode)
+            self.append_page(mode, offset, entries)
+        # Refresh oder Moduswechsel während des Ladens: canFetchMore war da False, also jetzt nachholen
+        if not self.rows or mode != self.mode or not current:
+            if self.canFetchMore(QModelIndex()):
+                self.fetchMore(QModelIndex())
+
+    def append_page(self, mode, offset, entries):
+        rows = self.rows_by_mode.setdefault(mode, [])
+        if offset != len(rows):
+            return
+        if len(entries) < PAGE_SIZE:
+            self.exhausted.add(mode)
+        if not entries:
+            return
+        new_rows = [_row_values(offset + i + 1, entry) for i, entry in enumerate(entries)]
+        if mode != self.mode:
+            rows.extend(new_rows)
+            return
+        self.beginInsertRows(QModelIndex(), offset, offset + len(new_rows) - 1)
+        rows.extend(new_rows)
+        self.endInsertRows()
+
+
+class LeaderboardPage(QWidget):
+    back_requested = pyqtSignal()
+
+    def __init__(self, client=None, parent=None):
+        super().__init__(parent)
+        self.setObjectName("LeaderboardPage")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        self.model = LeaderboardModel(client, self)
+        self.init_ui()
+        self.model.loading_changed.connect(self.update_status)
+        self.model.load_failed.connect(self.show_error)
+        self.model.rowsInserted.connect(lambda *_: self.update_status(False))
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        header = QHBoxLayout()
+        back_btn = QPushButton("Back to Launcher")
+        back_btn.clicked.connect(self.back_requested.emit)
+        self.mode_combo = QComboBox()
+        for mode, name in MODES:
+            self.mode_combo.addItem(name, mode)
+        self.mode_combo.currentIndexChanged.connect(
+            lambda _: self.model.set_mode(self.mode_combo.currentData()))
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.model.refresh)
+        self.status_label = QLabel()
+
+        header.addWidget(back_btn)
+        header.addWidget(self.mode_combo)
+        header.addWidget(refresh_btn)
+        header.addStretch()
+        header.addWidget(self.status_label)
+
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setAlternatingRowColors(True)
+        self.view.setShowGrid(False)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.view.setWordWrap(False)
+        # Feste Zeilenhöhen: die Ansicht muss für 100k Zeilen keine sizeHints abfragen
+        rows = self.view.verticalHeader()
+        rows.hide()
+        rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(30)
+        columns = self.view.horizontalHeader()
+        columns.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        columns.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        for column, width in [(0, 90), (2, 90), (3, 120), (4, 110), (5, 110)]:
+            columns.resizeSection(column, width)
+
+        layout.addLayout(header)
+        layout.addWidget(self.view)
+        self.setStyleSheet(PAGE_STYLE)
+
+    def activate(self):
+        if not self.model.rows and self.model.canFetchMore():
+            self.model.fetchMore()
+
+    def update_status(self, loading):
+        count = len(self.model.rows)
+        self.status_label.setText("Loading..." if loading else f"{count:,} players")
+
+    def show_error(self, error):
+        self.status_label.setText(f"Could not load the leaderboard: {error}")
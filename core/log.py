@@ -0,0 +1,93 @@
+import atexit
+import json
+import logging
+import queue
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from core import tracing
+
+LOG_FILE = 'launcher.log'
+PERF_LOG_FILE = 'launcher_perf.jsonl'
+MAX_BYTES = 2 * 1024 * 1024
+BACKUP_COUNT = 3
+PERF_LOGGER_NAME = 'eternityglow.perf'
+
+perf_logger = logging.getLogger(PERF_LOGGER_NAME)
+_listener = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats performance events as one JSON object per line"""
+
+    def format(self, record):
+        event = {'ts': round(record.created, 6), 'event': record.getMessage()}
+        event.update(getattr(record, 'perf', {}))
+        return json.dumps(event, separators=(',', ':'), default=str)
+
+
+def _is_perf_record(record):
+    return record.name == PERF_LOGGER_NAME
+
+
+def _is_text_record(record):
+    return record.name != PERF_LOGGER_NAME
+
+
+def setup_logging(level=logging.DEBUG):
+    """Routes all logging through a queue to rotating files written on a background thread"""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    file_handler = RotatingFileHandler(
+        LOG_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding='utf-8', delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    file_handler.addFilter(_is_text_record)
+
+    perf_handler = RotatingFileHandler(
+        PERF_LOG_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding='utf-8', delay=True)
+    perf_handler.setFormatter(JsonLinesFormatter())
+    perf_handler.addFilter(_is_perf_record)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, file_handler, perf_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """Flushes pending records and stops the writer thread"""
+    global _listener
+    if _listener is None:
+        return
+    # write_trace wurde per atexit vor uns registriert und liefe erst nach dem Listener;
+    # seine Log-Zeile ginge sonst verloren
+    tracing.write_trace()
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def log_event(name, duration_ms=None, **fields):
+    """Writes a structured timing event to the JSON-lines channel"""
+    if duration_ms is not None:
+        fields['duration_ms'] = round(duration_ms, 3)
+    perf_logger.info(name, extra={'perf': fields})
+
+
+@contextmanager
+def timed(name, **fields):
+    """Measures the wrapped block and reports it via log_event"""
+    start = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        log_event(name, (time.perf_counter() - start) * 1000, **fields)
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+
+from PyQt6 import sip
+from PyQt6.QtGui import QImage, QPixmap
+from utils.helpers import cache_path
+
+logger = logging.getLogger(__name__)
+
+# Rohe ARGB32-Pixel gefolgt von einem Trailer, damit die Pixel bei Offset 0 liegen
+TRAILER = struct.Struct('<4sIIIQ')
+MAGIC = b'EGPX'
+FORMAT = QImage.Format.Format_ARGB32_Premultiplied
+MAX_ENTRIES = 2
+
+_sources_lock = threading.Lock()
+
+
+def _sources_file():
+    return cache_path('pixels', 'sources.json')
+
+
+def source_hash(path):
+    """SHA-1 of the source image, recomputed only when size or mtime change"""
+    st = os.stat(path)
+    stamp = [st.st_size, st.st_mtime_ns]
+    with _sources_lock:
+        try:
+            with open(_sources_file()) as f:
+                sources = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            sources = {}
+        entry = sources.get(os.path.abspath(path))
+        if entry and entry['stamp'] == stamp:
+            return entry['sha1']
+
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        sources[os.path.abspath(path)] = {'stamp': stamp, 'sha1': digest}
+        with open(_sources_file(), 'w') as f:
+            json.dump(sources, f)
+        return digest
+
+
+def cache_key(source_id, width, height, dpr, variant=''):
+    raw = f"{source_id}|{width}x{height}@{dpr:.3f}|{variant}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _entry_path(key):
+    return cache_path('pixels', f"{key}.argb")
+
+
+def load_pixmap(key):
+    """Maps a cached entry straight into a QImage; returns None on a miss"""
+    try:
+        with open(_entry_path(key), 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+
+    try:
+        magic, width, height, bytes_per_line, size = TRAILER.unpack_from(mm, len(mm) - TRAILER.size)
+        if magic != MAGIC or size != bytes_per_line * height or size + TRAILER.size != len(mm):
+            return None
+        pointer = sip.voidptr(mm)
+        image = QImage(pointer, width, height, bytes_per_line, FORMAT)
+        # fromImage kopiert die Pixel, danach kann das Mapping geschlossen werden
+        pixmap = QPixmap.fromImage(image)
+        del image, pointer
+        return pixmap
+    except (struct.error, ValueError):
+        return None
+    finally:
+        try:
+            mm.close()
+        except BufferError:
+            pass
+
+
+def store_pixmap(key, pixmap):
+    """Writes the pixmap as raw premultiplied pixels on a background thread"""
+    image = pixmap.toImage().convertToFormat(FORMAT)
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    data = ptr.asstring()
+    trailer = TRAILER.pack(MAGIC, image.width(), image.height(), image.bytesPerLine(), len(data))
+    threading.Thread(target=_write_entry, args=(key, data, trailer), daemon=True).start()
+
+
+def _write_entry(key, data, trailer):
+    path = _entry_path(key)
+    try:
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+            f.write(trailer)
+        os.replace(path + '.tmp', path)
+        _prune(keep=path)
+    except OSError as e:
+        logger.error(f"Writing pixel cache failed: {str(e)}")
+
+
+def _prune(keep):
+    directory = os.path.dirname(keep)
+    entries = sorted(
+        (os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.argb')),
+        key=os.path.getmtime, reverse=True)
+    for path in entries[MAX_ENTRIES:]:
+        if path != keep:
+            os.remove(path)
+
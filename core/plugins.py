@@ -0,0 +1,189 @@
+import importlib
+import json
+import logging
+import os
+import re
+import sys
+import time
+import types
+from dataclasses import dataclass, field
+
+from core.log import log_event
+from utils.helpers import app_dir
+
+# Qt-frei: Entdecken liest nur Manifeste, Plugin-Code wird erst beim ersten Klick importiert
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = 'eternityglow.plugins'
+MANIFEST_NAME = 'plugin.json'
+# Optionales Manifest in der Distribution eines Entry-Point-Plugins
+DIST_MANIFEST_NAME = 'eternityglow_plugin.json'
+PACKAGE_PREFIX = 'eternityglow_plugins'
+ID_PATTERN = re.compile(r'^[a-z][a-z0-9_]*$')
+
+
+def plugin_dirs():
+    extra = os.environ.get('ETERNITYGLOW_PLUGIN_DIR')
+    return [extra] if extra else [os.path.join(app_dir(), 'plugins')]
+
+
+@dataclass
+class PluginManifest:
+    id: str
+    name: str
+    entry: str
+    source: str
+    path: str = None
+    description: str = ''
+    order: int = 100
+    entry_point: object = field(default=None, repr=False)
+
+
+@dataclass
+class PluginStats:
+    load_ms: float = 0.0
+    activate_ms: float = 0.0
+    rss_kb: int = 0
+    modules: int = 0
+    error: str = None
+
+
+def _rss():
+    import psutil
+    return psutil.Process().memory_info().rss
+
+
+class PluginManager:
+    """Findet Plugins über Entry Points und den plugins-Ordner; lädt sie einzeln auf Anforderung"""
+
+    def __init__(self, directories=None, group=ENTRY_POINT_GROUP):
+        self.directories = plugin_dirs() if directories is None else directories
+        self.group = group
+        self.manifests = {}
+        self.targets = {}
+        self.stats = {}
+
+    def discover(self):
+        started = time.perf_counter()
+        found = {}
+        for manifest in self._from_directories() + self._from_entry_points():
+            if manifest.id in found:
+                logger.warning(f"Plugin {manifest.id} is installed twice, using {found[manifest.id].source}")
+                continue
+            found[manifest.id] = manifest
+        self.manifests = found
+        log_event('plugins.discover', (time.perf_counter() - started) * 1000, count=len(found))
+        return sorted(found.values(), key=lambda m: (m.order, m.name.lower()))
+
+    def _from_directories(self):
+        manifests = []
+        for directory in self.directories:
+            try:
+                entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+            except OSError:
+                continue
+            for entry in entries:
+                path = os.path.join(entry.path, MANIFEST_NAME)
+                if not entry.is_dir() or not os.path.isfile(path):
+                    continue
+                try:
+                    with open(path, encoding='utf-8') as f:
+                        data = json.load(f)
+                    manifests.append(self._manifest(data, entry.name, 'directory', entry.path))
+                except KeyError as e:
+                    logger.warning(f"Ignoring plugin in {entry.path}: {MANIFEST_NAME} has no {e} field")
+                except (OSError, ValueError, TypeError) as e:
+                    logger.warning(f"Ignoring plugin in {entry.path}: {str(e)}")
+        return manifests
+
+    def _from_entry_points(self):
+        from importlib.metadata import entry_points
+        manifests = []
+        try:
+            points = entry_points(group=self.group)
+        except Exception as e:
+            logger.warning(f"Could not read plugin entry points: {str(e)}")
+            return manifests
+        for point in points:
+            # Nur Metadaten lesen; point.load() würde das Plugin sofort importieren
+            data = {}
+            text = point.dist.read_text(DIST_MANIFEST_NAME) if point.dist is not None else None
+            if text:
+                try:
+                    data = json.loads(text)
+                except ValueError as e:
+                    logger.warning(f"Invalid {DIST_MANIFEST_NAME} for plugin {point.name}: {str(e)}")
+            data.setdefault('name', point.name.replace('_', ' ').title())
+            data['entry'] = point.value
+            try:
+                manifest = self._manifest(data, point.name, 'entry_point')
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring plugin entry point {point.name}: {str(e)}")
+                continue
+            manifest.entry_point = point
+            manifests.append(manifest)
+        return manifests
+
+    def _manifest(self, data, default_id, source, path=None):
+        plugin_id = str(data.get('id', default_id)).lower()
+        if not ID_PATTERN.match(plugin_id):
+            raise ValueError(f"invalid plugin id {plugin_id!r}")
+        entry = data['entry']
+        if ':' not in entry:
+            raise ValueError(f"entry {entry!r} must look like 'module:function'")
+        return PluginManifest(plugin_id, str(data['name']), entry, source, path,
+                              str(data.get('description', '')), int(data.get('order', 100)))
+
+    def _import(self, manifest):
+        if manifest.entry_point is not None:
+            return manifest.entry_point.load()
+        module_name, _, attr = manifest.entry.partition(':')
+        # Jedes Verzeichnis-Plugin wird ein eigenes Paket, damit relative Importe funktionieren
+        if PACKAGE_PREFIX not in sys.modules:
+            root = types.ModuleType(PACKAGE_PREFIX)
+            root.__path__ = []
+            sys.modules[PACKAGE_PREFIX] = root
+        package = f"{PACKAGE_PREFIX}.{manifest.id}"
+        if package not in sys.modules:
+            module = types.ModuleType(package)
+            module.__path__ = [manifest.path]
+            sys.modules[package] = module
+        target = importlib.import_module(f"{package}.{module_name}")
+        for part in attr.split('.'):
+            target = getattr(target, part)
+        return target
+
+    def load(self, plugin_id):
+        """Importiert den Einstiegspunkt einmalig und misst Zeit, Speicher und neue Module"""
+        if plugin_id in self.targets:
+            return self.targets[plugin_id]
+        manifest = self.manifests[plugin_id]
+        stats = self.stats.setdefault(plugin_id, PluginStats())
+        modules, rss = len(sys.modules), _rss()
+        started = time.perf_counter()
+        try:
+            target = self._import(manifest)
+        except Exception as e:
+            stats.error = f"{type(e).__name__}: {str(e)}"
+            log_event('plugin.load', (time.perf_counter() - started) * 1000, plugin=plugin_id, error=stats.error)
+            raise
+        stats.load_ms = (time.perf_counter() - started) * 1000
+        stats.rss_kb = (_rss() - rss) // 1024
+        stats.modules = len(sys.modules) - modules
+        stats.error = None
+        self.targets[plugin_id] = target
+        log_event('plugin.load', stats.load_ms, plugin=plugin_id, rss_kb=stats.rss_kb, modules=stats.modules)
+        return target
+
+    def activate(self, plugin_id, *args):
+        """Lädt das Plugin (falls nötig) und ruft den Einstiegspunkt auf"""
+        target = self.load(plugin_id)
+        stats = self.stats[plugin_id]
+        rss = _rss()
+        started = time.perf_counter()
+        result = target(*args)
+        stats.activate_ms = (time.perf_counter() - started) * 1000
+        stats.rss_kb += (_rss() - rss) // 1024
+        log_event('plugin.activate', stats.activate_ms, plugin=plugin_id, rss_kb=stats.rss_kb)
+        return result
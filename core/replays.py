@@ -0,0 +1,590 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from datetime import datetime
+
+from PyQt6.QtCore import Qt, QObject, QUrl, QFileSystemWatcher, QTimer, pyqtSignal
+from PyQt6.QtGui import QDesktopServices
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox,
+    QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+
+from core.log import log_event
+from utils.helpers import cache_path
+
+logger = logging.getLogger(__name__)
+
+# Data/r: lokale Replays, die osu! nach jedem Spiel ablegt; Replays: exportierte
+REPLAY_DIRS = ('Data/r', 'Replays')
+SCREENSHOT_DIR = 'Screenshots'
+SCREENSHOT_SUFFIXES = ('.png', '.jpg', '.jpeg')
+REPLAY, SCREENSHOT = 'replay', 'screenshot'
+HEADER_CHUNK = 256
+RECENT_LIMIT = 50
+
+# .NET-Ticks (100 ns seit 0001-01-01) bis zur Unix-Epoche
+TICKS_EPOCH = 621355968000000000
+
+MODE_NAMES = {0: "osu!", 1: "taiko", 2: "catch", 3: "mania"}
+MOD_NAMES = [
+    (1, 'NF'), (2, 'EZ'), (4, 'TD'), (8, 'HD'), (16, 'HR'), (32, 'SD'), (64, 'DT'),
+    (128, 'RX'), (256, 'HT'), (512, 'NC'), (1024, 'FL'), (2048, 'AT'), (4096, 'SO'),
+    (8192, 'AP'), (16384, 'PF'),
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plays (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    played_at REAL NOT NULL,
+    mode INTEGER,
+    version INTEGER,
+    beatmap_md5 TEXT,
+    player TEXT,
+    replay_md5 TEXT,
+    count_300 INTEGER, count_100 INTEGER, count_50 INTEGER,
+    count_geki INTEGER, count_katu INTEGER, count_miss INTEGER,
+    score INTEGER,
+    max_combo INTEGER,
+    perfect INTEGER,
+    mods INTEGER
+);
+CREATE INDEX IF NOT EXISTS plays_recent ON plays (kind, played_at DESC);
+"""
+
+
+class _HeaderReader:
+    """Liest in kleinen Blöcken und überspringt große Felder per seek"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = b''
+        self.pos = 0
+        self.bytes_read = 0
+
+    def take(self, n):
+        while len(self.buf) - self.pos < n:
+            chunk = self.f.read(HEADER_CHUNK)
+            if not chunk:
+                raise ValueError("replay header is truncated")
+            self.bytes_read += len(chunk)
+            self.buf = self.buf[self.pos:] + chunk
+            self.pos = 0
+        data = self.buf[self.pos:self.pos + n]
+        self.pos += n
+        return data
+
+    def skip(self, n):
+        available = len(self.buf) - self.pos
+        if n <= available:
+            self.pos += n
+            return
+        self.f.seek(n - available, os.SEEK_CUR)
+        self.buf, self.pos = b'', 0
+
+    def unpack(self, fmt):
+        values = struct.unpack('<' + fmt, self.take(struct.calcsize('<' + fmt)))
+        return values if len(values) > 1 else values[0]
+
+    def uleb128(self):
+        value = shift = 0
+        while True:
+            byte = self.take(1)[0]
+            value |= (byte & 0x7f) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+
+    def string(self, skip=False):
+        marker = self.take(1)[0]
+        if marker == 0x00:
+            return None
+        if marker != 0x0b:
+            raise ValueError(f"invalid string marker {marker:#x}")
+        length = self.uleb128()
+        if skip:
+            self.skip(length)
+            return None
+        return self.take(length).decode('utf-8', errors='replace')
+
+
+def read_osr_header(path):
+    """Kopf einer .osr-Datei; Lebensbalken und die LZMA-Replaydaten werden nie gelesen"""
+    with open(path, 'rb', buffering=0) as f:
+        reader = _HeaderReader(f)
+        header = {'mode': reader.unpack('B'), 'version': reader.unpack('i')}
+        header['beatmap_md5'] = reader.string()
+        header['player'] = reader.string()
+        header['replay_md5'] = reader.string()
+        (header['count_300'], header['count_100'], header['count_50'],
+         header['count_geki'], header['count_katu'], header['count_miss']) = reader.unpack('6H')
+        header['score'] = reader.unpack('i')
+        header['max_combo'] = reader.unpack('H')
+        header['perfect'] = reader.unpack('B')
+        header['mods'] = reader.unpack('i')
+        reader.string(skip=True)
+        ticks = reader.unpack('q')
+        header['played_at'] = (ticks - TICKS_EPOCH) / 10_000_000
+        header['header_bytes'] = reader.bytes_read
+    return header
+
+
+def accuracy(play):
+    """Genauigkeit in Prozent nach den Formeln der vier Modi"""
+    n300, n100, n50 = play['count_300'], play['count_100'], play['count_50']
+    geki, katu, miss = play['count_geki'], play['count_katu'], play['count_miss']
+    mode = play['mode']
+    if mode == 1:
+        total, hit = n300 + n100 + miss, n300 + n100 * 0.5
+    elif mode == 2:
+        total, hit = n300 + n100 + n50 + katu + miss, n300 + n100 + n50
+    elif mode == 3:
+        total = geki + n300 + katu + n100 + n50 + miss
+        hit = (300 * (geki + n300) + 200 * katu + 100 * n100 + 50 * n50) / 300
+    else:
+        total, hit = n300 + n100 + n50 + miss, n300 + n100 / 3 + n50 / 6
+    return 100.0 * hit / total if total else 0.0
+
+
+def mods_text(mods):
+    names = [name for bit, name in MOD_NAMES if mods & bit]
+    # NC enthält DT, PF enthält SD
+    if 'NC' in names:
+        names.remove('DT')
+    if 'PF' in names:
+        names.remove('SD')
+    return ''.join(names) or 'NM'
+
+
+def watched_dirs(osu_dir):
+    return [os.path.join(osu_dir, *rel.split('/')) for rel in REPLAY_DIRS + (SCREENSHOT_DIR,)]
+
+
+def kind_of(path):
+    name = path.lower()
+    if name.endswith('.osr'):
+        return REPLAY
+    if name.endswith(SCREENSHOT_SUFFIXES):
+        return SCREENSHOT
+    return None
+
+
+class ReplayIndex:
+    """Persistenter Index der Replays und Screenshots, damit die Liste ohne Scan sofort da ist"""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or cache_path('replays', 'index.sqlite')
+        self._local = threading.local()
+        self.stats = {'indexed': 0, 'header_bytes': 0, 'failed': 0}
+        with self._connect() as db:
+            db.executescript(SCHEMA)
+
+    def _connect(self):
+        # Der Watcher-Thread schreibt, die Oberfläche liest; WAL hält beide auseinander
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.db_path)
+            db.row_factory = sqlite3.Row
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def add(self, path):
+        """Nimmt eine Datei auf; True, wenn sich der Index geändert hat"""
+        kind = kind_of(path)
+        if kind is None:
+            return False
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return self.remove(path)
+        db = self._connect()
+        row = db.execute("SELECT size, mtime_ns FROM plays WHERE path = ?", (path,)).fetchone()
+        if row is not None and (row['size'], row['mtime_ns']) == (st.st_size, st.st_mtime_ns):
+            return False
+
+        values = {'path': path, 'kind': kind, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                  'played_at': st.st_mtime_ns / 1e9}
+        if kind == REPLAY:
+            try:
+                header = read_osr_header(path)
+            except (OSError, ValueError, struct.error) as e:
+                # Meist noch im Schreiben; der nächste Event oder der Abgleich beim Start holt es nach
+                self.stats['failed'] += 1
+                logger.debug(f"Could not read replay header of {path}: {str(e)}")
+                return False
+            self.stats['header_bytes'] += header.pop('header_bytes')
+            values.update(header)
+        columns = ', '.join(values)
+        with db:
+            db.execute(f"INSERT OR REPLACE INTO plays ({columns}) VALUES ({', '.join('?' * len(values))})",
+                       tuple(values.values()))
+        self.stats['indexed'] += 1
+        return True
+
+    def remove(self, path):
+        with self._connect() as db:
+            return db.execute("DELETE FROM plays WHERE path = ?", (path,)).rowcount > 0
+
+    def reconcile(self, directories):
+        """Einmaliger Abgleich beim Start: holt Dateien nach, die ohne laufenden Launcher entstanden sind"""
+        started = time.perf_counter()
+        seen, changed = set(), 0
+        for directory in directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_file() and kind_of(entry.name):
+                    seen.add(entry.path)
+                    changed += self.add(entry.path)
+        db = self._connect()
+        prefixes = tuple(os.path.join(directory, '') for directory in directories)
+        stale = [path for (path,) in db.execute("SELECT path FROM plays")
+                 if path.startswith(prefixes) and path not in seen]
+        with db:
+            db.executemany("DELETE FROM plays WHERE path = ?", [(path,) for path in stale])
+        log_event('replays.reconcile', (time.perf_counter() - started) * 1000,
+                  files=len(seen), changed=changed, removed=len(stale))
+        return changed + len(stale)
+
+    def recent(self, kind=REPLAY, limit=RECENT_LIMIT):
+        rows = self._connect().execute(
+            "SELECT * FROM plays WHERE kind = ? ORDER BY played_at DESC LIMIT ?", (kind, limit))
+        return [dict(row) for row in rows]
+
+    def count(self, kind=REPLAY):
+        return self._connect().execute("SELECT COUNT(*) FROM plays WHERE kind = ?", (kind,)).fetchone()[0]
+
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct('iIII')
+FILE_EVENTS = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE
+PARENT_EVENTS = IN_CREATE | IN_MOVED_TO
+
+
+def _libc():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, 'inotify_init1'):
+        return None
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+class InotifyWatcher(threading.Thread):
+    """Blockiert im select() auf dem inotify-Deskriptor; ohne neue Dateien keine Wakeups"""
+
+    def __init__(self, directories, on_file, on_overflow=None):
+        super().__init__(name='ReplayWatcher', daemon=True)
+        self.libc = _libc()
+        if self.libc is None:
+            raise OSError("inotify is not available")
+        self.directories = list(directories)
+        self.on_file = on_file
+        self.on_overflow = on_overflow
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.stop_r, self.stop_w = os.pipe()
+        self.watches = {}
+        # Fehlende Ordner (z.B. Screenshots vor dem ersten F12) über den Elternordner abwarten
+        self.waiting = {}
+        for directory in self.directories:
+            self._watch(directory)
+
+    def _add_watch(self, path, mask):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            return None
+        self.watches[wd] = path
+        return wd
+
+    def _watch(self, directory):
+        if self._add_watch(directory, FILE_EVENTS) is not None:
+            return True
+        parent = os.path.dirname(directory)
+        self.waiting.setdefault(parent, set()).add(os.path.basename(directory))
+        if parent not in self.watches.values():
+            self._add_watch(parent, PARENT_EVENTS)
+        return False
+
+    def run(self):
+        try:
+            while True:
+                readable, _, _ = select.select([self.fd, self.stop_r], [], [])
+                if self.stop_r in readable:
+                    return
+                self._read_events()
+        except Exception as e:
+            logger.error(f"Replay watcher stopped: {str(e)}")
+        finally:
+            os.close(self.fd)
+            os.close(self.stop_r)
+
+    def _read_events(self):
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                if self.on_overflow:
+                    self.on_overflow()
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_ISDIR:
+                if name in self.waiting.get(directory, ()):
+                    self.waiting[directory].discard(name)
+                    if self._watch(os.path.join(directory, name)) and self.on_overflow:
+                        # Dateien, die vor dem Watch im neuen Ordner gelandet sind
+                        self.on_overflow()
+                continue
+            if directory in self.waiting and name not in self.waiting[directory]:
+                # Elternordner (osu!-Verzeichnis) wird nur für neue Unterordner beobachtet
+                continue
+            self.on_file(os.path.join(directory, name))
+
+    def stop(self):
+        if self.stop_w is not None:
+            os.write(self.stop_w, b'x')
+            os.close(self.stop_w)
+            self.stop_w = None
+
+
+class QtDirectoryWatcher(QObject):
+    """Fallback ohne inotify (Windows, macOS): Qt meldet Ordneränderungen, neue Namen per Vergleich"""
+
+    def __init__(self, directories, on_file, on_overflow=None, parent=None):
+        super().__init__(parent)
+        self.on_file = on_file
+        self.on_overflow = on_overflow
+        self.known = {}
+        # Wie bei inotify: fehlende Ordner über den Elternordner abwarten
+        self.waiting = {}
+        self.watcher = QFileSystemWatcher(self)
+        for directory in directories:
+            self._watch(directory)
+        self.watcher.directoryChanged.connect(self.directory_changed)
+
+    def _watch(self, directory):
+        if os.path.isdir(directory) and self.watcher.addPath(directory):
+            self.known[directory] = self._names(directory)
+            return True
+        parent = os.path.dirname(directory)
+        self.waiting.setdefault(parent, set()).add(os.path.basename(directory))
+        if parent not in self.watcher.directories():
+            self.watcher.addPath(parent)
+        return False
+
+    def _names(self, directory):
+        try:
+            return set(os.listdir(directory))
+        except OSError:
+            return set()
+
+    def directory_changed(self, directory):
+        for name in list(self.waiting.get(directory, ())):
+            child = os.path.join(directory, name)
+            if os.path.isdir(child):
+                self.waiting[directory].discard(name)
+                if self._watch(child) and self.on_overflow:
+                    # Dateien, die vor dem Watch im neuen Ordner gelandet sind
+                    self.on_overflow()
+        if directory in self.waiting and not self.waiting[directory]:
+            del self.waiting[directory]
+            if directory not in self.known:
+                self.watcher.removePath(directory)
+        if directory not in self.known:
+            # Elternordner (osu!-Verzeichnis) wird nur für neue Unterordner beobachtet
+            return
+
+        names = self._names(directory)
+        previous = self.known[directory]
+        self.known[directory] = names
+        for name in names ^ previous:
+            path = os.path.join(directory, name)
+            if not self.on_file(path) and name in names:
+                # Datei evtl. noch nicht fertig geschrieben: einmal nachfassen
+                QTimer.singleShot(2000, lambda path=path: self.on_file(path))
+
+    def start(self):
+        pass
+
+    def stop(self):
+        self.watcher.removePaths(self.watcher.directories())
+
+
+class ReplayWatcher:
+    """Hält den Index aktuell: Abgleich beim Start, danach nur noch Dateisystem-Events"""
+
+    def __init__(self, osu_dir, index, on_change=None):
+        self.directories = watched_dirs(osu_dir)
+        self.index = index
+        self.on_change = on_change
+        try:
+            self.backend = InotifyWatcher(self.directories, self._file_event, self._rescan)
+            self.kind = 'inotify'
+        except OSError:
+            self.backend = QtDirectoryWatcher(self.directories, self._file_event, self._rescan)
+            self.kind = 'qt'
+
+    def start(self):
+        threading.Thread(target=self._rescan, name='ReplayReconcile', daemon=True).start()
+        self.backend.start()
+
+    def _notify(self, changed):
+        if changed and self.on_change:
+            self.on_change()
+        return changed
+
+    def _file_event(self, path):
+        if os.path.exists(path):
+            return self._notify(self.index.add(path))
+        self._notify(self.index.remove(path))
+        return True
+
+    def _rescan(self):
+        self._notify(self.index.reconcile(self.directories))
+
+    def stop(self):
+        self.backend.stop()
+
+
+def _time_text(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+
+
+class RecentPlaysPage(QWidget):
+    """Letzte Spiele und Screenshots direkt aus dem Index, ohne die Ordner zu lesen"""
+    back_requested = pyqtSignal()
+
+    PLAY_COLUMNS = ["Played", "Mode", "Player", "Score", "Accuracy", "Combo", "Mods"]
+    SCREENSHOT_COLUMNS = ["Taken", "File", "Size"]
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.setObjectName("RecentPlaysPage")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        self.index = index
+        self.paths = []
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        header = QHBoxLayout()
+        back_btn = QPushButton("Back to Launcher")
+        back_btn.clicked.connect(self.back_requested.emit)
+        self.kind_combo = QComboBox()
+        self.kind_combo.addItem("Plays", REPLAY)
+        self.kind_combo.addItem("Screenshots", SCREENSHOT)
+        self.kind_combo.currentIndexChanged.connect(lambda _: self.refresh())
+        self.status_label = QLabel()
+        header.addWidget(back_btn)
+        header.addWidget(self.kind_combo)
+        header.addStretch()
+        header.addWidget(self.status_label)
+
+        self.table = QTableWidget(0, 0)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Doppelklick: osu! spielt das Replay ab bzw. der Bildbetrachter öffnet den Screenshot
+        self.table.cellDoubleClicked.connect(
+            lambda row, _: QDesktopServices.openUrl(QUrl.fromLocalFile(self.paths[row])))
+
+        layout.addLayout(header)
+        layout.addWidget(self.table)
+        self.setStyleSheet("""
+            QWidget#RecentPlaysPage { background: rgba(0,0,0,150); }
+            QLabel { color: white; }
+            QTableWidget {
+                background: rgba(0,0,0,170);
+                color: white;
+                border: 1px solid rgba(255,102,170,80);
+                selection-background-color: rgba(255,102,170,150);
+            }
+            QHeaderView::section {
+                background: rgba(0,0,0,200);
+                color: #ff66aa;
+                border: none;
+                padding: 6px;
+            }
+            QComboBox, QPushButton {
+                background: rgba(0,0,0,180);
+                color: white;
+                border: 2px solid #ff66aa;
+                border-radius: 8px;
+                padding: 6px 12px;
+            }
+            QPushButton:hover {
+                background: rgba(255,102,170,150);
+                border-color: white;
+            }
+        """)
+
+    def refresh(self):
+        kind = self.kind_combo.currentData()
+        rows = self.index.recent(kind)
+        self.paths = [row['path'] for row in rows]
+        if kind == REPLAY:
+            columns = self.PLAY_COLUMNS
+            values = [(_time_text(row['played_at']), MODE_NAMES.get(row['mode'], '?'), row['player'] or '?',
+                       f"{row['score']:,}", f"{accuracy(row):.2f}%",
+                       f"{row['max_combo']}x" + (" FC" if row['perfect'] else ""), mods_text(row['mods']))
+                      for row in rows]
+        else:
+            columns = self.SCREENSHOT_COLUMNS
+            values = [(_time_text(row['played_at']), os.path.basename(row['path']),
+                       f"{row['size'] / 1024:.0f} KB") for row in rows]
+
+        self.table.setUpdatesEnabled(False)
+        self.table.clearContents()
+        self.table.setColumnCount(len(columns))
+        self.table.setHorizontalHeaderLabels(columns)
+        self.table.setRowCount(len(values))
+        for row, cells in enumerate(values):
+            for column, text in enumerate(cells):
+                self.table.setItem(row, column, QTableWidgetItem(text))
+        self.table.setUpdatesEnabled(True)
+        total = self.index.count(kind)
+        self.status_label.setText(f"{total:,} {'plays' if kind == REPLAY else 'screenshots'} indexed"
+                                  if total else "Nothing indexed yet")
@@ -0,0 +1,96 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_NAME = 'resources.bin'
+HEADER = struct.Struct('<4sII')  # magic, version, index length
+MAGIC = b'EGRB'
+VERSION = 1
+ALIGN = 16
+
+_bundle = None
+
+
+def _search_dirs():
+    # Neben der exe (gefrorener Build), im PyInstaller-Verzeichnis, dann im Quellbaum
+    if getattr(sys, 'frozen', False):
+        yield os.path.dirname(sys.executable)
+    if hasattr(sys, '_MEIPASS'):
+        yield sys._MEIPASS
+    yield os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ResourceBundle:
+    """Memory-mapped archive built by tools/build_resources.py"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_length = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a resource bundle")
+        self.index = json.loads(self.mm[HEADER.size:HEADER.size + index_length])
+
+    def data(self, name):
+        offset, size, _ = self.index[name]
+        return self.mm[offset:offset + size]
+
+    def source_id(self, name):
+        return self.index[name][2]
+
+
+class _DirectoryFallback:
+    """Used in a source checkout before the bundle has been built"""
+
+    def __init__(self, base):
+        self.base = os.path.join(base, 'resources')
+
+    def data(self, name):
+        with open(os.path.join(self.base, name), 'rb') as f:
+            return f.read()
+
+    def source_id(self, name):
+        from core import pixel_cache
+        return pixel_cache.source_hash(os.path.join(self.base, name))
+
+
+def get_bundle():
+    global _bundle
+    if _bundle is None:
+        for directory in _search_dirs():
+            path = os.path.join(directory, BUNDLE_NAME)
+            try:
+                _bundle = ResourceBundle(path)
+                break
+            except (FileNotFoundError, ValueError) as e:
+                if not isinstance(e, FileNotFoundError):
+                    logger.error(str(e))
+        else:
+            _bundle = _DirectoryFallback(getattr(sys, '_MEIPASS', os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    return _bundle
+
+
+def data(name):
+    return get_bundle().data(name)
+
+
+def source_id(name):
+    """Content hash of a resource, usable as a cache key"""
+    return get_bundle().source_id(name)
+
+
+def pixmap(name):
+    from PyQt6.QtGui import QPixmap
+    result = QPixmap()
+    result.loadFromData(data(name))
+    return result
+
+
+def icon(name):
+    from PyQt6.QtGui import QIcon
+    return QIcon(pixmap(name))
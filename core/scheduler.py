@@ -0,0 +1,230 @@
+import asyncio
+import inspect
+import logging
+import random
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+MIN_INTERVAL_MS = 16
+COALESCE_MS = 10
+MAX_BACKOFF = 16
+
+_scheduler = None
+
+
+class Job:
+    __slots__ = ('name', 'func', 'interval', 'group', 'jitter', 'backoff', 'on_result',
+                 'is_async', 'next_run', 'running', 'future', 'consecutive_failures')
+
+    def __init__(self, name, func, interval, group, jitter, backoff, on_result):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.group = group
+        self.jitter = jitter
+        self.backoff = backoff
+        self.on_result = on_result
+        self.is_async = inspect.iscoroutinefunction(func)
+        self.next_run = 0.0
+        self.running = False
+        self.future = None
+        self.consecutive_failures = 0
+
+    def next_delay(self):
+        delay = self.interval
+        if self.backoff and self.consecutive_failures:
+            delay *= min(2 ** self.consecutive_failures, MAX_BACKOFF)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return delay
+
+
+class Scheduler(QObject):
+    """Runs all periodic and delayed launcher work from a single Qt timer.
+
+    Coroutine jobs run on a shared asyncio loop thread; their results come
+    back to the GUI thread through a queued signal.
+    """
+    async_finished = pyqtSignal(object, object, object, float)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = {}
+        self.counters = {}
+        self.paused_groups = set()
+        self.wakeups = 0
+        self.started = time.monotonic()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._run_due)
+        self.async_finished.connect(self._finish_async)
+        self.loop = None
+
+    def every(self, name, interval_ms, func, group='default', jitter=0.0, backoff=True,
+              first_delay_ms=None, on_result=None):
+        """Runs func every interval_ms; replaces an existing job with the same name"""
+        interval = max(interval_ms, MIN_INTERVAL_MS) / 1000
+        job = Job(name, func, interval, group, jitter, backoff, on_result)
+        first = interval if first_delay_ms is None else first_delay_ms / 1000
+        return self._add(job, first)
+
+    def once(self, name, delay_ms, func, group='default', on_result=None):
+        job = Job(name, func, None, group, 0.0, False, on_result)
+        return self._add(job, delay_ms / 1000)
+
+    def _add(self, job, delay):
+        self.cancel(job.name)
+        job.next_run = time.monotonic() + delay
+        self.jobs[job.name] = job
+        self._arm()
+        return job
+
+    def cancel(self, name):
+        job = self.jobs.pop(name, None)
+        if job is None:
+            return
+        if job.future is not None:
+            job.future.cancel()
+        self._arm()
+
+    def is_scheduled(self, name):
+        return name in self.jobs
+
+    def pause(self, *groups):
+        self.paused_groups.update(groups)
+        self._arm()
+
+    def resume(self, *groups):
+        self.paused_groups.difference_update(groups)
+        self._arm()
+
+    def _arm(self):
+        pending = [job.next_run for job in self.jobs.values()
+                   if not job.running and job.group not in self.paused_groups]
+        if not pending:
+            self.timer.stop()
+            return
+        delay_ms = max(0, int((min(pending) - time.monotonic()) * 1000))
+        self.timer.start(delay_ms)
+
+    def _run_due(self):
+        self.wakeups += 1
+        horizon = time.monotonic() + COALESCE_MS / 1000
+        for job in list(self.jobs.values()):
+            if job.running or job.group in self.paused_groups or job.next_run > horizon:
+                continue
+            if self.jobs.get(job.name) is job:
+                self._run(job)
+        self._arm()
+
+    def _run(self, job):
+        if job.is_async:
+            job.running = True
+            started = time.perf_counter()
+            job.future = asyncio.run_coroutine_threadsafe(job.func(), self._event_loop())
+            job.future.add_done_callback(lambda future: self._async_done(job, future, started))
+            return
+
+        started = time.perf_counter()
+        error = None
+        try:
+            result = job.func()
+        except Exception as e:
+            error = e
+        self._complete(job, error, (time.perf_counter() - started) * 1000)
+        if error is None:
+            self._deliver(job, result)
+
+    def _async_done(self, job, future, started):
+        # Läuft im asyncio-Thread; das Ergebnis geht per Signal zurück in den GUI-Thread
+        if future.cancelled():
+            return
+        error = future.exception()
+        result = None if error else future.result()
+        self.async_finished.emit(job, result, error, (time.perf_counter() - started) * 1000)
+
+    def _finish_async(self, job, result, error, duration_ms):
+        job.running = False
+        job.future = None
+        if self.jobs.get(job.name) is not job:
+            return
+        self._complete(job, error, duration_ms)
+        if error is None:
+            self._deliver(job, result)
+        self._arm()
+
+    def _deliver(self, job, result):
+        # Ein Fehler im Callback darf weder den Timer noch die übrigen Jobs mitreißen
+        if not job.on_result:
+            return
+        try:
+            job.on_result(result)
+        except Exception:
+            self.counters[job.name]['failures'] += 1
+            logger.exception(f"Result handler of scheduled job {job.name} failed")
+
+    def _complete(self, job, error, duration_ms):
+        counter = self.counters.setdefault(
+            job.name, {'group': job.group, 'runs': 0, 'failures': 0, 'total_ms': 0.0, 'last_ms': 0.0})
+        counter['runs'] += 1
+        counter['last_ms'] = duration_ms
+        counter['total_ms'] += duration_ms
+        if error is not None:
+            counter['failures'] += 1
+            job.consecutive_failures += 1
+            logger.error(f"Scheduled job {job.name} failed: {str(error)}")
+        else:
+            job.consecutive_failures = 0
+
+        if job.interval is None:
+            if self.jobs.get(job.name) is job:
+                del self.jobs[job.name]
+        else:
+            job.next_run = time.monotonic() + job.next_delay()
+
+    def _event_loop(self):
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            threading.Thread(target=self.loop.run_forever, name='SchedulerLoop', daemon=True).start()
+        return self.loop
+
+    def stats(self):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        active = [job for job in self.jobs.values()
+                  if job.interval is not None and job.group not in self.paused_groups]
+        return {
+            'wakeups_per_sec': round(self.wakeups / elapsed, 3),
+            'max_wakeups_per_sec': round(sum(1 / job.interval for job in active), 3),
+            'paused_groups': sorted(self.paused_groups),
+            'scheduled': sorted(self.jobs),
+            'jobs': {
+                name: {
+                    'group': counter['group'],
+                    'runs': counter['runs'],
+                    'failures': counter['failures'],
+                    'avg_ms': round(counter['total_ms'] / counter['runs'], 3),
+                    'last_ms': round(counter['last_ms'], 3),
+                }
+                for name, counter in self.counters.items()
+            },
+        }
+
+    def shutdown(self):
+        self.timer.stop()
+        for name in list(self.jobs):
+            self.cancel(name)
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop = None
+
+
+def get_scheduler():
+    """Shared scheduler for the whole launcher process"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = Scheduler()
+    return _scheduler
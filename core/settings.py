@@ -1,3 +1,4 @@
+import copy
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QGroupBox, QCheckBox, 
     QLineEdit, QPushButton, QFileDialog, QComboBox,
@@ -7,12 +8,19 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from core.translations import translations
+from core import settings_store
+
+GENERAL_TAB, OSU_TAB, APPEARANCE_TAB = range(3)
 
 class SettingsDialog(QDialog):
+    """Wird einmal erstellt und wiederverwendet; reload() lädt vor jedem Öffnen den gespeicherten Stand"""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.launcher = parent
-        self.current_language = self.launcher.settings.get('language', 'en')
+        self.settings = copy.deepcopy(self.launcher.settings)
+        self.current_language = self.settings.get('language', 'en')
+        # Sprache, in der die Widgets gebaut wurden; retranslate_ui deckt nur Tabs und Buttons ab
+        self.built_language = self.current_language
         self.init_ui()
         
     def init_ui(self):
@@ -24,10 +32,13 @@ class SettingsDialog(QDialog):
         main_layout.setContentsMargins(15, 15, 15, 15)
         
         self.tabs = QTabWidget()
+        for key in ('general_tab', 'osu_tab', 'appearance_tab'):
+            self.tabs.addTab(QWidget(), translations[self.current_language][key])
         
+        # osu!- und Darstellungs-Tab erst bauen, wenn sie zum ersten Mal ausgewählt werden
+        self.pending_tabs = {OSU_TAB: self.setup_osu_tab, APPEARANCE_TAB: self.setup_appearance_tab}
         self.setup_general_tab()
-        self.setup_osu_tab()
-        self.setup_appearance_tab()
+        self.tabs.currentChanged.connect(self.ensure_tab_built)
         
         main_layout.addWidget(self.tabs)
         self.setup_dialog_buttons(main_layout)
@@ -35,8 +46,27 @@ class SettingsDialog(QDialog):
         self.load_current_settings()
         self.apply_styles()
 
+    def ensure_tab_built(self, index):
+        setup = self.pending_tabs.pop(index, None)
+        if setup is not None:
+            setup()
+            self.load_current_settings()
+
+    def is_built(self, index):
+        return index not in self.pending_tabs
+
+    def reload(self):
+        """Verwirft ungespeicherte Änderungen und lädt den gespeicherten Stand"""
+        self.settings = settings_store.load_settings()
+        # Positionen ändern sich durch Ziehen, ohne dass der Dialog offen ist
+        self.settings['widget_positions'] = self.launcher.settings.get('widget_positions', {})
+        self.current_language = self.settings.get('language', 'en')
+        self.retranslate_ui()
+        self.load_current_settings()
+        self.tabs.setCurrentIndex(GENERAL_TAB)
+
     def setup_general_tab(self):
-        tab = QWidget()
+        tab = self.tabs.widget(GENERAL_TAB)
         layout = QVBoxLayout(tab)
         layout.setSpacing(15)
         
@@ -47,6 +77,7 @@ class SettingsDialog(QDialog):
         self.fullscreen_cb = QCheckBox(translations[self.current_language]['fullscreen_checkbox'])
         self.save_positions_cb = QCheckBox(translations[self.current_language]['save_positions_checkbox'])
         self.save_positions_cb.setChecked(True)
+        self.tray_mode_cb = QCheckBox(translations[self.current_language]['tray_mode_checkbox'])
         
         # Language selection
         language_group = QGroupBox(translations[self.current_language]['language_label'])
@@ -72,17 +103,16 @@ class SettingsDialog(QDialog):
         
         launcher_layout.addWidget(self.fullscreen_cb)
         launcher_layout.addWidget(self.save_positions_cb)
+        launcher_layout.addWidget(self.tray_mode_cb)
         launcher_layout.addWidget(language_group)
         launcher_group.setLayout(launcher_layout)
         
         layout.addWidget(launcher_group)
         layout.addWidget(pos_group)
         layout.addStretch()
-        
-        self.tabs.addTab(tab, translations[self.current_language]['general_tab'])
 
     def setup_osu_tab(self):
-        tab = QWidget()
+        tab = self.tabs.widget(OSU_TAB)
         layout = QVBoxLayout(tab)
         layout.setSpacing(15)
         
@@ -109,10 +139,14 @@ class SettingsDialog(QDialog):
         self.force_fullscreen_cb = QCheckBox(translations[self.current_language]['force_fullscreen'])
         self.nomusic_cb = QCheckBox(translations[self.current_language]['disable_music'])
         self.novideo_cb = QCheckBox(translations[self.current_language]['disable_videos'])
+        self.telemetry_cb = QCheckBox(translations[self.current_language]['session_telemetry'])
+        self.live_presence_cb = QCheckBox(translations[self.current_language]['live_presence'])
         
         options_layout.addWidget(self.force_fullscreen_cb)
         options_layout.addWidget(self.nomusic_cb)
         options_layout.addWidget(self.novideo_cb)
+        options_layout.addWidget(self.telemetry_cb)
+        options_layout.addWidget(self.live_presence_cb)
         options_group.setLayout(options_layout)
         
         # Osu! path
@@ -135,11 +169,9 @@ class SettingsDialog(QDialog):
         layout.addWidget(options_group)
         layout.addWidget(path_group)
         layout.addStretch()
-        
-        self.tabs.addTab(tab, translations[self.current_language]['osu_tab'])
 
     def setup_appearance_tab(self):
-        tab = QWidget()
+        tab = self.tabs.widget(APPEARANCE_TAB)
         layout = QVBoxLayout(tab)
         layout.setSpacing(15)
         
@@ -184,8 +216,6 @@ class SettingsDialog(QDialog):
         layout.addWidget(bg_group)
         layout.addWidget(opacity_group)
         layout.addStretch()
-        
-        self.tabs.addTab(tab, translations[self.current_language]['appearance_tab'])
 
     def setup_dialog_buttons(self, layout):
         btn_container = QWidget()
@@ -213,7 +243,7 @@ class SettingsDialog(QDialog):
             self, 
             translations[self.current_language]['select_image'], 
             "", 
-            "Images (*.png *.jpg *.jpeg *.bmp)"
+            "Images (*.png *.jpg *.jpeg *.bmp *.gif *.apng *.webp)"
         )
         if path:
             self.bg_path.setText(path)
@@ -238,8 +268,9 @@ class SettingsDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            default_pos = {'side_buttons': {'x': 1080, 'y': 650}}
+            default_pos = {'side_buttons': {'rx': 1.0, 'ry': 1.0}}
             self.launcher.settings['widget_positions'] = default_pos
+            self.settings['widget_positions'] = copy.deepcopy(default_pos)
             self.launcher.load_widget_positions()
             QMessageBox.information(
                 self, 
@@ -257,73 +288,93 @@ class SettingsDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.launcher.settings = {
+            # Erst mit Speichern übernommen; Abbrechen verwirft die Standardwerte
+            self.settings = {
                 'language': 'en',
                 'launcher': {
                     'fullscreen': True,
-                    'save_positions': True
+                    'save_positions': True,
+                    'tray_mode': True
                 },
                 'osu': {
                     'server': 'EternityGlow',
                     'force_fullscreen': True,
                     'nomusic': False,
                     'novideo': False,
+                    'session_telemetry': False,
+                    'live_presence': False,
                     'path': ''
                 },
                 'background': {
                     'enabled': False,
                     'path': ''
                 },
-                'widget_positions': {'side_buttons': {'x': 1080, 'y': 650}},
+                'widget_positions': {'side_buttons': {'rx': 1.0, 'ry': 1.0}},
                 'opacity': 80
             }
             self.load_current_settings()
 
     def load_current_settings(self):
-        settings = self.launcher.settings
+        settings = self.settings
         
         # General
         self.fullscreen_cb.setChecked(settings.get('launcher', {}).get('fullscreen', True))
         self.save_positions_cb.setChecked(settings.get('launcher', {}).get('save_positions', True))
+        self.tray_mode_cb.setChecked(settings.get('launcher', {}).get('tray_mode', True))
+        
+        # Language
+        self.current_language = settings.get('language', 'en')
+        self.language_combo.setCurrentText("English" if self.current_language == "en" else "Deutsch")
         
-        # osu!
+        if self.is_built(OSU_TAB):
+            self.load_osu_settings(settings)
+        if self.is_built(APPEARANCE_TAB):
+            self.load_appearance_settings(settings)
+
+    def load_osu_settings(self, settings):
         self.server_combo.setCurrentText(settings.get('osu', {}).get('server', 'EternityGlow'))
         self.force_fullscreen_cb.setChecked(settings.get('osu', {}).get('force_fullscreen', True))
         self.nomusic_cb.setChecked(settings.get('osu', {}).get('nomusic', False))
         self.novideo_cb.setChecked(settings.get('osu', {}).get('novideo', False))
+        self.telemetry_cb.setChecked(settings.get('osu', {}).get('session_telemetry', False))
+        self.live_presence_cb.setChecked(settings.get('osu', {}).get('live_presence', False))
         self.osu_path.setText(settings.get('osu', {}).get('path', ''))
-        
-        # Appearance
+
+    def load_appearance_settings(self, settings):
         bg_settings = settings.get('background', {})
         self.bg_cb.setChecked(bg_settings.get('enabled', False))
         self.bg_path.setText(bg_settings.get('path', ''))
         self.opacity_slider.setValue(settings.get('opacity', 80))
-        
-        # Language
-        self.current_language = settings.get('language', 'en')
-        self.language_combo.setCurrentText("English" if self.current_language == "en" else "Deutsch")
 
     def get_settings(self):
-        return {
+        # Nie geöffnete Tabs übernehmen ihre Werte unverändert
+        settings = copy.deepcopy(self.settings)
+        settings.update({
             'language': self.language_combo.currentData(),
             'launcher': {
                 'fullscreen': self.fullscreen_cb.isChecked(),
-                'save_positions': self.save_positions_cb.isChecked()
+                'save_positions': self.save_positions_cb.isChecked(),
+                'tray_mode': self.tray_mode_cb.isChecked()
             },
-            'osu': {
+            'widget_positions': self.settings.get('widget_positions', {}),
+        })
+        if self.is_built(OSU_TAB):
+            settings['osu'] = {
                 'server': self.server_combo.currentText(),
                 'force_fullscreen': self.force_fullscreen_cb.isChecked(),
                 'nomusic': self.nomusic_cb.isChecked(),
                 'novideo': self.novideo_cb.isChecked(),
+                'session_telemetry': self.telemetry_cb.isChecked(),
+                'live_presence': self.live_presence_cb.isChecked(),
                 'path': self.osu_path.text()
-            },
-            'background': {
+            }
+        if self.is_built(APPEARANCE_TAB):
+            settings['background'] = {
                 'enabled': self.bg_cb.isChecked(),
                 'path': self.bg_path.text()
-            },
-            'widget_positions': self.launcher.settings.get('widget_positions', {}),
-            'opacity': self.opacity_slider.value()
-        }
+            }
+            settings['opacity'] = self.opacity_slider.value()
+        return settings
 
     def apply_styles(self):
         self.setStyleSheet("""
@@ -396,7 +447,8 @@ class SettingsDialog(QDialog):
             # Aktualisiere die UI sofort
             self.retranslate_ui()
     
-        self.launcher.settings = self.get_settings()
+        self.settings = self.get_settings()
+        self.launcher.settings = copy.deepcopy(self.settings)
         self.launcher.save_settings()
         self.launcher.apply_settings()  # Wichtig: Launcher muss die Änderung übernehmen
         super().accept()
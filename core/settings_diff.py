@@ -0,0 +1,82 @@
+import copy
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from core.log import log_event
+
+_MISSING = object()
+
+
+def flatten(settings, prefix=''):
+    """Turns nested settings into {'osu.server': 'Bancho', ...}"""
+    flat = {}
+    for key, value in settings.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, path + '.'))
+        else:
+            flat[path] = value
+    return flat
+
+
+@dataclass(frozen=True)
+class SettingChange:
+    key: str
+    old: Any
+    new: Any
+
+
+class SettingsDiff:
+    def __init__(self, old, new):
+        old_flat = flatten(old) if old is not None else {}
+        new_flat = flatten(new)
+        self.initial = old is None
+        self.changes = {
+            key: SettingChange(key, old_flat.get(key, _MISSING), new_flat.get(key, _MISSING))
+            for key in old_flat.keys() | new_flat.keys()
+            if old_flat.get(key, _MISSING) != new_flat.get(key, _MISSING)
+        }
+
+    def touches(self, prefixes):
+        if self.initial:
+            return True
+        return any(key == prefix or key.startswith(prefix + '.')
+                   for key in self.changes for prefix in prefixes)
+
+    def __bool__(self):
+        return self.initial or bool(self.changes)
+
+    def __repr__(self):
+        return f"SettingsDiff({sorted(self.changes)})"
+
+
+@dataclass
+class _Handler:
+    name: str
+    prefixes: tuple
+    apply: Callable[[SettingsDiff], None]
+
+
+class SettingsAppliers:
+    """Runs each subsystem's handler only when one of its settings keys changed"""
+
+    def __init__(self):
+        self.handlers = []
+        self.applied = None
+
+    def register(self, name, prefixes, handler):
+        self.handlers.append(_Handler(name, tuple(prefixes), handler))
+
+    def apply(self, settings):
+        start = time.perf_counter()
+        diff = SettingsDiff(self.applied, settings)
+        ran = []
+        for handler in self.handlers:
+            if diff.touches(handler.prefixes):
+                handler.apply(diff)
+                ran.append(handler.name)
+        self.applied = copy.deepcopy(settings)
+        log_event('settings.apply', (time.perf_counter() - start) * 1000,
+                  changed=sorted(diff.changes), handlers=ran)
+        return diff
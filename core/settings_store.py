@@ -0,0 +1,26 @@
+import copy
+import json
+
+# Bewusst ohne PyQt-Import, damit auch der Kommandozeilen-Start die Einstellungen lesen kann
+SETTINGS_FILE = 'launcher_settings.json'
+
+DEFAULT_SETTINGS = {
+    'language': 'en',
+    'launcher': {'fullscreen': True},
+    'osu': {'server': 'EternityGlow', 'force_fullscreen': True},
+    'background': {'enabled': False, 'path': ''},
+    'widget_positions': {'side_buttons': {'rx': 1.0, 'ry': 1.0}}
+}
+
+
+def load_settings(path=SETTINGS_FILE):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return copy.deepcopy(DEFAULT_SETTINGS)
+
+
+def save_settings(settings, path=SETTINGS_FILE):
+    with open(path, 'w') as f:
+        json.dump(settings, f, indent=4)
@@ -0,0 +1,106 @@
+import getpass
+import json
+import logging
+import os
+import socket
+import sys
+import tempfile
+import threading
+from multiprocessing.connection import Listener, Client
+
+# Dieses Modul wird vor PyQt geladen und darf keine GUI-Module importieren
+logger = logging.getLogger(__name__)
+
+AUTHKEY = b'eternityglow-launcher'
+MAX_MESSAGE = 4096
+
+
+def _instance_address():
+    user = ''.join(c for c in getpass.getuser() if c.isalnum()) or 'user'
+    if sys.platform == 'win32':
+        return rf'\\.\pipe\eternityglow-launcher-{user}'
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f'eternityglow-launcher-{user}.sock')
+
+
+ADDRESS = _instance_address()
+
+
+def forward_command(command):
+    """Sends command to a running launcher; returns False if none is listening"""
+    try:
+        conn = Client(ADDRESS, authkey=AUTHKEY)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    except OSError as e:
+        logger.debug(f"No running launcher instance: {str(e)}")
+        return False
+    try:
+        conn.send_bytes(json.dumps(list(command)).encode('utf-8'))
+        return conn.recv_bytes(MAX_MESSAGE) == b'ok'
+    except (EOFError, OSError):
+        return False
+    finally:
+        conn.close()
+
+
+class InstanceServer:
+    """Accepts commands from later launcher invocations on a background thread"""
+
+    def __init__(self, on_command):
+        self.on_command = on_command
+        self.listener = None
+
+    def start(self):
+        """Returns False if another instance already owns the address"""
+        if sys.platform != 'win32' and os.path.exists(ADDRESS):
+            if not self._is_stale():
+                return False
+            try:
+                os.unlink(ADDRESS)
+            except OSError:
+                return False
+        try:
+            self.listener = Listener(ADDRESS, authkey=AUTHKEY)
+        except OSError as e:
+            logger.warning(f"Single-instance listener unavailable: {str(e)}")
+            return False
+        threading.Thread(target=self._serve, name='InstanceServer', daemon=True).start()
+        return True
+
+    def _is_stale(self):
+        # Ein verwaister Socket (z.B. nach Absturz) nimmt keine Verbindungen mehr an
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(ADDRESS)
+            return False
+        except OSError:
+            return True
+        finally:
+            probe.close()
+
+    def _serve(self):
+        listener = self.listener
+        while listener is self.listener:
+            try:
+                conn = listener.accept()
+            except Exception:
+                # Verbindungen ohne gültigen Schlüssel werden verworfen
+                if listener is not self.listener:
+                    return
+                continue
+            try:
+                # JSON statt pickle, damit fremde Clients keinen Code einschleusen können
+                command = json.loads(conn.recv_bytes(MAX_MESSAGE))
+                conn.send_bytes(b'ok')
+            except (EOFError, OSError, ValueError):
+                continue
+            finally:
+                conn.close()
+            if isinstance(command, list) and all(isinstance(part, str) for part in command):
+                self.on_command(command)
+
+    def close(self):
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.close()
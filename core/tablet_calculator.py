@@ -2,7 +2,8 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel,
                             QPushButton, QMessageBox)
 from PyQt6.QtGui import (QPainter, QPen, QColor, QKeySequence,
                         QFont, QMouseEvent)
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
+from core.scheduler import get_scheduler
 import math
 
 class TabletAreaCalculator(QWidget):
@@ -13,11 +14,10 @@ class TabletAreaCalculator(QWidget):
         self.area_rect = None
         self.tablet_width_mm = 216  # Standard-Wacom Medium Größe
         self.tablet_height_mm = 135
-        self.timer = QTimer(self)
+        self.scheduler = get_scheduler()
         
         # UI Initialisierung
         self.setup_ui()
-        self.timer.timeout.connect(self.check_recording)
         
     def setup_ui(self):
         """Initialisiert die Benutzeroberfläche"""
@@ -80,14 +80,14 @@ class TabletAreaCalculator(QWidget):
         self.measure_button.setText("Measuring... (Release space to stop)")
         self.info_label.setText("Now move your pen over the desired area...")
         self.setMouseTracking(True)
-        self.timer.start(100)
+        self.scheduler.every('tablet.sample', 100, self.check_recording, group='ui', backoff=False)
         self.update()
 
     def stop_recording(self):
         if self.recording:
             self.recording = False
             self.setMouseTracking(False)
-            self.timer.stop()
+            self.scheduler.cancel('tablet.sample')
             self.measure_button.setText("Press space to measure again")
             if len(self.points) > 10:
                 self.calculate_area()
@@ -102,6 +102,10 @@ class TabletAreaCalculator(QWidget):
                 self.points.append(pos)
                 self.update()
 
+    def closeEvent(self, event):
+        self.scheduler.cancel('tablet.sample')
+        super().closeEvent(event)
+
     def mouseMoveEvent(self, event: QMouseEvent):
         if self.recording:
             self.points.append(event.pos())
@@ -0,0 +1,286 @@
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque, namedtuple
+
+import psutil
+
+from core.log import log_event
+from utils.helpers import cache_path
+
+# Qt-frei; läuft als eigener Thread neben dem blockierenden wait_for_osu
+
+logger = logging.getLogger(__name__)
+
+CAPACITY = 4096
+FAST_INTERVAL = 0.25
+SLOW_INTERVAL = 2.0
+# In der ersten Minute (Laden, Song-Select, erste Map) fein auflösen, danach grob
+FAST_PERIOD = 60.0
+# Eigene CPU-Zeit des Samplers in Prozent eines Kerns
+CPU_BUDGET_PERCENT = 0.5
+BUDGET_WINDOW = 10.0
+MAX_INTERVAL = 30.0
+# Ein Sample, das so viel später als geplant aufwacht, deutet auf einen systemweiten Hänger
+LATE_FACTOR = 2.0
+STUTTER_READ_RATE = 8 * 1024 * 1024
+STUTTER_SWITCH_FACTOR = 3.0
+STUTTER_CPU_FACTOR = 1.5
+# Wie die Log-Rotation: nur die letzten Sitzungen bleiben liegen
+MAX_SUMMARIES = 20
+
+Sample = namedtuple('Sample', 'at planned cpu rss read_bytes write_bytes threads voluntary involuntary')
+
+
+def _percentile(values, percent):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * percent / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class SessionSampler(threading.Thread):
+    """Zeichnet CPU, RSS, I/O, Threads und Kontextwechsel des osu!-Prozesses in einem Ringpuffer auf"""
+
+    def __init__(self, pid, capacity=CAPACITY, fast_interval=FAST_INTERVAL, slow_interval=SLOW_INTERVAL,
+                 fast_period=FAST_PERIOD, cpu_budget_percent=CPU_BUDGET_PERCENT):
+        super().__init__(name='SessionSampler', daemon=True)
+        self.pid = pid
+        self.samples = deque(maxlen=capacity)
+        self.fast_interval = fast_interval
+        self.slow_interval = slow_interval
+        self.fast_period = fast_period
+        self.cpu_budget_percent = cpu_budget_percent
+        self.interval = fast_interval
+        self.stride = 1
+        self.throttled = 0
+        self.self_cpu = 0.0
+        self.started_at = None
+        self.ended_at = None
+        self.io_available = True
+        self.stop_event = threading.Event()
+
+    def _sample(self, process, planned):
+        with process.oneshot():
+            cpu = process.cpu_times()
+            rss = process.memory_info().rss
+            io = None
+            if self.io_available:
+                try:
+                    io = process.io_counters()
+                except (psutil.AccessDenied, AttributeError, NotImplementedError):
+                    # macOS kennt keine I/O-Zähler pro Prozess; nicht jedes Mal neu versuchen
+                    self.io_available = False
+            threads = process.num_threads()
+            switches = process.num_ctx_switches()
+        self.samples.append(Sample(
+            time.monotonic(), planned, cpu.user + cpu.system, rss,
+            io.read_bytes if io else 0, io.write_bytes if io else 0,
+            threads, switches.voluntary, switches.involuntary))
+
+    def run(self):
+        try:
+            process = psutil.Process(self.pid)
+        except psutil.NoSuchProcess:
+            return
+        self.started_at = time.monotonic()
+        cost_started = time.thread_time()
+        window = (self.started_at, cost_started)
+        next_at = self.started_at
+        try:
+            while not self.stop_event.is_set():
+                sample_started = time.thread_time()
+                self._sample(process, next_at)
+                self.self_cpu += time.thread_time() - sample_started
+
+                now = time.monotonic()
+                if now - window[0] >= BUDGET_WINDOW:
+                    # Budget im letzten Fenster überschritten: seltener messen, statt das Spiel zu stören
+                    cost = 100 * (time.thread_time() - window[1]) / (now - window[0])
+                    if cost > self.cpu_budget_percent and self.interval < MAX_INTERVAL:
+                        self.stride *= 2
+                        self.throttled += 1
+                    window = (now, time.thread_time())
+                base = self.fast_interval if now - self.started_at < self.fast_period else self.slow_interval
+                self.interval = min(base * self.stride, MAX_INTERVAL)
+                next_at = max(next_at + self.interval, now)
+                self.stop_event.wait(next_at - now)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            pass
+        except psutil.AccessDenied as e:
+            logger.warning(f"Session telemetry lost access to osu!: {str(e)}")
+        finally:
+            self.self_cpu = time.thread_time() - cost_started
+            self.ended_at = time.monotonic()
+
+    def stop(self, timeout=2.0):
+        self.stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    def overhead_percent(self):
+        if self.started_at is None:
+            return 0.0
+        elapsed = (self.ended_at or time.monotonic()) - self.started_at
+        return 100 * self.self_cpu / max(elapsed, 1e-3)
+
+    def summary(self):
+        report = summarize(list(self.samples))
+        report.update(
+            sampler_cpu_ms=round(self.self_cpu * 1000, 2),
+            sampler_overhead_percent=round(self.overhead_percent(), 4),
+            sampler_budget_percent=self.cpu_budget_percent,
+            throttled=self.throttled,
+            ring_capacity=self.samples.maxlen,
+        )
+        return report
+
+
+def summarize(samples):
+    """Spitzen, Perzentile und Zeiträume, in denen Ruckler wahrscheinlich sind"""
+    if len(samples) < 2:
+        return {'samples': len(samples)}
+    start = samples[0].at
+    intervals = []
+    for previous, sample in zip(samples, samples[1:]):
+        dt = sample.at - previous.at
+        if dt <= 0:
+            continue
+        intervals.append({
+            'start': previous.at - start,
+            'end': sample.at - start,
+            'cpu': 100 * (sample.cpu - previous.cpu) / dt,
+            'read_rate': max(sample.read_bytes - previous.read_bytes, 0) / dt,
+            'involuntary_rate': max(sample.involuntary - previous.involuntary, 0) / dt,
+            'late': sample.at - sample.planned,
+            'planned': sample.planned - previous.planned,
+        })
+    cpu = [i['cpu'] for i in intervals]
+    switches = [i['involuntary_rate'] for i in intervals]
+    cpu_p95 = _percentile(cpu, 95)
+    switch_median = statistics.median(switches) if switches else 0.0
+
+    stutters = []
+    for interval in intervals:
+        reasons = []
+        if interval['read_rate'] >= STUTTER_READ_RATE:
+            reasons.append('disk reads')
+        if switch_median and interval['involuntary_rate'] > STUTTER_SWITCH_FACTOR * switch_median:
+            reasons.append('preempted')
+        if cpu_p95 and interval['cpu'] > STUTTER_CPU_FACTOR * cpu_p95:
+            reasons.append('cpu spike')
+        if interval['planned'] > 0 and interval['late'] > LATE_FACTOR * interval['planned']:
+            reasons.append('sampler late')
+        if not reasons:
+            continue
+        # Aneinandergrenzende Intervalle zu einem Zeitraum zusammenfassen
+        if stutters and interval['start'] - stutters[-1]['end'] < 1e-6:
+            stutters[-1]['end'] = interval['end']
+            stutters[-1]['reasons'] = sorted(set(stutters[-1]['reasons']) | set(reasons))
+        else:
+            stutters.append({'start': interval['start'], 'end': interval['end'], 'reasons': reasons})
+
+    peak = max(samples, key=lambda sample: sample.rss)
+    return {
+        'samples': len(samples),
+        'duration_s': round(samples[-1].at - start, 1),
+        'peak_rss_mb': round(peak.rss / 1024 / 1024, 1),
+        'peak_rss_at_s': round(peak.at - start, 1),
+        'cpu_p50': round(_percentile(cpu, 50), 1),
+        'cpu_p95': round(cpu_p95, 1),
+        'cpu_p99': round(_percentile(cpu, 99), 1),
+        'cpu_max': round(max(cpu, default=0.0), 1),
+        'read_mb': round((samples[-1].read_bytes - samples[0].read_bytes) / 1024 / 1024, 1),
+        'write_mb': round((samples[-1].write_bytes - samples[0].write_bytes) / 1024 / 1024, 1),
+        'max_threads': max(sample.threads for sample in samples),
+        'context_switches': (samples[-1].voluntary + samples[-1].involuntary
+                             - samples[0].voluntary - samples[0].involuntary),
+        'stutters': [{'start_s': round(s['start'], 1), 'end_s': round(s['end'], 1), 'reasons': s['reasons']}
+                     for s in stutters],
+    }
+
+
+def _clock(seconds):
+    return f"{int(seconds // 60)}:{int(seconds % 60):02d}"
+
+
+def format_summary(report, limit=8):
+    if report.get('samples', 0) < 2:
+        return "The session was too short to record telemetry."
+    lines = [
+        f"Session: {report['duration_s'] / 60:.1f} min, {report['samples']} samples",
+        f"Peak memory: {report['peak_rss_mb']:.0f} MB (at {_clock(report['peak_rss_at_s'])})",
+        f"CPU: p50 {report['cpu_p50']:.0f}%, p95 {report['cpu_p95']:.0f}%, "
+        f"p99 {report['cpu_p99']:.0f}%, max {report['cpu_max']:.0f}%",
+        f"Disk: {report['read_mb']:.0f} MB read, {report['write_mb']:.0f} MB written; "
+        f"up to {report['max_threads']} threads",
+    ]
+    stutters = report['stutters']
+    if stutters:
+        lines.append(f"Possible stutters: {len(stutters)}")
+        for stutter in stutters[:limit]:
+            lines.append(f"  {_clock(stutter['start_s'])}-{_clock(stutter['end_s'])}: "
+                         f"{', '.join(stutter['reasons'])}")
+        if len(stutters) > limit:
+            lines.append(f"  ... and {len(stutters) - limit} more")
+    else:
+        lines.append("No stutter candidates")
+    if 'sampler_overhead_percent' in report:
+        lines.append(f"Sampler cost: {report['sampler_overhead_percent']:.3f}% of one core "
+                     f"(budget {report['sampler_budget_percent']}%)")
+    return "\n".join(lines)
+
+
+def save_summary(report):
+    path = cache_path('telemetry', time.strftime('%Y%m%d-%H%M%S') + '.json')
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    prune_summaries()
+    return path
+
+
+def prune_summaries(keep=MAX_SUMMARIES):
+    """Löscht alles bis auf die neuesten keep Zusammenfassungen (Dateinamen sind Zeitstempel)"""
+    directory = os.path.dirname(cache_path('telemetry', 'latest'))
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith('.json'))
+    except OSError:
+        return
+    for name in names[:-keep]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError as e:
+            logger.warning(f"Could not remove old session telemetry {name}: {str(e)}")
+
+
+def latest_summary():
+    """Letzte gespeicherte Zusammenfassung, auch aus einer früheren Launcher-Instanz"""
+    directory = os.path.dirname(cache_path('telemetry', 'latest'))
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith('.json'))
+        if not names:
+            return None
+        with open(os.path.join(directory, names[-1])) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def finish_session(sampler):
+    """Stoppt den Sampler, protokolliert und speichert die Zusammenfassung"""
+    sampler.stop()
+    report = sampler.summary()
+    log_event('telemetry.session', report.get('duration_s', 0) * 1000,
+              **{key: value for key, value in report.items() if key != 'stutters'},
+              stutters=len(report.get('stutters', [])))
+    try:
+        report['file'] = save_summary(report)
+    except OSError as e:
+        logger.warning(f"Could not save session telemetry: {str(e)}")
+    return report
@@ -1,5 +1,6 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 import requests
+from core.log import timed
 
 class PlayerCountThread(QThread):
     update_signal = pyqtSignal(str)
@@ -16,7 +17,9 @@ class PlayerCountThread(QThread):
             
     def fetch_player_count(self):
         try:
-            response = requests.get(self.api_url, timeout=5)
+            with timed('network.player_count', url=self.api_url) as event:
+                response = requests.get(self.api_url, timeout=5)
+                event['status'] = response.status_code
             if response.status_code == 200:
                 count = response.json().get('count', '--')
                 self.update_signal.emit(str(count))
@@ -0,0 +1,138 @@
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+TRACE_ENV = 'ETERNITYGLOW_TRACE'
+TRACE_FLAG = '--trace'
+
+logger = logging.getLogger(__name__)
+
+_events = None
+_trace_path = None
+_origin = time.perf_counter()
+_pid = os.getpid()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        _events.append({
+            'name': self.name,
+            'ph': 'X',
+            'ts': (self.start - _origin) * 1e6,
+            'dur': (end - self.start) * 1e6,
+            'pid': _pid,
+            'tid': threading.get_ident(),
+            'args': self.args,
+        })
+        return False
+
+
+def enable(path):
+    """Starts collecting spans; the trace is written to path on exit"""
+    global _events, _trace_path
+    if _events is None:
+        _events = []
+        atexit.register(write_trace)
+    _trace_path = path
+
+
+def is_enabled():
+    return _events is not None
+
+
+def configure(argv):
+    """Enables tracing from --trace[=path] or the ETERNITYGLOW_TRACE variable and strips the flag"""
+    target = os.environ.get(TRACE_ENV)
+    remaining = []
+    for arg in argv:
+        if arg == TRACE_FLAG:
+            target = target or '1'
+        elif arg.startswith(TRACE_FLAG + '='):
+            target = arg.split('=', 1)[1]
+        else:
+            remaining.append(arg)
+
+    if target:
+        if target == '1':
+            target = f"launcher_trace_{time.strftime('%Y%m%d-%H%M%S')}.json"
+        enable(target)
+    return remaining
+
+
+def span(name, **args):
+    """Context manager recording a complete event; a no-op when tracing is off"""
+    if _events is None:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name=None):
+    """Decorator form of span()"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _events is None:
+                return func(*args, **kwargs)
+            with _Span(label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def mark(name, **args):
+    """Records an instant event, e.g. the first paint"""
+    if _events is None:
+        return
+    _events.append({
+        'name': name,
+        'ph': 'i',
+        's': 'g',
+        'ts': (time.perf_counter() - _origin) * 1e6,
+        'pid': _pid,
+        'tid': threading.get_ident(),
+        'args': args,
+    })
+
+
+def write_trace():
+    """Writes the collected events as a Chrome trace_event file, once"""
+    global _trace_path
+    if not _events or not _trace_path:
+        return
+    path, _trace_path = _trace_path, None
+    try:
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': _events, 'displayTimeUnit': 'ms'}, f)
+        logger.info(f"Startup trace written to {path}")
+    except OSError as e:
+        logger.error(f"Writing trace failed: {str(e)}")
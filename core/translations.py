@@ -15,6 +15,8 @@ translations = {
         "force_fullscreen": "Force fullscreen mode",
         "disable_music": "Disable music (-nomusic)",
         "disable_videos": "Disable videos (-novideo)",
+        "session_telemetry": "Record session telemetry (CPU, memory, stutters)",
+        "live_presence": "Show map, mods and game status in Discord (reads osu! memory)",
         "osu_installation": "osu! Installation",
         "background_settings": "Background",
         "custom_background": "Custom background image",
@@ -33,7 +35,8 @@ translations = {
         "available": "is available",
         "download_question": "Would you like to download it now?",
         "download": "Download",
-        "later": "Later"
+        "later": "Later",
+        "tray_mode_checkbox": "Stay in the system tray between games"
     },
     "de": {
         "settings_title": "Einstellungen",
@@ -51,6 +54,8 @@ translations = {
         "force_fullscreen": "Vollbildmodus erzwingen",
         "disable_music": "Musik deaktivieren (-nomusic)",
         "disable_videos": "Videos deaktivieren (-novideo)",
+        "session_telemetry": "Sitzungs-Telemetrie aufzeichnen (CPU, Speicher, Ruckler)",
+        "live_presence": "Map, Mods und Spielstatus in Discord anzeigen (liest den Speicher von osu!)",
         "osu_installation": "osu!-Installation",
         "background_settings": "Hintergrund",
         "custom_background": "Benutzerdefiniertes Hintergrundbild",
@@ -69,6 +74,7 @@ translations = {
         "available": "ist verfügbar",
         "download_question": "Möchten Sie es jetzt herunterladen?",
         "download": "Herunterladen",
-        "later": "Später"
+        "later": "Später",
+        "tray_mode_checkbox": "Zwischen Spielen im Infobereich bleiben"
     }
 }
\ No newline at end of file
@@ -0,0 +1,30 @@
+from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
+
+
+class LauncherTray(QSystemTrayIcon):
+    """Tray icon that keeps the launcher process warm between games"""
+
+    def __init__(self, launcher):
+        super().__init__(launcher.windowIcon(), launcher)
+        self.launcher = launcher
+        self.setToolTip("EternityGlow Launcher")
+
+        self.menu = QMenu()
+        for label, server in [("Play on EternityGlow", 'eternityglow'), ("Play on Bancho", 'bancho')]:
+            action = self.menu.addAction(label)
+            action.triggered.connect(lambda _, s=server: self.launcher.play(s))
+        self.menu.addSeparator()
+        self.menu.addAction("Open launcher").triggered.connect(lambda: self.launcher.handle_command(['show']))
+        self.menu.addAction("Exit").triggered.connect(self.launcher.close)
+        self.setContextMenu(self.menu)
+
+        self.activated.connect(self.on_activated)
+
+    def on_activated(self, reason):
+        if reason in (QSystemTrayIcon.ActivationReason.Trigger, QSystemTrayIcon.ActivationReason.DoubleClick):
+            self.launcher.handle_command(['show'])
+
+    def set_playing(self, playing):
+        for action in self.menu.actions()[:2]:
+            action.setEnabled(not playing)
+        self.setToolTip("EternityGlow Launcher - osu! running" if playing else "EternityGlow Launcher")
@@ -0,0 +1,82 @@
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from core.log import log_event
+
+logger = logging.getLogger(__name__)
+
+
+class StallWatchdog(threading.Thread):
+    """Watches heartbeats from the GUI thread and records the main thread's stack when they stop"""
+
+    def __init__(self, threshold_ms=500):
+        super().__init__(name='StallWatchdog', daemon=True)
+        self.threshold = threshold_ms / 1000
+        self.main_thread_id = threading.main_thread().ident
+        self.last_beat = time.monotonic()
+        self.stall_started = None
+        self.stall_stack = None
+        self.stall_count = 0
+        self.total_stall_ms = 0.0
+        self.longest_stall_ms = 0.0
+        self._active = threading.Event()
+        self._active.set()
+        self._stop_event = threading.Event()
+
+    def beat(self):
+        self.last_beat = time.monotonic()
+
+    def pause(self):
+        # Blockiert den Thread komplett, damit im Tray keine Wakeups anfallen
+        self._active.clear()
+
+    def resume(self):
+        self.last_beat = time.monotonic()
+        self.stall_started = None
+        self._active.set()
+
+    def run(self):
+        interval = self.threshold / 2
+        while not self._stop_event.wait(interval):
+            if not self._active.is_set():
+                self._active.wait()
+                continue
+            last_beat = self.last_beat
+            if self.stall_started is None:
+                if time.monotonic() - last_beat > self.threshold:
+                    self.stall_started = last_beat
+                    self.capture_stack()
+            elif last_beat > self.stall_started:
+                self.finish_stall(last_beat - self.stall_started)
+
+    def capture_stack(self):
+        frame = sys._current_frames().get(self.main_thread_id)
+        self.stall_stack = ''.join(traceback.format_stack(frame)) if frame else ''
+        logger.warning(
+            f"GUI thread unresponsive for more than {self.threshold * 1000:.0f} ms, main thread stack:\n"
+            f"{self.stall_stack}")
+
+    def finish_stall(self, duration):
+        duration_ms = duration * 1000
+        self.stall_count += 1
+        self.total_stall_ms += duration_ms
+        self.longest_stall_ms = max(self.longest_stall_ms, duration_ms)
+        logger.warning(f"GUI thread stalled for {duration_ms:.0f} ms")
+        log_event('watchdog.stall', duration_ms, stack=self.stall_stack)
+        self.stall_started = None
+        self.stall_stack = None
+
+    def stats(self):
+        return {
+            'stalls': self.stall_count,
+            'total_stall_ms': round(self.total_stall_ms, 1),
+            'longest_stall_ms': round(self.longest_stall_ms, 1),
+        }
+
+    def stop(self):
+        self._stop_event.set()
+        self._active.set()
+        log_event('watchdog.session', **self.stats())
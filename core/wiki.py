@@ -0,0 +1,445 @@
+import asyncio
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from PyQt6.QtCore import Qt, QUrl, pyqtSignal
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
+    QLabel, QListWidget, QListWidgetItem, QTextBrowser, QSplitter
+)
+
+from core.log import log_event, timed
+from core.scheduler import get_scheduler
+from utils.helpers import cache_path
+
+logger = logging.getLogger(__name__)
+
+MAX_PAGES = 2000
+# Erhöhen, wenn sich ändert, was in den Suchindex kommt; der nächste Sync baut ihn neu auf
+INDEX_VERSION = 2
+SYNC_INTERVAL_MS = 6 * 60 * 60 * 1000
+SEARCH_LIMIT = 50
+
+# Wiki.js: Editor, Verlauf, Quelltext, Admin usw. gehören nicht in den Spiegel
+SKIP_PREFIXES = ('/e/', '/h/', '/s/', '/i/', '/t/', '/a/', '/login', '/logout', '/register',
+                 '/_assets/', '/graphql', '/favicons/')
+SKIP_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico', '.pdf', '.zip', '.css', '.js')
+
+# Wiki.js rendert den Seiteninhalt serverseitig in dieses Template
+CONTENT_PATTERN = re.compile(r'<template slot="contents">(.*?)</template>', re.S)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    links TEXT NOT NULL,
+    fetched REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def has_fts5():
+    try:
+        with sqlite3.connect(':memory:') as db:
+            db.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class _PageParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ''
+        self.links = []
+        self.text = []
+        self._skip = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style', 'noscript'):
+            self._skip += 1
+        elif tag == 'title':
+            self._in_title = True
+        elif tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href)
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style', 'noscript') and self._skip:
+            self._skip -= 1
+        elif tag == 'title':
+            self._in_title = False
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif not self._skip:
+            self.text.append(data)
+
+
+def parse_page(body):
+    parser = _PageParser()
+    parser.feed(body)
+    text = ' '.join(' '.join(parser.text).split())
+    return parser.title.strip(), text, parser.links
+
+
+def page_text(page_html):
+    """Suchtext nur aus dem Seiteninhalt; Navigation und Kopf wiederholen sich auf jeder Seite"""
+    return parse_page(render_html(page_html))[1]
+
+
+def normalize(base, href, host):
+    """Absolute URL ohne Fragment/Query, nur für Seiten desselben Wikis"""
+    parts = urlsplit(urljoin(base, href))
+    if parts.scheme not in ('http', 'https') or parts.netloc != host:
+        return None
+    path = parts.path or '/'
+    if path.startswith(SKIP_PREFIXES) or path.lower().endswith(SKIP_EXTENSIONS):
+        return None
+    return urlunsplit((parts.scheme, parts.netloc, path.rstrip('/') or '/', '', ''))
+
+
+def fts_query(text):
+    """Nutzereingabe als Präfixsuche über alle Wörter, ohne FTS5-Syntax durchzureichen"""
+    words = re.findall(r'\w+', text)
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+class WikiMirror:
+    """Lokaler Wiki-Spiegel: Inhalte nach SHA-256 abgelegt, Suche über SQLite FTS5"""
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.path.dirname(cache_path('wiki', 'index.sqlite'))
+        self.objects = os.path.join(self.directory, 'objects')
+        self.db_path = os.path.join(self.directory, 'index.sqlite')
+        self.fts = has_fts5()
+        self.sync_lock = threading.Lock()
+        self._local = threading.local()
+        with self._connect() as db:
+            db.executescript(SCHEMA)
+            if self.fts:
+                db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5("
+                           "url UNINDEXED, title, body, tokenize='unicode61 remove_diacritics 2')")
+            else:
+                db.execute("CREATE TABLE IF NOT EXISTS search (url TEXT PRIMARY KEY, title TEXT, body TEXT)")
+
+    def _connect(self):
+        # Eine Verbindung pro Thread; WAL erlaubt Suchen, während der Sync schreibt
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.db_path)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _object_path(self, sha):
+        return os.path.join(self.objects, sha[:2], sha)
+
+    def _store_object(self, body):
+        sha = hashlib.sha256(body).hexdigest()
+        path = self._object_path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(body)
+            os.replace(path + '.tmp', path)
+        return sha
+
+    def page_count(self):
+        return self._connect().execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def last_sync(self):
+        row = self._connect().execute("SELECT value FROM meta WHERE key = 'last_sync'").fetchone()
+        return float(row[0]) if row else None
+
+    def load(self, url):
+        """Titel und gespeichertes HTML einer Seite, ohne Netzwerk"""
+        row = self._connect().execute("SELECT title, sha FROM pages WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        try:
+            with open(self._object_path(row[1]), 'rb') as f:
+                return row[0], f.read().decode('utf-8', errors='replace')
+        except FileNotFoundError:
+            return None
+
+    def search(self, text, limit=SEARCH_LIMIT):
+        db = self._connect()
+        if self.fts:
+            query = fts_query(text)
+            if not query:
+                return []
+            return db.execute(
+                "SELECT url, title, snippet(search, 2, '<b>', '</b>', '…', 12) FROM search "
+                "WHERE search MATCH ? ORDER BY bm25(search, 0, 10.0, 1.0) LIMIT ?",
+                (query, limit)).fetchall()
+        pattern = f"%{text.strip()}%"
+        rows = db.execute("SELECT url, title, substr(body, 1, 160) FROM search "
+                          "WHERE title LIKE ? OR body LIKE ? LIMIT ?", (pattern, pattern, limit)).fetchall()
+        return [(url, title, html.escape(snippet)) for url, title, snippet in rows]
+
+    def sync(self, start_url, max_pages=MAX_PAGES, session=None):
+        """Crawlt das Wiki ab start_url; unveränderte Seiten kosten nur eine bedingte Anfrage"""
+        if not self.sync_lock.acquire(blocking=False):
+            return None
+        try:
+            return self._sync(start_url, max_pages, session)
+        finally:
+            self.sync_lock.release()
+
+    def _sync(self, start_url, max_pages, session):
+        import requests
+        session = session or requests.Session()
+        db = self._connect()
+        known = {row[0]: row[1:] for row in db.execute(
+            "SELECT url, etag, last_modified, links, sha FROM pages")}
+        host = urlsplit(start_url).netloc
+        start = normalize(start_url, start_url, host)
+        queue, seen = deque([start]), {start}
+        stats = {'fetched': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+        started = time.perf_counter()
+        self._upgrade_index(db)
+
+        while queue:
+            url = queue.popleft()
+            headers = {}
+            if url in known:
+                etag, last_modified = known[url][:2]
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            try:
+                response = session.get(url, headers=headers, timeout=15)
+            except requests.RequestException:
+                response = None
+
+            if response is None:
+                # Bekannte Links trotzdem verfolgen, sonst gälten ihre Seiten als nicht mehr verlinkt
+                stats['failed'] += 1
+                links = json.loads(known[url][2]) if url in known else []
+            elif response.status_code == 304 and url in known:
+                stats['unchanged'] += 1
+                links = json.loads(known[url][2])
+            elif response.status_code == 200 and 'html' in response.headers.get('Content-Type', ''):
+                stats['fetched'] += 1
+                links = self._store_page(db, url, response)
+            elif response.status_code in (404, 410) and url in known:
+                stats['removed'] += 1
+                db.execute("DELETE FROM pages WHERE url = ?", (url,))
+                db.execute("DELETE FROM search WHERE url = ?", (url,))
+                continue
+            else:
+                stats['failed'] += 1
+                links = json.loads(known[url][2]) if url in known else []
+
+            for href in links:
+                link = normalize(url, href, host)
+                if link and link not in seen and len(seen) < max_pages:
+                    seen.add(link)
+                    queue.append(link)
+
+        # Von keiner erreichten Seite mehr verlinkt; bei abgeschnittenem Crawl ist das nicht sicher
+        if len(seen) < max_pages:
+            for url in known.keys() - seen:
+                stats['removed'] += 1
+                db.execute("DELETE FROM pages WHERE url = ?", (url,))
+                db.execute("DELETE FROM search WHERE url = ?", (url,))
+        db.execute("INSERT OR REPLACE INTO meta VALUES ('last_sync', ?)", (str(time.time()),))
+        db.commit()
+        stats['pruned'] = self._prune_objects(db)
+        stats['pages'] = self.page_count()
+        log_event('wiki.sync', (time.perf_counter() - started) * 1000, **stats)
+        return stats
+
+    def _store_page(self, db, url, response):
+        body = response.content
+        sha = self._store_object(body)
+        page_html = body.decode(response.encoding or 'utf-8', errors='replace')
+        # Titel und Links aus der ganzen Seite, der Suchtext nur aus dem Inhalt
+        title, _, links = parse_page(page_html)
+        text = page_text(page_html)
+        db.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)", (
+            url, title or url, sha, response.headers.get('ETag'),
+            response.headers.get('Last-Modified'), json.dumps(links), time.time()))
+        db.execute("DELETE FROM search WHERE url = ?", (url,))
+        db.execute("INSERT INTO search (url, title, body) VALUES (?, ?, ?)", (url, title, text))
+        db.commit()
+        return links
+
+    def _upgrade_index(self, db):
+        """Baut den Suchindex aus den gespeicherten Seiten neu auf, wenn er älter als INDEX_VERSION ist"""
+        row = db.execute("SELECT value FROM meta WHERE key = 'index_version'").fetchone()
+        if row and int(row[0]) >= INDEX_VERSION:
+            return
+        db.execute("DELETE FROM search")
+        for url, title, sha in db.execute("SELECT url, title, sha FROM pages").fetchall():
+            try:
+                with open(self._object_path(sha), 'rb') as f:
+                    text = page_text(f.read().decode('utf-8', errors='replace'))
+            except FileNotFoundError:
+                continue
+            db.execute("INSERT INTO search (url, title, body) VALUES (?, ?, ?)", (url, title, text))
+        db.execute("INSERT OR REPLACE INTO meta VALUES ('index_version', ?)", (str(INDEX_VERSION),))
+        db.commit()
+
+    def _prune_objects(self, db):
+        """Entfernt Objekte, auf die keine Seite mehr zeigt"""
+        referenced = {row[0] for row in db.execute("SELECT sha FROM pages")}
+        pruned = 0
+        if not os.path.isdir(self.objects):
+            return pruned
+        for prefix in os.listdir(self.objects):
+            for name in os.listdir(os.path.join(self.objects, prefix)):
+                if name not in referenced:
+                    os.remove(os.path.join(self.objects, prefix, name))
+                    pruned += 1
+        return pruned
+
+
+def schedule_sync(mirror, start_url, first_delay_ms, on_result=None):
+    """Regelmäßiger Sync im asyncio-Thread des Schedulers; pausiert mit der Gruppe 'network'"""
+    async def sync():
+        return await asyncio.to_thread(mirror.sync, start_url)
+    get_scheduler().every('wiki.sync', SYNC_INTERVAL_MS, sync, group='network', jitter=0.1,
+                          first_delay_ms=first_delay_ms, on_result=on_result)
+
+
+def render_html(page_html):
+    """Nur der eigentliche Seiteninhalt, QTextBrowser kann mit dem SPA-Gerüst nichts anfangen"""
+    match = CONTENT_PATTERN.search(page_html)
+    return match.group(1) if match else page_html
+
+
+class WikiPage(QWidget):
+    """Wiki aus dem lokalen Spiegel: Suche und Anzeige ohne Netzwerk"""
+    back_requested = pyqtSignal()
+    open_online = pyqtSignal(str)
+
+    def __init__(self, start_url, mirror=None, parent=None):
+        super().__init__(parent)
+        self.setObjectName("WikiPage")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
+        self.start_url = start_url
+        self.current_url = None
+        self.showing_page = False
+        self.mirror = mirror or WikiMirror()
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        header = QHBoxLayout()
+        back_btn = QPushButton("Back to Launcher")
+        back_btn.clicked.connect(self.back_requested.emit)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search the wiki")
+        self.search_edit.textChanged.connect(self.search)
+        online_btn = QPushButton("Open online")
+        online_btn.clicked.connect(lambda: self.open_online.emit(self.current_url or self.start_url))
+        self.status_label = QLabel()
+        header.addWidget(back_btn)
+        header.addWidget(self.search_edit, 1)
+        header.addWidget(online_btn)
+
+        self.results = QListWidget()
+        self.results.itemActivated.connect(lambda item: self.show_page(item.data(Qt.ItemDataRole.UserRole)))
+        self.results.itemClicked.connect(lambda item: self.show_page(item.data(Qt.ItemDataRole.UserRole)))
+        self.browser = QTextBrowser()
+        self.browser.setOpenLinks(False)
+        self.browser.anchorClicked.connect(self.follow_link)
+
+        splitter = QSplitter()
+        splitter.addWidget(self.results)
+        splitter.addWidget(self.browser)
+        splitter.setSizes([300, 900])
+
+        layout.addLayout(header)
+        layout.addWidget(splitter)
+        layout.addWidget(self.status_label)
+        self.setStyleSheet("""
+            QWidget#WikiPage { background: rgba(0,0,0,150); }
+            QLabel { color: white; }
+            QListWidget, QTextBrowser, QLineEdit {
+                background: rgba(0,0,0,170);
+                color: white;
+                border: 1px solid rgba(255,102,170,80);
+                border-radius: 5px;
+                padding: 4px;
+            }
+            QPushButton {
+                background: rgba(0,0,0,180);
+                color: white;
+                border: 2px solid #ff66aa;
+                border-radius: 8px;
+                padding: 6px 12px;
+            }
+            QPushButton:hover {
+                background: rgba(255,102,170,150);
+                border-color: white;
+            }
+        """)
+
+    def activate(self):
+        if self.current_url is None:
+            self.show_page(normalize(self.start_url, self.start_url, urlsplit(self.start_url).netloc))
+        self.update_status()
+
+    def sync_finished(self, stats):
+        self.update_status()
+        if self.current_url and self.mirror.load(self.current_url) is not None and not self.showing_page:
+            self.show_page(self.current_url)
+
+    def update_status(self):
+        last = self.mirror.last_sync()
+        synced = time.strftime('%Y-%m-%d %H:%M', time.localtime(last)) if last else "never"
+        running = " (syncing...)" if self.mirror.sync_lock.locked() else ""
+        self.status_label.setText(f"{self.mirror.page_count()} pages offline, last sync {synced}{running}")
+
+    def search(self, text):
+        with timed('wiki.search') as event:
+            rows = self.mirror.search(text) if text.strip() else []
+            event['results'] = len(rows)
+        self.results.clear()
+        for url, title, snippet in rows:
+            item = QListWidgetItem(title)
+            item.setData(Qt.ItemDataRole.UserRole, url)
+            item.setToolTip(snippet)
+            self.results.addItem(item)
+
+    def show_page(self, url):
+        self.current_url = url
+        page = self.mirror.load(url)
+        self.showing_page = page is not None
+        if page is None:
+            self.browser.setHtml("<p>This page is not available offline yet.</p>")
+            return
+        title, page_html = page
+        self.browser.setHtml(f"<h1>{html.escape(title)}</h1>{render_html(page_html)}")
+        self.browser.document().setBaseUrl(QUrl(url))
+
+    def follow_link(self, qurl):
+        url = urljoin(self.current_url or self.start_url, qurl.toString())
+        link = normalize(url, url, urlsplit(self.start_url).netloc)
+        if link and self.mirror.load(link) is not None:
+            self.show_page(link)
+        else:
+            self.open_online.emit(url)
@@ -1,15 +1,73 @@
+import multiprocessing
 import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QFont
-from core.launcher import Launcher
+import time
+from core import tracing
+from core.log import setup_logging, log_event
+from core.single_instance import InstanceServer, forward_command
+
+COMMANDS = ('show', 'play', 'leaderboard', 'wiki', 'settings', 'download', 'recent')
+
+def parse_command(argv):
+    """Trennt einen Launcher-Befehl (z.B. "play bancho") von den restlichen Argumenten"""
+    if len(argv) > 1 and argv[1] in COMMANDS:
+        end = 2
+        while end < len(argv) and not argv[end].startswith('-'):
+            end += 1
+        return argv[1:end], [argv[0], *argv[end:]]
+    return ['show'], argv
 
 def main():
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    app.setFont(QFont("Segoe UI", 10))
+    started = time.perf_counter()
+    if len(sys.argv) > 1 and sys.argv[1] == 'launch':
+        # Schneller Pfad ohne GUI: kein PyQt, kein Launcher-Fenster
+        from core.cli import run_launch
+        sys.exit(run_launch(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'verify':
+        from core.cli import run_verify
+        sys.exit(run_verify(sys.argv[2:]))
+
+    argv = tracing.configure(sys.argv)
+    command, argv = parse_command(argv)
+
+    # Läuft bereits ein Launcher, nur den Befehl weiterreichen und sofort beenden
+    if forward_command(command):
+        return
+    pending = [command]
+    instance_server = InstanceServer(pending.append)
+    if not instance_server.start() and forward_command(command):
+        return
+
+    show_diagnostics = '--diagnostics' in argv
+    if show_diagnostics:
+        argv.remove('--diagnostics')
+    setup_logging()
+
+    with tracing.span('import PyQt6'):
+        from PyQt6.QtCore import Qt, QCoreApplication
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtGui import QFont
+    with tracing.span('import core.launcher'):
+        from core.launcher import Launcher
+
+    with tracing.span('QApplication'):
+        # Erlaubt es, QtWebEngine erst beim ersten Web-Tab zu importieren
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+        app = QApplication(argv)
+        app.setStyle("Fusion")
+        app.setFont(QFont("Segoe UI", 10))
     
-    window = Launcher()  # noqa: F841
+    window = Launcher()
+    window.instance_server = instance_server
+    instance_server.on_command = window.command_received.emit
+    log_event('startup.window_ready', (time.perf_counter() - started) * 1000)
+    for queued in pending:
+        if queued != ['show']:
+            window.handle_command(queued)
+    if show_diagnostics:
+        window.show_diagnostics()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Die Hash-Worker der Integritätsprüfung starten in der gepackten .exe sonst den Launcher neu
+    multiprocessing.freeze_support()
+    main()
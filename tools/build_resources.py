@@ -0,0 +1,63 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.resources import BUNDLE_NAME, HEADER, MAGIC, VERSION, ALIGN  # noqa: E402
+
+# Nur für die README, wird vom Launcher nicht geladen
+EXCLUDE = {'screenshot.png'}
+
+
+def collect(source_dir):
+    for dirpath, _, filenames in os.walk(source_dir):
+        for filename in sorted(filenames):
+            if filename in EXCLUDE:
+                continue
+            path = os.path.join(dirpath, filename)
+            yield os.path.relpath(path, source_dir).replace(os.sep, '/'), path
+
+
+def build(source_dir, output):
+    blobs = [(name, open(path, 'rb').read()) for name, path in collect(source_dir)]
+
+    # Offsets hängen von der Indexgröße ab, deshalb erst mit Platzhaltern messen
+    index = {name: [0, len(data), hashlib.sha1(data).hexdigest()] for name, data in blobs}
+    while True:
+        index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+        offset = HEADER.size + len(index_bytes)
+        changed = False
+        for name, data in blobs:
+            offset += -offset % ALIGN
+            if index[name][0] != offset:
+                index[name][0] = offset
+                changed = True
+            offset += len(data)
+        if not changed:
+            break
+
+    with open(output + '.tmp', 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for name, data in blobs:
+            f.write(b'\0' * (index[name][0] - f.tell()))
+            f.write(data)
+    os.replace(output + '.tmp', output)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack resources/ into a single indexed bundle")
+    parser.add_argument('--source', default=os.path.join(ROOT, 'resources'))
+    parser.add_argument('--output', default=os.path.join(ROOT, BUNDLE_NAME))
+    args = parser.parse_args()
+    index = build(args.source, args.output)
+    print(f"{len(index)} resources written to {args.output} ({os.path.getsize(args.output)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
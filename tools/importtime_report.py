@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(ROOT, 'benchmarks', 'import_budget.json')
+
+# "import time:       self [us] |  cumulative | imported package"
+LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure(module):
+    """Importiert module in einem frischen Interpreter und liefert {name: (self_us, cumulative_us, depth)}"""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports[name] = (int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+    return imports
+
+
+def report(imports, top):
+    lines = [f"{'self ms':>9} {'total ms':>9}  module"]
+    ranked = sorted(imports.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us, depth) in ranked[:top]:
+        lines.append(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {'  ' * depth}{name}")
+    return "\n".join(lines)
+
+
+def check(budget, runs=None):
+    """Prüft Importzeit und verzögerte Module gegen das Budget, gibt die Verstöße zurück"""
+    module = budget['module']
+    samples, imports = [], {}
+    for _ in range(runs or budget.get('runs', 3)):
+        imports = measure(module)
+        samples.append(imports[module][1] / 1000)
+    median_ms = statistics.median(samples)
+
+    problems = []
+    if median_ms > budget['budget_ms']:
+        problems.append(f"import {module} took {median_ms:.1f} ms (budget {budget['budget_ms']} ms)")
+    for name in budget.get('deferred', []):
+        if name in imports:
+            problems.append(f"{name} is imported eagerly by {module}, it should load lazily")
+    return median_ms, imports, problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Break down -X importtime for a launcher module")
+    parser.add_argument('--module', help="module to import (default: from the budget file)")
+    parser.add_argument('--budget', default=BUDGET_FILE)
+    parser.add_argument('--top', type=int, default=25)
+    parser.add_argument('--runs', type=int)
+    parser.add_argument('--check', action='store_true', help="exit non-zero when the budget is exceeded")
+    args = parser.parse_args(argv)
+
+    with open(args.budget) as f:
+        budget = json.load(f)
+    if args.module:
+        budget['module'] = args.module
+
+    median_ms, imports, problems = check(budget, args.runs)
+    print(report(imports, args.top))
+    print(f"\nimport {budget['module']}: {median_ms:.1f} ms (median, budget {budget['budget_ms']} ms)")
+    for problem in problems:
+        print(f"OVER BUDGET {problem}")
+    return 1 if args.check and problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,9 @@ import requests
 from requests.exceptions import RequestException
 from config import GITHUB_TOKEN, REPO
 import logging
+import os
+
+GITHUB_API = os.environ.get('ETERNITYGLOW_GITHUB_API', 'https://api.github.com')
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +13,7 @@ def check_update(current_version: str) -> str | None:
         "Authorization": f"token {GITHUB_TOKEN}",
         "Accept": "application/vnd.github.v3+json"
     }
-    url = f"https://api.github.com/repos/{REPO}/releases/latest"
+    url = f"{GITHUB_API}/repos/{REPO}/releases/latest"
     
     try:
         response = requests.get(url, headers=headers, timeout=10)
@@ -7,4 +7,17 @@ def resource_path(relative_path):
         base_path = sys._MEIPASS
     except Exception:
         base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
\ No newline at end of file
+    return os.path.join(base_path, relative_path)
+
+def app_dir():
+    """Directory of the launcher itself (next to the exe when frozen), independent of the working directory"""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def cache_path(*parts):
+    """Path inside the launcher's cache directory, created on demand"""
+    root = os.environ.get('ETERNITYGLOW_CACHE_DIR') or os.path.join(app_dir(), "cache")
+    path = os.path.join(root, *parts)
+    os.makedirs(os.path.dirname(path) if parts else path, exist_ok=True)
+    return path
@@ -1,4 +1,5 @@
 import ctypes
+import os
 import platform  # Neu hinzufügen
 
 def optimize_gpu():
@@ -22,4 +23,41 @@ def optimize_timer():
         winmm = ctypes.WinDLL('winmm')
         winmm.timeBeginPeriod(1)
     except Exception as e:
-        print(f"Timer optimization failed: {str(e)}")
\ No newline at end of file
+        print(f"Timer optimization failed: {str(e)}")
+
+STANDARD_OSU_PATHS = [
+    "~/AppData/Local/osu!/osu!.exe",
+    "C:/Program Files/osu!/osu!.exe",
+    "C:/Program Files (x86)/osu!/osu!.exe"
+]
+
+def find_osu_executable(settings):
+    """Configured path first, then the standard install locations"""
+    configured = settings.get('osu', {}).get('path', '')
+    candidates = [configured] if configured else []
+    candidates += [os.path.expanduser(path) for path in STANDARD_OSU_PATHS]
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return None
+
+def build_osu_args(osu_path, settings, server=None):
+    """Argument list for osu!, shared by the launcher window and the command line"""
+    osu_settings = settings.get('osu', {})
+    server = (server or osu_settings.get('server', 'bancho')).lower()
+
+    params = [osu_path]
+    if server == "eternityglow":
+        params.extend(["-devserver", "eternityglow.de"])
+
+    if osu_settings.get('nomusic', False):
+        params.append("-nomusic")
+    if osu_settings.get('novideo', False):
+        params.append("-novideo")
+
+    params.append("-legacytablet")
+    if osu_settings.get('force_fullscreen', True):
+        params.append("-fullscreen")
+    else:
+        params.append("-window")
+    return params